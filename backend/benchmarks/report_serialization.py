@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Serialization cost of a HealthReport with a large task_distribution.
+
+Compares FastAPI's response_model path (validate, jsonable_encoder, json.dumps),
+pydantic's model_dump_json, and the orjson fast path used for cached reports.
+
+    python benchmarks/report_serialization.py --assignees 10 1000 10000
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from health_calculator import HealthCalculator  # noqa: E402
+from mock_data import generate_mock_project  # noqa: E402
+from models import HealthReport  # noqa: E402
+from serialization import dump_model  # noqa: E402
+
+
+def make_report(assignees: int) -> HealthReport:
+    """A mock project's report with ``assignees`` entries in its task distribution."""
+    project = generate_mock_project()
+    calculator = HealthCalculator()
+    health_score = calculator.calculate_health_score(project)
+    risks = calculator.detect_risks(project, health_score)
+    for dimension in health_score.dimensions:
+        distribution = dimension.details.get("task_distribution")
+        if distribution:
+            template = next(iter(distribution.values()))
+            dimension.details["task_distribution"] = {f"member_{i}": dict(template) for i in range(assignees)}
+    return HealthReport(
+        project_id=project.id,
+        project_name=project.name,
+        health_score=health_score,
+        risks=risks,
+        recommendations=[],
+        generated_at=datetime.now()
+    )
+
+
+def response_model_path(report: HealthReport) -> bytes:
+    # What FastAPI does for a returned model with response_model=HealthReport
+    validated = HealthReport.model_validate(report.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assignees", type=int, nargs="+", default=[10, 1000, 10000])
+    args = parser.parse_args()
+
+    results = []
+    for assignees in args.assignees:
+        report = make_report(assignees)
+        body = dump_model(report)
+        assert json.loads(body) == json.loads(report.model_dump_json())
+        response_model_ms = best_of(lambda: response_model_path(report)) * 1000
+        fast_ms = best_of(lambda: dump_model(report)) * 1000
+        results.append({
+            "assignees": assignees,
+            "body_kb": round(len(body) / 1024, 1),
+            "response_model_ms": round(response_model_ms, 3),
+            "model_dump_json_ms": round(best_of(report.model_dump_json) * 1000, 3),
+            "fast_path_ms": round(fast_ms, 3),
+            "speedup": round(response_model_ms / fast_ms, 1),
+        })
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
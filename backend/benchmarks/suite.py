@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the scoring and reporting hot paths. Runs offline: the
+OpenAI key is cleared so AI calls take the keyword and template fallbacks,
+and SQLite stores go to a temporary directory.
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --sizes 10 1000 --baseline results.json --threshold 0.25
+
+Each benchmark is timed over several rounds after a warm-up call; results
+are keyed by name and project size (tasks). With --baseline, any benchmark
+whose median is more than --threshold slower than the baseline's fails the run.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Offline and side-effect free: set before the backend reads its configuration
+_TMP_DIR = tempfile.mkdtemp(prefix="health-bench-")
+os.environ["OPENAI_API_KEY"] = ""
+os.environ["PRECOMPUTE_ENABLED"] = "false"
+os.environ["SCORE_HISTORY_DB"] = os.path.join(_TMP_DIR, "score_history.db")
+os.environ["REPORT_STORE_DB"] = os.path.join(_TMP_DIR, "health_reports.db")
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_service import BaseAIService  # noqa: E402
+from bulk_loader import write_jsonl  # noqa: E402
+from health_calculator import HealthCalculator  # noqa: E402
+from mock_data import COMMENTS, MESSAGES, WorkloadSpec, generate_synthetic_project  # noqa: E402
+from models import Project  # noqa: E402
+
+DEFAULT_SIZES = [10, 1000, 100000]
+
+RECOMMENDATION_TEXT = """Here are my recommendations:
+1. Unblock critical tasks - Pair on the blocked payment bug and escalate the vendor dependency (Priority: high, Category: delivery)
+2. Rebalance workload - Move two in-progress tasks from the busiest engineer to teammates (Priority: high, Category: workload)
+3. Triage aging backlog - Close or re-scope todo items untouched for three weeks (Priority: medium, Category: momentum)
+4. Client check-in - Schedule a call to address the negative feedback on login (Priority: medium, Category: sentiment)
+5. Add regression tests - Cover the reopened tasks before the next release (Priority: low, Category: risk)
+"""
+
+
+class Benchmark:
+    __slots__ = ("name", "fn", "sized")
+
+    def __init__(self, name: str, fn: Callable, sized: bool):
+        self.name = name
+        self.fn = fn
+        self.sized = sized
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, sized: bool = True):
+    """Register ``fn(context)`` (or ``fn(context, project)`` when sized) as a benchmark."""
+    def register(fn):
+        BENCHMARKS.append(Benchmark(name, fn, sized))
+        return fn
+    return register
+
+
+def measure(fn: Callable, min_rounds: int = 3, max_rounds: int = 100, budget_seconds: float = 1.0) -> dict:
+    """Time ``fn`` after one warm-up call, for at least ``min_rounds`` rounds or until the budget is spent."""
+    fn()
+    times = []
+    started = time.perf_counter()
+    while len(times) < max_rounds and (len(times) < min_rounds or time.perf_counter() - started < budget_seconds):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {
+        "rounds": len(times),
+        "min_ms": round(min(times) * 1000, 4),
+        "median_ms": round(statistics.median(times) * 1000, 4),
+        "max_ms": round(max(times) * 1000, 4),
+    }
+
+
+class Context:
+    """Shared fixtures: one synthetic project per size and an in-process client for the API."""
+
+    def __init__(self, sizes: List[int], seed: int):
+        self.calculator = HealthCalculator()
+        self.ai = BaseAIService()
+        self.now = datetime.now()
+        spec = WorkloadSpec(seed=seed, team_size=8, communications_per_project=50)
+        self.projects: Dict[int, Project] = {}
+        self.health_scores = {}
+        for index, size in enumerate(sizes):
+            spec.tasks_per_project = size
+            project = generate_synthetic_project(spec, index, self.now)
+            self.projects[size] = project
+            self.health_scores[project.id] = self.calculator.calculate_health_score(project)
+        self.health_score = self.health_scores[self.projects[sizes[0]].id]
+        self.texts = [text for pool in (COMMENTS, MESSAGES) for texts in pool.values() for text in texts]
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from fastapi.testclient import TestClient
+            import server
+
+            path = os.path.join(_TMP_DIR, "projects.jsonl")
+            write_jsonl(self.projects.values(), path)
+            server.data_adapter.load_file(path)
+            self._client = TestClient(server.app)
+            self._client.__enter__()
+        return self._client
+
+    def get(self, url: str, **params) -> None:
+        response = self.client.get(url, params=params)
+        # A fast error response would pass for a speedup
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}")
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.__exit__(None, None, None)
+
+
+# Scoring
+
+@benchmark("calculate_delivery_health")
+def bench_delivery(ctx, project):
+    ctx.calculator._calculate_delivery_health(project)
+
+
+@benchmark("calculate_workload_balance")
+def bench_workload(ctx, project):
+    ctx.calculator._calculate_workload_balance(project)
+
+
+@benchmark("calculate_communication_sentiment")
+def bench_sentiment(ctx, project):
+    ctx.calculator._calculate_communication_sentiment(project)
+
+
+@benchmark("calculate_risk_signals")
+def bench_risk_signals(ctx, project):
+    ctx.calculator._calculate_risk_signals(project)
+
+
+@benchmark("calculate_momentum_trend")
+def bench_momentum(ctx, project):
+    ctx.calculator._calculate_momentum_trend(project, 70.0)
+
+
+@benchmark("calculate_health_score")
+def bench_health_score(ctx, project):
+    ctx.calculator.calculate_health_score(project, 70.0)
+
+
+@benchmark("detect_risks")
+def bench_detect_risks(ctx, project):
+    ctx.calculator.detect_risks(project, ctx.health_scores[project.id])
+
+
+# AI fallbacks and parsing
+
+@benchmark("fallback_sentiment_x1000", sized=False)
+def bench_fallback_sentiment(ctx):
+    texts = ctx.texts
+    for i in range(1000):
+        ctx.ai._fallback_sentiment(texts[i % len(texts)])
+
+
+@benchmark("parse_recommendations", sized=False)
+def bench_parse_recommendations(ctx):
+    ctx.ai._parse_recommendations(RECOMMENDATION_TEXT, ctx.health_score)
+
+
+# API, through an in-process client
+
+@benchmark("GET /api/projects/{id}/health?fresh=true")
+def bench_health_fresh(ctx, project):
+    ctx.get(f"/api/projects/{project.id}/health", fresh="true")
+
+
+@benchmark("GET /api/projects/{id}/health (cached)")
+def bench_health_cached(ctx, project):
+    ctx.get(f"/api/projects/{project.id}/health")
+
+
+@benchmark("GET /api/projects/{id}/health/score")
+def bench_health_score_endpoint(ctx, project):
+    ctx.get(f"/api/projects/{project.id}/health/score")
+
+
+@benchmark("GET /api/portfolio/health", sized=False)
+def bench_portfolio(ctx):
+    ctx.get("/api/portfolio/health")
+
+
+def run(sizes: List[int], seed: int, only: Optional[str], budget_seconds: float) -> dict:
+    ctx = Context(sizes, seed)
+    results = {}
+    try:
+        for bench in BENCHMARKS:
+            if only and only not in bench.name:
+                continue
+            if bench.sized:
+                runs = [
+                    (f"{bench.name}[{size}]", lambda b=bench, p=project: b.fn(ctx, p))
+                    for size, project in ctx.projects.items()
+                ]
+            else:
+                runs = [(bench.name, lambda b=bench: b.fn(ctx))]
+            for key, fn in runs:
+                results[key] = measure(fn, budget_seconds=budget_seconds)
+                print(f"{key:<60} {results[key]['median_ms']:>12.3f} ms  ({results[key]['rounds']} rounds)")
+    finally:
+        ctx.close()
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    Names of benchmarks whose median regressed by more than ``threshold`` (a
+    fraction) and by at least ``min_delta_ms``, so timer noise on microsecond
+    benchmarks does not fail the run.
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        change = result["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0
+        regressed = change > threshold and result["median_ms"] - previous["median_ms"] >= min_delta_ms
+        flag = "REGRESSION" if regressed else ""
+        print(f"{key:<60} {previous['median_ms']:>10.3f} -> {result['median_ms']:>10.3f} ms  {change:+7.1%} {flag}")
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="tasks per project")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-k", dest="only", help="only run benchmarks whose name contains this")
+    parser.add_argument("--budget-seconds", type=float, default=1.0, help="timing budget per benchmark")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed median slowdown, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.seed, args.only, args.budget_seconds)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
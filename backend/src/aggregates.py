@@ -0,0 +1,176 @@
+"""
+Incremental health aggregates.
+
+ProjectAggregates keeps the running counters behind every health dimension
+and updates them per task or communication change, so a project can be
+re-scored after an event without rescanning all of its tasks.
+"""
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import Project, Task, Communication, TaskStatus, AssigneeIndex
+    from .health_calculator import ScoringSignals, RISK_KEYWORDS
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project, Task, Communication, TaskStatus, AssigneeIndex
+    from health_calculator import ScoringSignals, RISK_KEYWORDS
+
+
+class SortedTimes:
+    """Sorted multiset of timestamps supporting window counts by bisection."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self):
+        self._items: List[datetime] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, value: datetime) -> None:
+        insort(self._items, value)
+
+    def discard(self, value: datetime) -> None:
+        i = bisect_left(self._items, value)
+        if i < len(self._items) and self._items[i] == value:
+            del self._items[i]
+
+    def count_before(self, value: datetime) -> int:
+        """Number of timestamps strictly earlier than ``value``."""
+        return bisect_left(self._items, value)
+
+    def count_until(self, value: datetime) -> int:
+        """Number of timestamps earlier than or equal to ``value``."""
+        return bisect_right(self._items, value)
+
+
+class ProjectAggregates:
+    """Running counters for one project, updated per task/communication change."""
+
+    def __init__(self, risk_keywords: frozenset = RISK_KEYWORDS):
+        self.risk_keywords = risk_keywords
+        self.total_tasks = 0
+        self.status_counts: Dict[TaskStatus, int] = {status: 0 for status in TaskStatus}
+        self.blocked_tasks = 0
+        self.reopened_tasks = 0
+        self.high_risk_tagged_tasks = 0
+        self.assignees = AssigneeIndex()
+        # Last update of open tasks (aging) and of done tasks (weekly completions)
+        self.open_updated = SortedTimes()
+        self.done_updated = SortedTimes()
+        # Due dates of open tasks (overdue) and of all tasks (upcoming deadlines)
+        self.open_due = SortedTimes()
+        self.all_due = SortedTimes()
+
+        self.total_communications = 0
+        self.sentiment_counts: Dict[str, int] = {"positive": 0, "neutral": 0, "negative": 0}
+        self.communication_times = SortedTimes()
+        self.negative_times = SortedTimes()
+
+    @classmethod
+    def from_project(cls, project: Project, risk_keywords: frozenset = RISK_KEYWORDS) -> "ProjectAggregates":
+        """Build aggregates with one pass over a project's tasks and communications."""
+        aggregates = cls(risk_keywords)
+        for task in project.tasks:
+            aggregates._add_task(task)
+        for comm in project.communications:
+            aggregates.add_communication(comm)
+        return aggregates
+
+    def apply_task_change(self, old: Optional[Task], new: Optional[Task]) -> None:
+        """
+        Apply a single task change.
+        Pass ``old=None`` for a new task and ``new=None`` for a deleted one.
+        """
+        if old is not None:
+            self._remove_task(old)
+        if new is not None:
+            self._add_task(new)
+
+    def add_communication(self, comm: Communication) -> None:
+        """Count a new communication."""
+        self.total_communications += 1
+        if comm.sentiment:
+            self.sentiment_counts[comm.sentiment] = self.sentiment_counts.get(comm.sentiment, 0) + 1
+        self.communication_times.add(comm.timestamp)
+        if comm.sentiment == "negative":
+            self.negative_times.add(comm.timestamp)
+
+    def to_signals(self, now: datetime, aging_threshold_days: int) -> ScoringSignals:
+        """Resolve the time-dependent counters at ``now`` into scoring signals."""
+        signals = ScoringSignals(now, self.assignees)
+        signals.total_tasks = self.total_tasks
+        signals.done = self.status_counts[TaskStatus.DONE]
+        signals.in_progress = self.status_counts[TaskStatus.IN_PROGRESS]
+        signals.todo = self.status_counts[TaskStatus.TODO]
+
+        # (now - updated_at).days > threshold  <=>  updated_at <= now - (threshold + 1) days
+        signals.aging_tasks = self.open_updated.count_until(now - timedelta(days=aging_threshold_days + 1))
+        signals.overdue_tasks = self.open_due.count_before(now)
+        # due > now and (due - now).days <= 7  <=>  now < due < now + 8 days
+        signals.upcoming_deadlines = (
+            self.all_due.count_before(now + timedelta(days=8)) - self.all_due.count_until(now)
+        )
+
+        signals.blocked_tasks = self.blocked_tasks
+        signals.reopened_tasks = self.reopened_tasks
+        signals.high_risk_tagged_tasks = self.high_risk_tagged_tasks
+
+        week_ago = now - timedelta(days=7)
+        two_weeks_ago = now - timedelta(days=14)
+        signals.recent_completions = len(self.done_updated) - self.done_updated.count_before(week_ago)
+        signals.previous_completions = (
+            self.done_updated.count_before(week_ago) - self.done_updated.count_before(two_weeks_ago)
+        )
+
+        signals.total_communications = self.total_communications
+        signals.sentiment_counts = dict(self.sentiment_counts)
+        # (now - timestamp).days <= 7  <=>  timestamp > now - 8 days
+        recent_cutoff = now - timedelta(days=8)
+        signals.recent_communications = (
+            len(self.communication_times) - self.communication_times.count_until(recent_cutoff)
+        )
+        signals.recent_negative = len(self.negative_times) - self.negative_times.count_until(recent_cutoff)
+        return signals
+
+    def _is_risk_tagged(self, task: Task) -> bool:
+        return bool(task.tags) and any(tag.lower() in self.risk_keywords for tag in task.tags)
+
+    def _add_task(self, task: Task) -> None:
+        self._update_task_counters(task, 1)
+        self.assignees.add(task)
+        if task.status == TaskStatus.DONE:
+            self.done_updated.add(task.updated_at)
+        else:
+            self.open_updated.add(task.updated_at)
+            if task.due_date:
+                self.open_due.add(task.due_date)
+        if task.due_date:
+            self.all_due.add(task.due_date)
+
+    def _remove_task(self, task: Task) -> None:
+        self._update_task_counters(task, -1)
+        self.assignees.remove(task.id)
+        if task.status == TaskStatus.DONE:
+            self.done_updated.discard(task.updated_at)
+        else:
+            self.open_updated.discard(task.updated_at)
+            if task.due_date:
+                self.open_due.discard(task.due_date)
+        if task.due_date:
+            self.all_due.discard(task.due_date)
+
+    def _update_task_counters(self, task: Task, delta: int) -> None:
+        self.total_tasks += delta
+        self.status_counts[task.status] += delta
+        if task.is_blocked:
+            self.blocked_tasks += delta
+        if task.is_reopened:
+            self.reopened_tasks += delta
+        if self._is_risk_tagged(task):
+            self.high_risk_tagged_tasks += delta
@@ -1,116 +1,282 @@
+import asyncio
+import json
 import os
+import re
 import sys
-from typing import List, Optional
-from openai import OpenAI
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+from openai import OpenAI, AsyncOpenAI
 
 # Handle imports
 try:
     from .models import HealthScore, Risk, Recommendation
-    from .config import get_ai_prompts, OPENAI_API_KEY, OPENAI_MODEL
+    from .sentiment_cache import SentimentCache, text_key
+    from .keyword_sentiment import KeywordSentimentClassifier
+    from .recommendation_cache import RecommendationCache
+    from .llm_telemetry import LLMCall, LLMTelemetry, OK, PARSE_FALLBACK, EXCEPTION_FALLBACK
+    from .config import (
+        get_ai_prompts, OPENAI_API_KEY, OPENAI_MODEL, OPENAI_TIMEOUT_SECONDS,
+        OPENAI_MAX_RETRIES, OPENAI_MAX_CONCURRENCY, OPENAI_MAX_CONNECTIONS,
+        SENTIMENT_BATCH_TOKEN_BUDGET, SENTIMENT_BATCH_MAX_ITEMS,
+        SENTIMENT_CACHE_SIZE, SENTIMENT_CACHE_TTL_SECONDS, SENTIMENT_CACHE_DB,
+        RECOMMENDATION_CACHE_BUCKET_WIDTH, RECOMMENDATION_CACHE_TTL_SECONDS,
+        RECOMMENDATION_CACHE_SIZE, LLM_TELEMETRY_WINDOW_SECONDS, LLM_TELEMETRY_MAX_CALLS,
+        LLM_TELEMETRY_LOG
+    )
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     from models import HealthScore, Risk, Recommendation
-    from config import get_ai_prompts, OPENAI_API_KEY, OPENAI_MODEL
+    from sentiment_cache import SentimentCache, text_key
+    from keyword_sentiment import KeywordSentimentClassifier
+    from recommendation_cache import RecommendationCache
+    from llm_telemetry import LLMCall, LLMTelemetry, OK, PARSE_FALLBACK, EXCEPTION_FALLBACK
+    from config import (
+        get_ai_prompts, OPENAI_API_KEY, OPENAI_MODEL, OPENAI_TIMEOUT_SECONDS,
+        OPENAI_MAX_RETRIES, OPENAI_MAX_CONCURRENCY, OPENAI_MAX_CONNECTIONS,
+        SENTIMENT_BATCH_TOKEN_BUDGET, SENTIMENT_BATCH_MAX_ITEMS,
+        SENTIMENT_CACHE_SIZE, SENTIMENT_CACHE_TTL_SECONDS, SENTIMENT_CACHE_DB,
+        RECOMMENDATION_CACHE_BUCKET_WIDTH, RECOMMENDATION_CACHE_TTL_SECONDS,
+        RECOMMENDATION_CACHE_SIZE, LLM_TELEMETRY_WINDOW_SECONDS, LLM_TELEMETRY_MAX_CALLS,
+        LLM_TELEMETRY_LOG
+    )
 
 
-class AIService:
-    def __init__(self):
+SENTIMENTS = ("positive", "neutral", "negative")
+
+# Rough token estimate for budgeting batch prompts (~4 characters per token)
+CHARS_PER_TOKEN = 4
+# Per-item output allowance: '"12": "negative", ' is about 6 tokens
+OUTPUT_TOKENS_PER_ITEM = 8
+
+
+class BaseAIService:
+    """Prompts, response parsing and keyword fallbacks shared by the sync and async services."""
+    
+    def __init__(
+        self,
+        sentiment_cache: Optional[SentimentCache] = None,
+        recommendation_cache: Optional[RecommendationCache] = None,
+        telemetry: Optional[LLMTelemetry] = None
+    ):
         self.prompts = get_ai_prompts()
-        # Initialize OpenAI client if API key is available
-        if OPENAI_API_KEY:
-            self.client = OpenAI(api_key=OPENAI_API_KEY)
-        else:
-            self.client = None
+        self.keyword_classifier = KeywordSentimentClassifier.from_config()
+        # Only LLM answers are cached; keyword fallbacks are cheap to recompute
+        self.sentiment_cache = sentiment_cache or SentimentCache(
+            max_entries=SENTIMENT_CACHE_SIZE,
+            ttl_seconds=SENTIMENT_CACHE_TTL_SECONDS,
+            db_path=SENTIMENT_CACHE_DB or None
+        )
+        self.recommendation_cache = recommendation_cache or RecommendationCache(
+            bucket_width=RECOMMENDATION_CACHE_BUCKET_WIDTH,
+            ttl_seconds=RECOMMENDATION_CACHE_TTL_SECONDS,
+            max_entries=RECOMMENDATION_CACHE_SIZE
+        )
+        self.telemetry = telemetry or LLMTelemetry(
+            window_seconds=LLM_TELEMETRY_WINDOW_SECONDS,
+            max_calls=LLM_TELEMETRY_MAX_CALLS,
+            log_path=LLM_TELEMETRY_LOG or None
+        )
+        # Optional hook called with (operation, reason) whenever a keyword or template fallback is used
+        self.on_fallback: Optional[Callable[[str, str], None]] = None
     
-    def analyze_sentiment(self, text: str) -> str:
-        """Analyze sentiment of text using AI."""
-        if not self.client:
-            # Fallback to simple keyword-based sentiment if no API key
-            return self._fallback_sentiment(text)
-        
-        try:
-            prompt = self.prompts["sentiment_analysis"].format(text=text)
-            response = self.client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a sentiment analysis tool. Respond with only one word: 'positive', 'neutral', or 'negative'."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=10
-            )
-            sentiment = response.choices[0].message.content.strip().lower()
-            if sentiment in ["positive", "neutral", "negative"]:
-                return sentiment
-            return "neutral"
-        except Exception as e:
-            print(f"Error in sentiment analysis: {e}")
-            return self._fallback_sentiment(text)
+    def _note_fallback(self, operation: str, reason: str) -> None:
+        if self.on_fallback is not None:
+            self.on_fallback(operation, reason)
     
-    def _fallback_sentiment(self, text: str) -> str:
-        """Fallback sentiment analysis using keywords."""
-        text_lower = text.lower()
-        positive_keywords = ["great", "excellent", "good", "thanks", "appreciate", "awesome", "perfect"]
-        negative_keywords = ["urgent", "critical", "blocking", "delayed", "broken", "failed", "error", "bug", "issue", "problem"]
-        
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
-        
-        if negative_count > positive_count:
-            return "negative"
-        elif positive_count > negative_count:
-            return "positive"
-        else:
-            return "neutral"
+    def _record_llm_call(
+        self,
+        operation: str,
+        started: float,
+        response=None,
+        outcome: str = OK,
+        items: int = 1,
+        recommendation_count: Optional[int] = None,
+        error: Optional[Exception] = None
+    ) -> None:
+        """Record one completion call; ``started`` is a time.perf_counter() value."""
+        duration = time.perf_counter() - started
+        usage = getattr(response, "usage", None)
+        self.telemetry.record(LLMCall(
+            operation=operation,
+            model=getattr(response, "model", None) or OPENAI_MODEL,
+            started_at=time.time() - duration,
+            duration_seconds=duration,
+            outcome=outcome,
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+            completion_tokens=getattr(usage, "completion_tokens", None),
+            items=items,
+            recommendation_count=recommendation_count,
+            error=f"{type(error).__name__}: {error}" if error is not None else None
+        ))
     
-    def generate_recommendations(
+    def _accept_recommendations(
         self,
+        text: str,
+        response,
+        started: float,
         health_score: HealthScore,
-        risks: List[Risk],
-        project_name: str
+        risks: List[Risk]
     ) -> List[Recommendation]:
-        """Generate AI-powered recommendations to improve project health."""
-        if not self.client:
-            return self._fallback_recommendations(health_score, risks)
+        """Parse a recommendations reply, record the call and cache the result if it parsed fully."""
+        parsed = self._parse_recommendation_lines(text)
+        outcome = OK if len(parsed) >= 3 else PARSE_FALLBACK
+        self._record_llm_call("recommendations", started, response, outcome, recommendation_count=len(parsed))
+        recommendations = self._pad_recommendations(parsed, health_score)
+        if outcome == OK:
+            self.recommendation_cache.put(health_score, risks, recommendations)
+        else:
+            self._note_fallback("recommendations", "parse")
+        return recommendations
+    
+    def _accept_sentiment(self, response, started: float) -> Optional[str]:
+        """Parse a sentiment reply and record the call. Returns None unless the reply was a valid label."""
+        content = response.choices[0].message.content
+        outcome = OK if self._is_sentiment(content) else PARSE_FALLBACK
+        self._record_llm_call("sentiment", started, response, outcome)
+        if outcome == PARSE_FALLBACK:
+            self._note_fallback("sentiment", "parse")
+            return None
+        return self._parse_sentiment(content)
+    
+    def _sentiment_messages(self, text: str) -> List[dict]:
+        prompt = self.prompts["sentiment_analysis"].format(text=text)
+        return [
+            {"role": "system", "content": "You are a sentiment analysis tool. Respond with only one word: 'positive', 'neutral', or 'negative'."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _parse_sentiment(self, content: str) -> str:
+        sentiment = content.strip().lower()
+        if sentiment in ["positive", "neutral", "negative"]:
+            return sentiment
+        return "neutral"
+    
+    def _is_sentiment(self, content: Optional[str]) -> bool:
+        return (content or "").strip().lower() in SENTIMENTS
+    
+    def _sentiment_batches(self, texts: List[str]) -> List[List[int]]:
+        """Group text indexes into batches that fit the prompt token budget."""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = len(text) // CHARS_PER_TOKEN + OUTPUT_TOKENS_PER_ITEM
+            if current and (
+                current_tokens + tokens > SENTIMENT_BATCH_TOKEN_BUDGET
+                or len(current) >= SENTIMENT_BATCH_MAX_ITEMS
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _batch_sentiment_messages(self, texts: List[str]) -> List[dict]:
+        numbered = "\n".join(
+            f"{i}. {' '.join(text.split())}" for i, text in enumerate(texts, start=1)
+        )
+        return [
+            {"role": "system", "content": "You are a sentiment analysis tool. Respond with only a JSON object."},
+            {"role": "user", "content": self.prompts["sentiment_batch"].format(texts=numbered)}
+        ]
+    
+    def _parse_batch_sentiments(self, content: str, count: int) -> List[Optional[str]]:
+        """
+        Parse a JSON object mapping item numbers to sentiments.
+        Items that are missing or malformed come back as None.
+        """
+        parsed = {}
+        match = re.search(r"\{.*\}", content or "", re.DOTALL)
+        if match:
+            try:
+                parsed = json.loads(match.group(0))
+            except ValueError:
+                parsed = {}
+        if not isinstance(parsed, dict):
+            parsed = {}
         
-        try:
-            # Format dimension breakdown
-            breakdown = "\n".join([
-                f"- {dim.name}: {dim.score}/100 (weight: {dim.weight*100}%)"
-                for dim in health_score.dimensions
-            ])
-            
-            # Format risks
-            risks_text = "\n".join([
-                f"- {risk.title} ({risk.severity}): {risk.description}"
-                for risk in risks
-            ]) if risks else "No specific risks detected."
-            
-            prompt = self.prompts["recommendations"].format(
-                score=health_score.overall_score,
-                status=health_score.status.value,
-                breakdown=breakdown,
-                risks=risks_text
-            )
-            
-            response = self.client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a project management advisor. Provide specific, actionable recommendations to improve project health."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            recommendations_text = response.choices[0].message.content.strip()
-            return self._parse_recommendations(recommendations_text, health_score)
-        except Exception as e:
-            print(f"Error generating recommendations: {e}")
-            return self._fallback_recommendations(health_score, risks)
+        results = []
+        for i in range(1, count + 1):
+            sentiment = parsed.get(str(i))
+            if isinstance(sentiment, str) and sentiment.strip().lower() in SENTIMENTS:
+                results.append(sentiment.strip().lower())
+            else:
+                results.append(None)
+        return results
+    
+    def _uncached_sentiments(self, texts: List[str], cached: List[Optional[str]]) -> Dict[str, str]:
+        """The distinct texts the sentiment cache missed (None in ``cached``), by cache key."""
+        pending = {}
+        for text, sentiment in zip(texts, cached):
+            if sentiment is None:
+                pending.setdefault(text_key(text), text)
+        return pending
+    
+    def _merge_sentiments(
+        self,
+        texts: List[str],
+        cached: List[Optional[str]],
+        classified: Dict[str, Optional[str]]
+    ) -> Tuple[List[str], List[tuple]]:
+        """
+        Fill gaps with fresh LLM answers, then with keyword sentiment.
+        Returns the results and the (text, sentiment) pairs the LLM answered, for the cache.
+        """
+        fresh = {}
+        results = []
+        unresolved = []
+        for i, (text, sentiment) in enumerate(zip(texts, cached)):
+            if sentiment is None:
+                key = text_key(text)
+                sentiment = classified.get(key)
+                if sentiment is None:
+                    unresolved.append(i)
+                else:
+                    fresh[key] = (text, sentiment)
+            results.append(sentiment)
+        
+        fallbacks = self.keyword_classifier.classify_many([texts[i] for i in unresolved])
+        for i, sentiment in zip(unresolved, fallbacks):
+            results[i] = sentiment
+        return results, list(fresh.values())
+    
+    def _recommendation_messages(self, health_score: HealthScore, risks: List[Risk]) -> List[dict]:
+        # Format dimension breakdown
+        breakdown = "\n".join([
+            f"- {dim.name}: {dim.score}/100 (weight: {dim.weight*100}%)"
+            for dim in health_score.dimensions
+        ])
+        
+        # Format risks
+        risks_text = "\n".join([
+            f"- {risk.title} ({risk.severity}): {risk.description}"
+            for risk in risks
+        ]) if risks else "No specific risks detected."
+        
+        prompt = self.prompts["recommendations"].format(
+            score=health_score.overall_score,
+            status=health_score.status.value,
+            breakdown=breakdown,
+            risks=risks_text
+        )
+        return [
+            {"role": "system", "content": "You are a project management advisor. Provide specific, actionable recommendations to improve project health."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _fallback_sentiment(self, text: str) -> str:
+        """Fallback sentiment analysis using keywords."""
+        return self.keyword_classifier.classify(text)
     
     def _parse_recommendations(self, text: str, health_score: HealthScore) -> List[Recommendation]:
-        """Parse AI-generated recommendations from text."""
+        """Parse AI-generated recommendations from text, padded with fallbacks to at least 3."""
+        return self._pad_recommendations(self._parse_recommendation_lines(text), health_score)
+    
+    def _parse_recommendation_lines(self, text: str) -> List[Recommendation]:
+        """Recommendations recovered from the numbered lines of an LLM reply."""
         recommendations = []
         lines = text.split('\n')
         
@@ -164,6 +330,9 @@ class AIService:
                 print(f"Error parsing recommendation: {e}")
                 continue
         
+        return recommendations
+    
+    def _pad_recommendations(self, recommendations: List[Recommendation], health_score: HealthScore) -> List[Recommendation]:
         # Ensure we have at least 3 recommendations
         if len(recommendations) < 3:
             recommendations.extend(self._fallback_recommendations(health_score, [])[:3-len(recommendations)])
@@ -250,3 +419,277 @@ class AIService:
         
         return recommendations[:5]
 
+
+class AIService(BaseAIService):
+    def __init__(self):
+        super().__init__()
+        # Initialize OpenAI client if API key is available
+        if OPENAI_API_KEY:
+            self.client = OpenAI(api_key=OPENAI_API_KEY)
+        else:
+            self.client = None
+    
+    def analyze_sentiment(self, text: str) -> str:
+        """Analyze sentiment of text using AI."""
+        if not self.client:
+            # Fallback to simple keyword-based sentiment if no API key
+            self._note_fallback("sentiment", "no_client")
+            return self._fallback_sentiment(text)
+        
+        cached = self.sentiment_cache.get(text)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        try:
+            response = self.client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=self._sentiment_messages(text),
+                temperature=0.3,
+                max_tokens=10
+            )
+            sentiment = self._accept_sentiment(response, started)
+            if sentiment is None:
+                return self._fallback_sentiment(text)
+            self.sentiment_cache.set(text, sentiment)
+            return sentiment
+        except Exception as e:
+            print(f"Error in sentiment analysis: {e}")
+            self._record_llm_call("sentiment", started, outcome=EXCEPTION_FALLBACK, error=e)
+            self._note_fallback("sentiment", "error")
+            return self._fallback_sentiment(text)
+    
+    def analyze_sentiments(self, texts: List[str]) -> List[str]:
+        """Analyze many texts, packing as many as fit the token budget into each LLM call."""
+        if not self.client:
+            self._note_fallback("sentiment_batch", "no_client")
+            return self.keyword_classifier.classify_many(texts)
+        
+        cached = self.sentiment_cache.get_many(texts)
+        pending = self._uncached_sentiments(texts, cached)
+        keys = list(pending)
+        pending_texts = list(pending.values())
+        classified: Dict[str, Optional[str]] = {}
+        for batch in self._sentiment_batches(pending_texts):
+            batch_texts = [pending_texts[i] for i in batch]
+            started = time.perf_counter()
+            try:
+                response = self.client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=self._batch_sentiment_messages(batch_texts),
+                    temperature=0.3,
+                    max_tokens=OUTPUT_TOKENS_PER_ITEM * len(batch) + 10
+                )
+                sentiments = self._parse_batch_sentiments(response.choices[0].message.content, len(batch))
+                outcome = PARSE_FALLBACK if None in sentiments else OK
+                self._record_llm_call("sentiment_batch", started, response, outcome, items=len(batch))
+                if outcome == PARSE_FALLBACK:
+                    self._note_fallback("sentiment_batch", "parse")
+            except Exception as e:
+                print(f"Error in batch sentiment analysis: {e}")
+                self._record_llm_call("sentiment_batch", started, outcome=EXCEPTION_FALLBACK, items=len(batch), error=e)
+                self._note_fallback("sentiment_batch", "error")
+                sentiments = [None] * len(batch)
+            for i, sentiment in zip(batch, sentiments):
+                classified[keys[i]] = sentiment
+        results, fresh = self._merge_sentiments(texts, cached, classified)
+        self.sentiment_cache.set_many(fresh)
+        return results
+    
+    def generate_recommendations(
+        self,
+        health_score: HealthScore,
+        risks: List[Risk],
+        project_name: str
+    ) -> List[Recommendation]:
+        """Generate AI-powered recommendations to improve project health."""
+        if not self.client:
+            self._note_fallback("recommendations", "no_client")
+            return self._fallback_recommendations(health_score, risks)
+        
+        cached = self.recommendation_cache.get(health_score, risks)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        try:
+            response = self.client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=self._recommendation_messages(health_score, risks),
+                temperature=0.7,
+                max_tokens=500
+            )
+            
+            recommendations_text = response.choices[0].message.content.strip()
+            return self._accept_recommendations(recommendations_text, response, started, health_score, risks)
+        except Exception as e:
+            print(f"Error generating recommendations: {e}")
+            self._record_llm_call("recommendations", started, outcome=EXCEPTION_FALLBACK, error=e)
+            self._note_fallback("recommendations", "error")
+            return self._fallback_recommendations(health_score, risks)
+
+
+class AsyncAIService(BaseAIService):
+    """
+    Non-blocking AI service for use inside async request handlers.
+    Shares one pooled HTTP client, caps concurrent LLM calls with a semaphore
+    and applies a timeout to every call.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+        timeout: float = OPENAI_TIMEOUT_SECONDS,
+        max_connections: int = OPENAI_MAX_CONNECTIONS
+    ):
+        super().__init__()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        if OPENAI_API_KEY:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                ),
+                timeout=timeout
+            )
+            self.client = AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                http_client=self._http_client,
+                timeout=timeout,
+                max_retries=OPENAI_MAX_RETRIES
+            )
+        else:
+            self._http_client = None
+            self.client = None
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+    
+    async def _complete(self, messages: List[dict], temperature: float, max_tokens: int, timeout: Optional[float]):
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await self.client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout or self.timeout
+            )
+    
+    async def _cached_sentiments(self, texts: List[str]) -> List[Optional[str]]:
+        """Look texts up in the sentiment cache, reading its SQLite tier in the executor."""
+        keys = [text_key(text) for text in texts]
+        cached = self.sentiment_cache.lookup(keys)
+        if None in cached and self.sentiment_cache.persistent:
+            return await asyncio.get_running_loop().run_in_executor(None, self.sentiment_cache.load, keys, cached)
+        return self.sentiment_cache.load(keys, cached)
+    
+    async def _cache_sentiments(self, items: List[tuple]) -> None:
+        """Cache (text, sentiment) pairs, writing the SQLite tier in the executor."""
+        rows = self.sentiment_cache.remember(items)
+        if rows and self.sentiment_cache.persistent:
+            await asyncio.get_running_loop().run_in_executor(None, self.sentiment_cache.store, rows)
+    
+    async def analyze_sentiment(self, text: str, timeout: Optional[float] = None) -> str:
+        """Analyze sentiment of text using AI without blocking the event loop."""
+        if not self.client:
+            self._note_fallback("sentiment", "no_client")
+            return self._fallback_sentiment(text)
+        
+        cached = (await self._cached_sentiments([text]))[0]
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        try:
+            response = await self._complete(self._sentiment_messages(text), 0.3, 10, timeout)
+            sentiment = self._accept_sentiment(response, started)
+            if sentiment is None:
+                return self._fallback_sentiment(text)
+            await self._cache_sentiments([(text, sentiment)])
+            return sentiment
+        except Exception as e:
+            print(f"Error in sentiment analysis: {e}")
+            self._record_llm_call("sentiment", started, outcome=EXCEPTION_FALLBACK, error=e)
+            self._note_fallback("sentiment", "error")
+            return self._fallback_sentiment(text)
+    
+    async def analyze_sentiments(self, texts: List[str], timeout: Optional[float] = None) -> List[str]:
+        """Analyze many texts in budget-bounded batches, sending the batches concurrently."""
+        if not self.client:
+            self._note_fallback("sentiment_batch", "no_client")
+            return self.keyword_classifier.classify_many(texts)
+        
+        async def classify(batch_texts: List[str]) -> List[Optional[str]]:
+            started = time.perf_counter()
+            try:
+                response = await self._complete(
+                    self._batch_sentiment_messages(batch_texts),
+                    0.3,
+                    OUTPUT_TOKENS_PER_ITEM * len(batch_texts) + 10,
+                    timeout
+                )
+                sentiments = self._parse_batch_sentiments(response.choices[0].message.content, len(batch_texts))
+                outcome = PARSE_FALLBACK if None in sentiments else OK
+                self._record_llm_call("sentiment_batch", started, response, outcome, items=len(batch_texts))
+                if outcome == PARSE_FALLBACK:
+                    self._note_fallback("sentiment_batch", "parse")
+                return sentiments
+            except Exception as e:
+                print(f"Error in batch sentiment analysis: {e}")
+                self._record_llm_call(
+                    "sentiment_batch", started, outcome=EXCEPTION_FALLBACK, items=len(batch_texts), error=e
+                )
+                self._note_fallback("sentiment_batch", "error")
+                return [None] * len(batch_texts)
+        
+        cached = await self._cached_sentiments(texts)
+        pending = self._uncached_sentiments(texts, cached)
+        keys = list(pending)
+        pending_texts = list(pending.values())
+        batches = self._sentiment_batches(pending_texts)
+        batch_results = await asyncio.gather(
+            *(classify([pending_texts[i] for i in batch]) for batch in batches)
+        )
+        classified: Dict[str, Optional[str]] = {}
+        for batch, sentiments in zip(batches, batch_results):
+            for i, sentiment in zip(batch, sentiments):
+                classified[keys[i]] = sentiment
+        results, fresh = self._merge_sentiments(texts, cached, classified)
+        await self._cache_sentiments(fresh)
+        return results
+    
+    async def generate_recommendations(
+        self,
+        health_score: HealthScore,
+        risks: List[Risk],
+        project_name: str,
+        timeout: Optional[float] = None
+    ) -> List[Recommendation]:
+        """Generate AI-powered recommendations without blocking the event loop."""
+        if not self.client:
+            self._note_fallback("recommendations", "no_client")
+            return self._fallback_recommendations(health_score, risks)
+        
+        cached = self.recommendation_cache.get(health_score, risks)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        try:
+            response = await self._complete(
+                self._recommendation_messages(health_score, risks), 0.7, 500, timeout
+            )
+            recommendations_text = response.choices[0].message.content.strip()
+            return self._accept_recommendations(recommendations_text, response, started, health_score, risks)
+        except Exception as e:
+            print(f"Error generating recommendations: {e}")
+            self._record_llm_call("recommendations", started, outcome=EXCEPTION_FALLBACK, error=e)
+            self._note_fallback("recommendations", "error")
+            return self._fallback_recommendations(health_score, risks)
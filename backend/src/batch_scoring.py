@@ -0,0 +1,395 @@
+"""
+Vectorized portfolio scoring.
+
+Tasks and communications of many projects are flattened into NumPy column
+arrays and every dimension is computed for all projects at once with
+grouped reductions, instead of looping over each project in Python.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import sys
+import os
+
+import numpy as np
+
+# Handle imports
+try:
+    from .models import (
+        Project, TaskStatus, HealthScore, DimensionScore
+    )
+    from .scoring_plan import ScoringPlan, ScoringPlans
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import (
+        Project, TaskStatus, HealthScore, DimensionScore
+    )
+    from scoring_plan import ScoringPlan, ScoringPlans
+
+
+STATUS_CODES = {
+    TaskStatus.TODO: 0,
+    TaskStatus.IN_PROGRESS: 1,
+    TaskStatus.DONE: 2,
+    TaskStatus.BLOCKED: 3,
+}
+SENTIMENT_CODES = {"positive": 0, "neutral": 1, "negative": 2}
+NO_SENTIMENT = 3
+
+ONE_DAY = np.timedelta64(1, "D")
+
+
+class PortfolioColumns:
+    """Column arrays for the tasks, members and communications of many projects."""
+
+    def __init__(self, projects: List[Project], risk_keywords: frozenset):
+        self.project_count = len(projects)
+        tasks = [t for p in projects for t in p.tasks]
+        comms = [c for p in projects for c in p.communications]
+        project_index = np.arange(self.project_count)
+
+        # Tasks
+        self.task_counts = np.array([len(p.tasks) for p in projects], dtype=np.int64)
+        self.status = np.array([STATUS_CODES[t.status] for t in tasks], dtype=np.int8)
+        self.updated_at = np.array([t.updated_at for t in tasks], dtype="datetime64[us]")
+        self.due_date = np.array([t.due_date for t in tasks], dtype="datetime64[us]")
+        self.is_blocked = np.array([t.is_blocked for t in tasks], dtype=bool)
+        self.is_reopened = np.array([t.is_reopened for t in tasks], dtype=bool)
+        self.risk_tagged = np.array(
+            [bool(t.tags) and any(tag.lower() in risk_keywords for tag in t.tags) for t in tasks],
+            dtype=bool
+        )
+        self.task_project = np.repeat(project_index, self.task_counts)
+
+        # Team members, deduplicated by id per project; names keep the last occurrence
+        self.member_ids: List[List[str]] = []
+        self.member_names: List[List[str]] = []
+        assignee = np.full(len(tasks), -1, dtype=np.int64)
+        offset = 0
+        task_start = 0
+        for p in projects:
+            names = {tm.id: tm.name for tm in p.team_members}
+            codes = {member_id: offset + i for i, member_id in enumerate(names)}
+            self.member_ids.append(list(names))
+            self.member_names.append(list(names.values()))
+            if codes:
+                assignee[task_start:task_start + len(p.tasks)] = [
+                    codes.get(t.assignee_id, -1) for t in p.tasks
+                ]
+            offset += len(codes)
+            task_start += len(p.tasks)
+        self.member_total = offset
+        self.member_counts = np.array([len(ids) for ids in self.member_ids], dtype=np.int64)
+        self.member_project = np.repeat(project_index, self.member_counts)
+        self.assignee = assignee
+
+        # Communications
+        self.comm_counts = np.array([len(p.communications) for p in projects], dtype=np.int64)
+        self.comm_project = np.repeat(project_index, self.comm_counts)
+        self.sentiment = np.array(
+            [SENTIMENT_CODES.get(c.sentiment, NO_SENTIMENT) for c in comms], dtype=np.int8
+        )
+        self.timestamp = np.array([c.timestamp for c in comms], dtype="datetime64[us]")
+
+    def count_tasks(self, mask: np.ndarray) -> np.ndarray:
+        """Number of tasks matching ``mask`` in each project."""
+        return np.bincount(self.task_project[mask], minlength=self.project_count)
+
+    def count_comms(self, mask: np.ndarray) -> np.ndarray:
+        """Number of communications matching ``mask`` in each project."""
+        return np.bincount(self.comm_project[mask], minlength=self.project_count)
+
+    def count_members(self, mask: np.ndarray) -> np.ndarray:
+        """Number of team members matching ``mask`` in each project."""
+        return np.bincount(self.member_project[mask], minlength=self.project_count)
+
+    def count_per_member(self, mask: np.ndarray) -> np.ndarray:
+        """Number of tasks matching ``mask`` assigned to each team member."""
+        codes = self.assignee[mask & (self.assignee >= 0)]
+        return np.bincount(codes, minlength=self.member_total)
+
+
+def _round1(values: np.ndarray) -> List[float]:
+    """Round like the scalar path does, so both produce identical scores."""
+    return [round(float(v), 1) for v in values]
+
+
+def score_projects_batch(
+    calculator,
+    projects: List[Project],
+    previous_scores: Optional[Dict[str, float]] = None,
+    now: Optional[datetime] = None,
+    plans: Optional[ScoringPlans] = None
+) -> List[HealthScore]:
+    """
+    Score many projects at once; results match HealthCalculator.calculate_health_score.
+    Projects are scored in one batch per scoring profile, with ``plans`` or the calculator's plans.
+    """
+    if not projects:
+        return []
+    now = now or datetime.now()
+    previous_scores = previous_scores or {}
+    plans = plans or calculator.plans
+    groups: Dict[ScoringPlan, List[int]] = {}
+    for i, project in enumerate(projects):
+        groups.setdefault(plans.for_project(project.id), []).append(i)
+    if len(groups) == 1:
+        return _score_plan_batch(calculator, next(iter(groups)), projects, previous_scores, now)
+
+    results: List[Optional[HealthScore]] = [None] * len(projects)
+    for plan, indices in groups.items():
+        scored = _score_plan_batch(calculator, plan, [projects[i] for i in indices], previous_scores, now)
+        for i, health_score in zip(indices, scored):
+            results[i] = health_score
+    return results
+
+
+def _score_plan_batch(
+    calculator,
+    plan: ScoringPlan,
+    projects: List[Project],
+    previous_scores: Dict[str, float],
+    now: datetime
+) -> List[HealthScore]:
+    """Score projects that share one scoring plan."""
+    cols = PortfolioColumns(projects, calculator.risk_keywords)
+    now64 = np.datetime64(now, "us")
+    week_ago = np.datetime64(now - timedelta(days=7), "us")
+    two_weeks_ago = np.datetime64(now - timedelta(days=14), "us")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Delivery health
+        has_tasks = cols.task_counts > 0
+        total = cols.task_counts.astype(np.float64)
+        is_done = cols.status == STATUS_CODES[TaskStatus.DONE]
+        open_tasks = ~is_done
+        done = cols.count_tasks(is_done)
+        in_progress = cols.count_tasks(cols.status == STATUS_CODES[TaskStatus.IN_PROGRESS])
+        todo = cols.count_tasks(cols.status == STATUS_CODES[TaskStatus.TODO])
+        aging = cols.count_tasks(
+            open_tasks & ((now64 - cols.updated_at) // ONE_DAY > plan.aging_threshold_days)
+        )
+        overdue = cols.count_tasks(open_tasks & (cols.due_date < now64))
+        upcoming = cols.count_tasks(
+            (cols.due_date > now64) & ((cols.due_date - now64) // ONE_DAY <= 7)
+        )
+        delivery = np.full(cols.project_count, 100.0)
+        delivery -= (aging / total) * plan.aging_penalty
+        delivery -= (overdue / total) * plan.overdue_penalty
+        delivery += (done / total) * plan.done_reward
+        delivery += (in_progress / total) * plan.in_progress_reward
+        delivery = _round1(np.where(has_tasks, np.clip(delivery, 0, 100), 0))
+
+        # Workload balance
+        member_tasks = cols.count_per_member(np.ones(len(cols.assignee), dtype=bool))
+        member_done = cols.count_per_member(is_done)
+        member_in_progress = cols.count_per_member(
+            cols.status == STATUS_CODES[TaskStatus.IN_PROGRESS]
+        )
+        has_members = cols.member_counts > 0
+        members = cols.member_counts.astype(np.float64)
+        avg_tasks = np.bincount(cols.member_project, weights=member_tasks, minlength=cols.project_count) / members
+        max_tasks = np.zeros(cols.project_count)
+        min_tasks = np.zeros(cols.project_count)
+        member_starts = np.cumsum(cols.member_counts) - cols.member_counts
+        starts = member_starts[has_members]
+        if len(starts):
+            max_tasks[has_members] = np.maximum.reduceat(member_tasks, starts)
+            min_tasks[has_members] = np.minimum.reduceat(member_tasks, starts)
+        variance = np.bincount(
+            cols.member_project,
+            weights=(member_tasks - avg_tasks[cols.member_project]) ** 2,
+            minlength=cols.project_count
+        ) / members
+        overload_threshold = plan.overload_threshold_tasks
+        underutilization_threshold = plan.underutilization_threshold_tasks
+        overloaded = cols.count_members(member_tasks > overload_threshold)
+        underutilized = cols.count_members(member_tasks < underutilization_threshold)
+        overload_ratio = (max_tasks - overload_threshold) / overload_threshold
+        workload = np.full(cols.project_count, 100.0)
+        workload -= np.where(
+            max_tasks > overload_threshold,
+            np.minimum(plan.overload_penalty_cap, overload_ratio * plan.overload_penalty_rate),
+            0
+        )
+        workload -= np.where(
+            (min_tasks < underutilization_threshold) & (avg_tasks > 0), plan.underutilization_penalty, 0
+        )
+        workload -= np.where(
+            (avg_tasks > 0) & (variance ** 0.5 > avg_tasks * plan.imbalance_ratio), plan.imbalance_penalty, 0
+        )
+        workload = _round1(np.where(has_members, np.clip(workload, 0, 100), 0))
+
+        # Communication & sentiment
+        comm_total = cols.comm_counts.astype(np.float64)
+        positive = cols.count_comms(cols.sentiment == SENTIMENT_CODES["positive"])
+        neutral = cols.count_comms(cols.sentiment == SENTIMENT_CODES["neutral"])
+        negative = cols.count_comms(cols.sentiment == SENTIMENT_CODES["negative"])
+        recent = (now64 - cols.timestamp) // ONE_DAY <= 7
+        recent_total = cols.count_comms(recent)
+        recent_negative = cols.count_comms(recent & (cols.sentiment == SENTIMENT_CODES["negative"]))
+        sentiment = np.full(cols.project_count, float(plan.sentiment_base))
+        sentiment += (positive / comm_total) * plan.sentiment_swing
+        sentiment -= (negative / comm_total) * plan.sentiment_swing
+        sentiment = np.clip(sentiment, 0, 100)
+        sentiment -= np.where(
+            (recent_total > 0) & (recent_negative / recent_total > plan.recent_negative_ratio),
+            plan.recent_negative_penalty,
+            0
+        )
+        sentiment = _round1(np.clip(sentiment, 0, 100))
+        recent_negative_trend = (recent_total > 0) & (recent_negative > recent_total * plan.recent_negative_ratio)
+
+        # Risk & dependency signals
+        blocked = cols.count_tasks(cols.is_blocked)
+        reopened = cols.count_tasks(cols.is_reopened)
+        tagged = cols.count_tasks(cols.risk_tagged)
+        risk = np.full(cols.project_count, 100.0)
+        risk -= (blocked / total) * plan.blocked_penalty
+        risk -= (reopened / total) * plan.reopened_penalty
+        risk -= (tagged / total) * plan.risk_tag_penalty
+        risk = _round1(np.clip(risk, 0, 100))
+
+        # Momentum trend
+        recent_done = cols.count_tasks(is_done & (cols.updated_at >= week_ago))
+        previous_done = cols.count_tasks(
+            is_done & (cols.updated_at >= two_weeks_ago) & (cols.updated_at < week_ago)
+        )
+        momentum_ratio = np.where(
+            previous_done > 0,
+            recent_done / previous_done,
+            np.where(recent_done > 0, 1.0, 0.5)
+        )
+        momentum = np.where(
+            momentum_ratio > plan.improving_ratio,
+            float(plan.improving_score),
+            np.where(momentum_ratio > plan.stable_ratio, float(plan.stable_score), float(plan.declining_score))
+        )
+        previous = np.array(
+            [previous_scores.get(p.id, np.nan) for p in projects], dtype=np.float64
+        )
+        current_health = (
+            np.array(delivery) * plan.delivery_weight
+            + np.array(workload) * plan.workload_weight
+        )
+        margin = plan.momentum_health_margin
+        adjustment = plan.momentum_health_adjustment
+        momentum = np.where(
+            current_health > previous + margin,
+            np.minimum(100, momentum + adjustment),
+            np.where(current_health < previous - margin, np.maximum(0, momentum - adjustment), momentum)
+        )
+        momentum = _round1(np.clip(momentum, 0, 100))
+
+    results = []
+    for i, project in enumerate(projects):
+        if has_tasks[i]:
+            delivery_dim = DimensionScore(
+                name="Delivery Health",
+                score=delivery[i],
+                weight=plan.delivery_weight,
+                details={
+                    "total_tasks": int(cols.task_counts[i]),
+                    "done": int(done[i]),
+                    "in_progress": int(in_progress[i]),
+                    "todo": int(todo[i]),
+                    "aging_tasks": int(aging[i]),
+                    "overdue_tasks": int(overdue[i]),
+                    "upcoming_deadlines": int(upcoming[i]),
+                }
+            )
+            risk_dim = DimensionScore(
+                name="Risk & Dependency Signals",
+                score=risk[i],
+                weight=plan.risk_weight,
+                details={
+                    "blocked_tasks": int(blocked[i]),
+                    "reopened_tasks": int(reopened[i]),
+                    "high_risk_tagged_tasks": int(tagged[i]),
+                }
+            )
+            momentum_dim = DimensionScore(
+                name="Momentum Trend",
+                score=momentum[i],
+                weight=plan.momentum_weight,
+                details={
+                    "recent_completions": int(recent_done[i]),
+                    "previous_completions": int(previous_done[i]),
+                    "momentum_ratio": round(float(momentum_ratio[i]), 2),
+                }
+            )
+        else:
+            delivery_dim = DimensionScore(
+                name="Delivery Health",
+                score=0,
+                weight=plan.delivery_weight,
+                details={"error": "No tasks found"}
+            )
+            risk_dim = DimensionScore(
+                name="Risk & Dependency Signals",
+                score=100,
+                weight=plan.risk_weight,
+                details={}
+            )
+            momentum_dim = DimensionScore(
+                name="Momentum Trend",
+                score=50,
+                weight=plan.momentum_weight,
+                details={"message": "No tasks found"}
+            )
+
+        if has_members[i]:
+            start = int(member_starts[i])
+            task_distribution = {
+                member_id: {
+                    "name": name,
+                    "total": int(member_tasks[start + j]),
+                    "done": int(member_done[start + j]),
+                    "in_progress": int(member_in_progress[start + j]),
+                }
+                for j, (member_id, name) in enumerate(zip(cols.member_ids[i], cols.member_names[i]))
+            }
+            workload_dim = DimensionScore(
+                name="Workload Balance",
+                score=workload[i],
+                weight=plan.workload_weight,
+                details={
+                    "task_distribution": task_distribution,
+                    "overloaded_members": int(overloaded[i]),
+                    "underutilized_members": int(underutilized[i]),
+                }
+            )
+        else:
+            workload_dim = DimensionScore(
+                name="Workload Balance",
+                score=0,
+                weight=plan.workload_weight,
+                details={"error": "No team members found"}
+            )
+
+        if cols.comm_counts[i] > 0:
+            sentiment_dim = DimensionScore(
+                name="Communication & Sentiment",
+                score=sentiment[i],
+                weight=plan.sentiment_weight,
+                details={
+                    "total_communications": int(cols.comm_counts[i]),
+                    "positive": int(positive[i]),
+                    "neutral": int(neutral[i]),
+                    "negative": int(negative[i]),
+                    "recent_negative_trend": bool(recent_negative_trend[i]),
+                }
+            )
+        else:
+            sentiment_dim = DimensionScore(
+                name="Communication & Sentiment",
+                score=50,
+                weight=plan.sentiment_weight,
+                details={"message": "No communications found"}
+            )
+
+        dimensions = [delivery_dim, workload_dim, sentiment_dim, risk_dim, momentum_dim]
+        results.append(calculator.build_health_score(
+            dimensions, now, previous_scores.get(project.id), plan
+        ))
+
+    return results
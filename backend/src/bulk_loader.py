@@ -0,0 +1,182 @@
+"""
+Streaming bulk loader for newline-delimited JSON exports.
+
+Each line is one record tagged with its type; a project record must come
+before the tasks and communications that reference it:
+
+    {"type": "project", "id": "proj_1", "name": "...", "description": "...", "created_at": "...", "team_members": [...]}
+    {"type": "task", "project_id": "proj_1", "id": "task_1", "title": "...", "status": "todo", ...}
+    {"type": "communication", "project_id": "proj_1", "id": "comm_1", "source": "email", ...}
+
+Files ending in .gz are decompressed on the fly. Lines are parsed with
+orjson when it is installed and validated in batches through a pydantic
+TypeAdapter, so memory stays at the loaded projects plus one batch.
+"""
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+import sys
+import os
+
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Handle imports
+try:
+    from .models import Project, Task, TeamMember, Communication
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project, Task, TeamMember, Communication
+
+
+_TASKS = TypeAdapter(List[Task])
+_COMMUNICATIONS = TypeAdapter(List[Communication])
+
+
+class LoadStats:
+    __slots__ = ("projects", "tasks", "communications", "skipped")
+
+    def __init__(self):
+        self.projects = 0
+        self.tasks = 0
+        self.communications = 0
+        self.skipped = 0  # records for unknown projects or of unknown type
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def open_lines(path: Union[str, Path]) -> Iterator[bytes]:
+    """Yield raw lines of a plain or gzip-compressed file, blank ones included."""
+    path = Path(path)
+    if path.suffix == ".gz":
+        # GzipFile.readline is slow per call; a buffered reader amortizes it
+        f = io.BufferedReader(gzip.open(path, "rb"), buffer_size=1 << 20)
+    else:
+        f = open(path, "rb", buffering=1 << 20)
+    with f:
+        yield from f
+
+
+class BulkLoader:
+    """Builds projects from a JSONL export, validating tasks and communications in batches."""
+
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+
+    def load(self, path: Union[str, Path]) -> Tuple[Dict[str, Project], LoadStats]:
+        projects: Dict[str, Project] = {}
+        stats = LoadStats()
+        # Pending (line number, project id, record) per record type
+        pending: Dict[str, List[tuple]] = {"task": [], "communication": []}
+
+        for line_number, line in enumerate(open_lines(path), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from e
+            record_type = record.pop("type", None)
+            if record_type == "project":
+                # Earlier records may belong to a project of the same id being replaced
+                self._flush(pending, projects, stats, path)
+                projects[record["id"]] = self._project(record, line_number, path)
+                stats.projects += 1
+            elif record_type in pending:
+                project_id = record.pop("project_id", None)
+                if project_id not in projects:
+                    stats.skipped += 1
+                    continue
+                batch = pending[record_type]
+                batch.append((line_number, project_id, record))
+                if len(batch) >= self.batch_size:
+                    self._flush_type(record_type, batch, projects, stats, path)
+            else:
+                stats.skipped += 1
+
+        self._flush(pending, projects, stats, path)
+        return projects, stats
+
+    def _project(self, record: dict, line_number: int, path) -> Project:
+        try:
+            return Project(
+                id=record["id"],
+                name=record["name"],
+                description=record.get("description", ""),
+                created_at=record["created_at"],
+                team_members=[
+                    TeamMember(id=tm["id"], name=tm["name"], email=tm["email"])
+                    for tm in record.get("team_members", [])
+                ]
+            )
+        except (KeyError, ValidationError) as e:
+            raise ValueError(f"{path}:{line_number}: invalid project record: {e}") from e
+
+    def _flush(self, pending: Dict[str, List[tuple]], projects: Dict[str, Project], stats: LoadStats, path) -> None:
+        for record_type, batch in pending.items():
+            self._flush_type(record_type, batch, projects, stats, path)
+
+    def _flush_type(self, record_type: str, batch: List[tuple], projects: Dict[str, Project], stats: LoadStats, path) -> None:
+        if not batch:
+            return
+        adapter = _TASKS if record_type == "task" else _COMMUNICATIONS
+        try:
+            items = adapter.validate_python([record for _, _, record in batch])
+        except ValidationError as e:
+            index = e.errors()[0]["loc"][0]
+            line_number = batch[index][0] if isinstance(index, int) else "?"
+            raise ValueError(f"{path}:{line_number}: invalid {record_type} record: {e}") from e
+        if record_type == "task":
+            # A later record with the same ID replaces the earlier task
+            by_project: Dict[str, List[Task]] = {}
+            for (_, project_id, _), task in zip(batch, items):
+                by_project.setdefault(project_id, []).append(task)
+            for project_id, tasks in by_project.items():
+                projects[project_id].add_tasks(tasks)
+            stats.tasks += len(items)
+        else:
+            for (_, project_id, _), communication in zip(batch, items):
+                projects[project_id].communications.append(communication)
+            stats.communications += len(items)
+        batch.clear()
+
+
+def write_jsonl(projects: Iterable[Project], path: Union[str, Path]) -> int:
+    """
+    Write projects in the loader's format; a .gz path is compressed. Projects
+    may come from a generator and are written as they arrive. Returns the line count.
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    lines = 0
+    with opener(path, "wt", encoding="utf-8") as f:
+        for project in projects:
+            for line in project_records(project):
+                f.write(line)
+                f.write("\n")
+                lines += 1
+    return lines
+
+
+def project_records(project: Project) -> Iterator[str]:
+    """JSONL lines for one project: the project record, then its tasks and communications."""
+    yield json.dumps({
+        "type": "project",
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "created_at": project.created_at.isoformat(),
+        "team_members": [{"id": tm.id, "name": tm.name, "email": tm.email} for tm in project.team_members],
+    })
+    for task in project.tasks:
+        yield '{"type":"task","project_id":' + json.dumps(project.id) + "," + task.model_dump_json()[1:]
+    for communication in project.communications:
+        yield '{"type":"communication","project_id":' + json.dumps(project.id) + "," + communication.model_dump_json()[1:]
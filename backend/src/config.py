@@ -5,6 +5,7 @@ from pathlib import Path
 # Get the project root directory (two levels up from this file)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 CONFIG_DIR = PROJECT_ROOT / "config"
+DATA_DIR = PROJECT_ROOT / "backend" / "data"
 
 
 def load_config(filename: str) -> dict:
@@ -14,17 +15,105 @@ def load_config(filename: str) -> dict:
         return json.load(f)
 
 
-def get_scoring_config() -> dict:
-    """Load scoring configuration."""
-    return load_config("scoring_config.json")
-
-
 def get_ai_prompts() -> dict:
     """Load AI prompt templates."""
     return load_config("ai_prompts.json")
 
 
+def get_sentiment_keywords() -> dict:
+    """Load keyword lists for the fallback sentiment classifier."""
+    return load_config("sentiment_keywords.json")
+
+
 # Environment variables
+# Server launch: "development" (one auto-reloading process) or "production" (preloaded, multi-worker)
+SERVER_MODE = os.getenv("SERVER_MODE", "development")
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8001"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "0"))  # production only; 0 means one per CPU
+SERVER_WORKER_TIMEOUT_SECONDS = int(os.getenv("SERVER_WORKER_TIMEOUT_SECONDS", "120"))
+
+
+def server_worker_count() -> int:
+    """Number of server processes sharing this machine."""
+    if SERVER_MODE != "production":
+        return 1
+    return SERVER_WORKERS or os.cpu_count() or 1
+
+
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "20"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+SENTIMENT_BATCH_TOKEN_BUDGET = int(os.getenv("SENTIMENT_BATCH_TOKEN_BUDGET", "2000"))
+SENTIMENT_BATCH_MAX_ITEMS = int(os.getenv("SENTIMENT_BATCH_MAX_ITEMS", "50"))
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+SENTIMENT_CACHE_TTL_SECONDS = float(os.getenv("SENTIMENT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+# SQLite file; empty keeps the cache in memory only. Production workers share one file by default
+SENTIMENT_CACHE_DB = os.getenv(
+    "SENTIMENT_CACHE_DB", str(DATA_DIR / "sentiment_cache.db") if SERVER_MODE == "production" else ""
+)
+
+# Scoring plans, compiled from this file and recompiled when it changes (0 disables the watcher)
+SCORING_CONFIG_PATH = os.getenv("SCORING_CONFIG_PATH", str(CONFIG_DIR / "scoring_config.json"))
+SCORING_CONFIG_WATCH_SECONDS = float(os.getenv("SCORING_CONFIG_WATCH_SECONDS", "5"))
+
+# Project data source: "mock", "tracker" (a REST issue tracker, see tools/fake_tracker.py)
+# or "file" (a JSONL export, see bulk_loader.py)
+DATA_SOURCE = os.getenv("DATA_SOURCE", "mock")
+DATA_FILE = os.getenv("DATA_FILE", "")
+BULK_LOAD_BATCH_SIZE = int(os.getenv("BULK_LOAD_BATCH_SIZE", "1000"))
+TRACKER_BASE_URL = os.getenv("TRACKER_BASE_URL", "http://localhost:8002")
+TRACKER_API_TOKEN = os.getenv("TRACKER_API_TOKEN", "")
+TRACKER_PAGE_SIZE = int(os.getenv("TRACKER_PAGE_SIZE", "100"))
+TRACKER_MAX_CONCURRENCY = int(os.getenv("TRACKER_MAX_CONCURRENCY", "8"))
+TRACKER_MAX_RETRIES = int(os.getenv("TRACKER_MAX_RETRIES", "3"))
+TRACKER_SYNC_INTERVAL_SECONDS = float(os.getenv("TRACKER_SYNC_INTERVAL_SECONDS", "60"))
+TRACKER_FULL_SYNC_INTERVAL_SECONDS = float(os.getenv("TRACKER_FULL_SYNC_INTERVAL_SECONDS", "3600"))
+TRACKER_SYNC_OVERLAP_SECONDS = float(os.getenv("TRACKER_SYNC_OVERLAP_SECONDS", "60"))
+
+# Recommendation cache: projects whose dimension scores fall in the same buckets share advice
+RECOMMENDATION_CACHE_BUCKET_WIDTH = float(os.getenv("RECOMMENDATION_CACHE_BUCKET_WIDTH", "10"))
+RECOMMENDATION_CACHE_TTL_SECONDS = float(os.getenv("RECOMMENDATION_CACHE_TTL_SECONDS", "3600"))
+RECOMMENDATION_CACHE_SIZE = int(os.getenv("RECOMMENDATION_CACHE_SIZE", "1024"))
+
+# LLM call telemetry (latency, tokens, outcomes), served at /api/admin/llm-telemetry
+LLM_TELEMETRY_WINDOW_SECONDS = float(os.getenv("LLM_TELEMETRY_WINDOW_SECONDS", "3600"))
+LLM_TELEMETRY_MAX_CALLS = int(os.getenv("LLM_TELEMETRY_MAX_CALLS", "10000"))
+LLM_TELEMETRY_LOG = os.getenv("LLM_TELEMETRY_LOG", "")  # JSONL file; empty disables the log
+ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")  # required in X-Admin-Token; admin endpoints are off when empty
+
+# Health report cache
+REPORT_CACHE_SIZE = int(os.getenv("REPORT_CACHE_SIZE", "1024"))
+REPORT_CACHE_TTL_SECONDS = float(os.getenv("REPORT_CACHE_TTL_SECONDS", "300"))
+
+# Background precompute of health reports into a shared SQLite table
+REPORT_STORE_DB = os.getenv("REPORT_STORE_DB", str(DATA_DIR / "health_reports.db"))
+PRECOMPUTE_ENABLED = os.getenv("PRECOMPUTE_ENABLED", "true").lower() == "true"
+PRECOMPUTE_INTERVAL_SECONDS = float(os.getenv("PRECOMPUTE_INTERVAL_SECONDS", "60"))
+PRECOMPUTE_STALE_SECONDS = float(os.getenv("PRECOMPUTE_STALE_SECONDS", "240"))
+PRECOMPUTE_BATCH_SIZE = int(os.getenv("PRECOMPUTE_BATCH_SIZE", "100"))
+PRECOMPUTE_RECOMMENDATION_INTERVAL_SECONDS = float(os.getenv("PRECOMPUTE_RECOMMENDATION_INTERVAL_SECONDS", "900"))
+
+# Server-Sent Events for live health changes
+HEALTH_EVENT_BUFFER_SIZE = int(os.getenv("HEALTH_EVENT_BUFFER_SIZE", "1000"))  # events kept for Last-Event-ID resume
+HEALTH_EVENT_KEEPALIVE_SECONDS = float(os.getenv("HEALTH_EVENT_KEEPALIVE_SECONDS", "15"))
+
+# Portfolio scoring: 0 workers means one per CPU; portfolios below the task threshold use threads
+PORTFOLIO_WORKERS = int(os.getenv("PORTFOLIO_WORKERS", "0"))
+PORTFOLIO_CHUNK_SIZE = int(os.getenv("PORTFOLIO_CHUNK_SIZE", "50"))
+PORTFOLIO_PROCESS_THRESHOLD_TASKS = int(os.getenv("PORTFOLIO_PROCESS_THRESHOLD_TASKS", "20000"))
+
+# Score history (SQLite, shared by every worker that points at the same file)
+SCORE_HISTORY_DB = os.getenv("SCORE_HISTORY_DB", str(DATA_DIR / "score_history.db"))
+SCORE_HISTORY_FLUSH_SECONDS = float(os.getenv("SCORE_HISTORY_FLUSH_SECONDS", "1"))
+SCORE_HISTORY_BASELINE_SECONDS = float(os.getenv("SCORE_HISTORY_BASELINE_SECONDS", "900"))  # trend compares against a score at least this old
+SCORE_HISTORY_MIN_INTERVAL_SECONDS = float(os.getenv("SCORE_HISTORY_MIN_INTERVAL_SECONDS", "60"))
+SCORE_HISTORY_RETENTION_DAYS = float(os.getenv("SCORE_HISTORY_RETENTION_DAYS", "365"))
+SCORE_HISTORY_DOWNSAMPLE_AFTER_DAYS = float(os.getenv("SCORE_HISTORY_DOWNSAMPLE_AFTER_DAYS", "7"))
+SCORE_HISTORY_DOWNSAMPLE_BUCKET_SECONDS = float(os.getenv("SCORE_HISTORY_DOWNSAMPLE_BUCKET_SECONDS", "3600"))
 
+# Project timelines behind history queries: the longest window they can answer
+SNAPSHOT_RETENTION_DAYS = float(os.getenv("SNAPSHOT_RETENTION_DAYS", "90"))
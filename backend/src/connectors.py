@@ -0,0 +1,240 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Collection, Dict, List, Optional
+import sys
+import os
+
+import httpx
+
+# Handle imports
+try:
+    from .models import Project, Task, TeamMember, Communication
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project, Task, TeamMember, Communication
+
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+TASK_TIMES = ("created_at", "updated_at", "due_date")
+
+
+class ProjectChanges:
+    """Tasks and communications of one project updated since a sync cursor, or all of them if ``full``."""
+
+    __slots__ = ("project", "tasks", "communications", "full")
+
+    def __init__(self, project: Project, tasks: List[Task], communications: List[Communication], full: bool = False):
+        self.project = project  # metadata and team; tasks and communications are empty
+        self.tasks = tasks
+        self.communications = communications
+        self.full = full
+
+
+class SyncResult:
+    """Result of one sync; pass ``cursor`` as ``updated_since`` next time."""
+
+    __slots__ = ("changes", "cursor", "full")
+
+    def __init__(self, changes: List[ProjectChanges], cursor: Optional[datetime], full: bool):
+        self.changes = changes
+        self.cursor = cursor
+        self.full = full
+
+    def to_projects(self) -> List[Project]:
+        """Build complete projects; only meaningful for a full sync."""
+        projects = []
+        for change in self.changes:
+            project = change.project
+            for task in change.tasks:
+                project.add_task(task)
+            project.communications.extend(change.communications)
+            projects.append(project)
+        return projects
+
+
+class TrackerConnector(ABC):
+    """Source of projects for the DataAdapter (Jira, Notion, ...)."""
+
+    @abstractmethod
+    async def sync(
+        self,
+        updated_since: Optional[datetime] = None,
+        known_project_ids: Optional[Collection[str]] = None
+    ) -> SyncResult:
+        """
+        Fetch every project, with only tasks and communications changed at or
+        after ``updated_since``. Projects not in ``known_project_ids`` are
+        fetched in full, so one first seen during an incremental sync arrives complete.
+        """
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RestTrackerConnector(TrackerConnector):
+    """
+    Connector for a paginated REST tracker API:
+
+        GET /projects
+        GET /projects/{id}/tasks?page=&page_size=&updated_since=
+        GET /projects/{id}/communications?page=&page_size=&updated_since=
+
+    Paged endpoints return ``{"items": [...], "page": n, "total_pages": n}``.
+    The first page reveals the page count and the remaining pages are fetched
+    concurrently; every request shares one pooled client, a concurrency cap,
+    and retries with exponential backoff on network errors, 429 and 5xx.
+
+    The cursor is the time the sync started minus ``overlap_seconds``, not
+    the newest item seen: an item written while a sync is paging, or stamped
+    by a tracker clock running slightly behind ours, still falls inside the
+    next sync's window. Items inside the overlap come back again, and an
+    item that moves between pages while they are fetched can appear twice.
+    Items are therefore de-duplicated by ID, keeping the latest update, and
+    consumers should treat a repeated item as unchanged.
+
+    Times with a UTC offset are converted to naive local time, the form
+    scoring compares against ``datetime.now()``; the cursor is sent with
+    the local offset so the tracker can compare it with its own times.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: Optional[str] = None,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        timeout: float = 10,
+        overlap_seconds: float = 60,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        headers = {"Authorization": f"Bearer {api_token}"} if api_token else None
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            transport=transport
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.requests = 0
+        self.retries = 0
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def sync(
+        self,
+        updated_since: Optional[datetime] = None,
+        known_project_ids: Optional[Collection[str]] = None
+    ) -> SyncResult:
+        started_at = datetime.now()
+        data = await self._get("/projects")
+        changes = await asyncio.gather(*(
+            self._project_changes(
+                item,
+                updated_since if known_project_ids is None or item["id"] in known_project_ids else None
+            )
+            for item in data["projects"]
+        ))
+        return SyncResult(list(changes), started_at - self.overlap, full=updated_since is None)
+
+    async def _project_changes(self, item: dict, updated_since: Optional[datetime]) -> ProjectChanges:
+        project = _local_times(Project(
+            id=item["id"],
+            name=item["name"],
+            description=item.get("description", ""),
+            created_at=item["created_at"],
+            team_members=[
+                TeamMember(id=tm["id"], name=tm["name"], email=tm["email"])
+                for tm in item.get("team_members", [])
+            ]
+        ), ("created_at",))
+        tasks, communications = await asyncio.gather(
+            self._get_all_pages(f"/projects/{project.id}/tasks", updated_since),
+            self._get_all_pages(f"/projects/{project.id}/communications", updated_since)
+        )
+        return ProjectChanges(
+            project,
+            _latest_by_id((_local_times(Task.model_validate(task), TASK_TIMES) for task in tasks), "updated_at"),
+            _latest_by_id(
+                (_local_times(Communication.model_validate(comm), ("timestamp",)) for comm in communications),
+                "timestamp"
+            ),
+            full=updated_since is None
+        )
+
+    async def _get_all_pages(self, path: str, updated_since: Optional[datetime]) -> List[dict]:
+        params = {"page_size": self.page_size}
+        if updated_since is not None:
+            params["updated_since"] = updated_since.astimezone().isoformat()
+        first = await self._get(path, {**params, "page": 1})
+        rest = await asyncio.gather(*(
+            self._get(path, {**params, "page": page})
+            for page in range(2, first.get("total_pages", 1) + 1)
+        ))
+        items = list(first["items"])
+        for page in rest:
+            items.extend(page["items"])
+        return items
+
+    async def _get(self, path: str, params: Optional[Dict] = None) -> dict:
+        if self._semaphore is None:
+            # Created lazily so it binds to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    self.requests += 1
+                    response = await self._client.get(path, params=params)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()
+                retry_after = response.headers.get("Retry-After")
+                error: Exception = httpx.HTTPStatusError(
+                    f"{response.status_code} from {path}", request=response.request, response=response
+                )
+            except httpx.TransportError as e:
+                error = e
+            if attempt >= self.max_retries:
+                raise error
+            attempt += 1
+            self.retries += 1
+            delay = self.backoff_seconds * 2 ** (attempt - 1) * (0.5 + random.random())
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+
+
+def _latest_by_id(items, time_field: str) -> list:
+    """Drop repeated items, keeping the most recently updated copy of each ID in first-seen order."""
+    latest: Dict[str, object] = {}
+    for item in items:
+        previous = latest.get(item.id)
+        if previous is None or getattr(item, time_field) >= getattr(previous, time_field):
+            latest[item.id] = item
+    return list(latest.values())
+
+
+def _local_time(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a time with a UTC offset to naive local time; naive times are taken as local already."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _local_times(item, fields):
+    """Convert a model's time fields to naive local time in place and return it."""
+    for field in fields:
+        setattr(item, field, _local_time(getattr(item, field)))
+    return item
@@ -0,0 +1,58 @@
+"""
+Order-independent content hashes of projects.
+
+A project's hash is the sum, modulo 2**63, of stable 64-bit digests of its
+header, its tasks and its communications, so replacing a task or appending
+a communication updates it without rehashing the rest. The hash depends
+only on the data, so every worker process holding the same project
+computes the same value, unlike the adapter's per-process version counter.
+"""
+import hashlib
+from typing import Optional
+import sys
+import os
+
+from pydantic import BaseModel
+
+# Handle imports
+try:
+    from .models import Project
+    from .serialization import dump_model, dumps
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project
+    from serialization import dump_model, dumps
+
+MASK = (1 << 63) - 1  # fits SQLite's signed 64-bit INTEGER
+
+
+def _digest(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def item_hash(model: BaseModel) -> int:
+    """Digest of one task or communication."""
+    return _digest(dump_model(model))
+
+
+def project_content_hash(project: Project) -> int:
+    """Hash of a project's header, team, tasks and communications, in one pass."""
+    header = dumps([
+        project.id, project.name, project.description, project.created_at.isoformat(),
+        [[tm.id, tm.name, tm.email] for tm in project.team_members],
+    ])
+    total = _digest(header.encode())
+    for task in project.tasks:
+        total += item_hash(task)
+    for communication in project.communications:
+        total += item_hash(communication)
+    return total & MASK
+
+
+def replace_item(content_hash: int, old: Optional[BaseModel], new: Optional[BaseModel]) -> int:
+    """Update a project hash for one item added, removed or replaced."""
+    if old is not None:
+        content_hash -= item_hash(old)
+    if new is not None:
+        content_hash += item_hash(new)
+    return content_hash & MASK
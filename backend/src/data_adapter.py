@@ -1,71 +1,349 @@
-from typing import List, Optional
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
 import sys
 import os
 
 # Handle imports
 try:
-    from .models import Project
+    from .models import Project, Task, TeamMember, Communication
     from .mock_data import generate_mock_project, generate_multiple_projects
+    from .aggregates import ProjectAggregates
+    from .snapshots import SnapshotStore
+    from .connectors import TrackerConnector, ProjectChanges, SyncResult
+    from .bulk_loader import BulkLoader, LoadStats
+    from .content_hash import project_content_hash, replace_item
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from models import Project
+    from models import Project, Task, TeamMember, Communication
     from mock_data import generate_mock_project, generate_multiple_projects
+    from aggregates import ProjectAggregates
+    from snapshots import SnapshotStore
+    from connectors import TrackerConnector, ProjectChanges, SyncResult
+    from bulk_loader import BulkLoader, LoadStats
+    from content_hash import project_content_hash, replace_item
 
 
 class DataAdapter:
     """
     Data adapter layer that abstracts data fetching.
-    Currently uses mock data, but designed to support real API integrations in the future.
+    Uses mock data, projects synced from a tracker through a TrackerConnector,
+    or projects bulk loaded from a JSONL export.
     """
     
-    def __init__(self, use_mock: bool = True):
+    def __init__(
+        self,
+        use_mock: bool = True,
+        connector: Optional[TrackerConnector] = None,
+        full_sync_interval_seconds: float = 3600
+    ):
         self.use_mock = use_mock
-        self._mock_projects_cache = None
+        self.connector = connector
+        self.full_sync_interval_seconds = full_sync_interval_seconds
+        self._projects_cache = None
+        self._sync_cursor: Optional[datetime] = None
+        self._last_full_sync = 0.0
+        self._aggregates: Dict[str, ProjectAggregates] = {}
+        self._versions: Dict[str, int] = {}
+        self._content_hashes: Dict[str, int] = {}
+        self._change_listeners: List[Callable[[str, int], None]] = []
+        self._snapshots = SnapshotStore()
     
     def get_project(self, project_id: str) -> Optional[Project]:
         """Fetch a single project by ID."""
         if self.use_mock:
             # For mock, generate or retrieve from cache
-            if self._mock_projects_cache is None:
-                self._mock_projects_cache = {p.id: p for p in generate_multiple_projects()}
+            if self._projects_cache is None:
+                self._projects_cache = {p.id: p for p in generate_multiple_projects()}
             
-            if project_id in self._mock_projects_cache:
-                return self._mock_projects_cache[project_id]
+            if project_id in self._projects_cache:
+                return self._projects_cache[project_id]
             
             # Generate a new project if not in cache
             return generate_mock_project(project_id, f"Project {project_id}")
         
-        # Future: Real API integration
-        # return self._fetch_from_api(project_id)
-        raise NotImplementedError("Real API integration not yet implemented")
+        # Synced from the tracker or bulk loaded
+        return (self._projects_cache or {}).get(project_id)
     
     def get_all_projects(self) -> List[Project]:
         """Fetch all projects."""
         if self.use_mock:
-            if self._mock_projects_cache is None:
-                self._mock_projects_cache = {p.id: p for p in generate_multiple_projects()}
-            return list(self._mock_projects_cache.values())
+            if self._projects_cache is None:
+                self._projects_cache = {p.id: p for p in generate_multiple_projects()}
+            return list(self._projects_cache.values())
         
-        # Future: Real API integration
-        # return self._fetch_all_from_api()
-        raise NotImplementedError("Real API integration not yet implemented")
+        return list((self._projects_cache or {}).values())
+    
+    def holds(self, project: Project) -> bool:
+        """Whether a project is one the adapter stores, rather than mock data generated for an unknown ID."""
+        return bool(self._projects_cache) and self._projects_cache.get(project.id) is project
+    
+    def get_aggregates(self, project: Project) -> ProjectAggregates:
+        """Get the incremental scoring aggregates for a project, building them on first use."""
+        aggregates = self._aggregates.get(project.id)
+        if aggregates is None:
+            aggregates = ProjectAggregates.from_project(project)
+            # Projects generated on the fly are not stored, so neither are their aggregates
+            if self.holds(project):
+                self._aggregates[project.id] = aggregates
+        return aggregates
+    
+    def update_task(self, project_id: str, task: Task) -> Optional[Project]:
+        """Add or replace a task, updating the project's aggregates in place."""
+        project = self.get_project(project_id)
+        if not project:
+            return None
+        self._apply_task(project, task)
+        self.invalidate(project_id)
+        return project
+    
+    def add_communication(self, project_id: str, communication: Communication) -> Optional[Project]:
+        """Append a communication, updating the project's aggregates in place."""
+        project = self.get_project(project_id)
+        if not project:
+            return None
+        self._apply_communication(project, communication)
+        self.invalidate(project_id)
+        return project
+    
+    def _apply_task(self, project: Project, task: Task) -> None:
+        aggregates = self.get_aggregates(project)
+        self._track(project)
+        previous = project.get_task(task.id)
+        project.update_task(task)
+        aggregates.apply_task_change(previous, task)
+        if project.id in self._content_hashes:
+            self._content_hashes[project.id] = replace_item(self._content_hashes[project.id], previous, task)
+        self._snapshots.record_task(project.id, task)
+    
+    def _apply_communication(self, project: Project, communication: Communication) -> None:
+        aggregates = self.get_aggregates(project)
+        self._track(project)
+        project.communications.append(communication)
+        aggregates.add_communication(communication)
+        if project.id in self._content_hashes:
+            self._content_hashes[project.id] = replace_item(self._content_hashes[project.id], None, communication)
+        self._snapshots.record_communication(project.id, communication)
+    
+    async def sync(self) -> int:
+        """
+        Pull changes from the connector. The first sync loads every project;
+        later ones fetch only what changed since the last cursor and apply it
+        incrementally. Returns the number of projects that changed.
+
+        Project metadata and teams are refreshed on every sync, and projects
+        the tracker no longer lists are dropped. Deleted tasks and
+        communications never show up in an incremental sync, so every
+        ``full_sync_interval_seconds`` the sync fetches everything and
+        replaces projects that lost items.
+        """
+        if self.connector is None:
+            raise RuntimeError("No tracker connector configured")
+        if self._projects_cache is None:
+            result = await self.connector.sync(None)
+            self._projects_cache = {p.id: p for p in result.to_projects()}
+            self._sync_cursor = result.cursor
+            self._last_full_sync = time.monotonic()
+            return len(self._projects_cache)
+        full = time.monotonic() - self._last_full_sync >= self.full_sync_interval_seconds
+        result = await self.connector.sync(
+            None if full else self._sync_cursor, known_project_ids=set(self._projects_cache)
+        )
+        changed = self._apply_sync(result)
+        self._sync_cursor = result.cursor
+        if full:
+            self._last_full_sync = time.monotonic()
+        return changed
+    
+    def _apply_sync(self, result: SyncResult) -> int:
+        changed = 0
+        listed = set()
+        for change in result.changes:
+            listed.add(change.project.id)
+            project = self._projects_cache.get(change.project.id)
+            if project is None or (change.full and _lost_items(project, change)):
+                # New projects were fetched in full; known ones that lost items are replaced
+                self._replace_project(SyncResult([change], None, full=True).to_projects()[0])
+                changed += 1
+                continue
+            updated = self._apply_metadata(project, change.project)
+            # The cursor is inclusive, so items at the boundary come back again;
+            # a task is applied only if it is newer than, or differs from, the stored one
+            tasks = [task for task in change.tasks if _is_newer(task, project.get_task(task.id))]
+            seen = {c.id for c in project.communications} if change.communications else set()
+            communications = [c for c in change.communications if c.id not in seen]
+            for task in tasks:
+                self._apply_task(project, task)
+            for communication in communications:
+                self._apply_communication(project, communication)
+            if updated or tasks or communications:
+                self.invalidate(project.id)
+                changed += 1
+        # Every sync lists all projects, so one missing from it was deleted in the tracker
+        for project_id in set(self._projects_cache) - listed:
+            self._forget_project(project_id)
+            changed += 1
+        return changed
+    
+    def _apply_metadata(self, project: Project, synced: Project) -> bool:
+        """Copy a synced project's name, description and team onto the stored project. Returns whether any changed."""
+        changed = False
+        for field in ("name", "description", "created_at"):
+            if getattr(project, field) != getattr(synced, field):
+                setattr(project, field, getattr(synced, field))
+                changed = True
+        team = [(tm.id, tm.name, tm.email) for tm in synced.team_members]
+        if team != [(tm.id, tm.name, tm.email) for tm in project.team_members]:
+            # Assignments come from the stored tasks; a new list rebuilds the project's member index
+            index = project.assignee_index()
+            project.team_members = [
+                TeamMember(id=tm.id, name=tm.name, email=tm.email, tasks=[t.id for t in index.tasks_for(tm.id)])
+                for tm in synced.team_members
+            ]
+            changed = True
+        if changed:
+            # The header is part of the content hash; rehash on next use
+            self._content_hashes.pop(project.id, None)
+        return changed
+    
+    def _replace_project(self, project: Project) -> None:
+        """Store a project in place of any cached one with the same ID, dropping state derived from the old one."""
+        self._projects_cache[project.id] = project
+        self._aggregates.pop(project.id, None)
+        self._content_hashes.pop(project.id, None)
+        self._snapshots.forget(project.id)
+        self.invalidate(project.id)
+    
+    def _forget_project(self, project_id: str) -> None:
+        del self._projects_cache[project_id]
+        self._aggregates.pop(project_id, None)
+        self._content_hashes.pop(project_id, None)
+        self._snapshots.forget(project_id)
+        self.invalidate(project_id)
+    
+    def load_file(self, path: str, batch_size: int = 1000) -> LoadStats:
+        """
+        Bulk load projects from a JSONL export (optionally gzip-compressed) into
+        the cache. Loaded projects replace cached ones with the same ID.
+        """
+        projects, stats = BulkLoader(batch_size).load(path)
+        if self._projects_cache is None:
+            # Loaded data takes the place of generated mock projects
+            self._projects_cache = {}
+        for project in projects.values():
+            self._replace_project(project)
+        return stats
+    
+    async def run_sync_loop(self, interval_seconds: float) -> None:
+        """Sync every ``interval_seconds``; meant to run as a background task after the first sync."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.sync()
+            except Exception as e:
+                print(f"Error syncing from tracker: {e}")
+    
+    def get_project_version(self, project_id: str) -> int:
+        """
+        Content version of a project; increases every time the adapter sees a change.
+        Versions are counted per process; use get_content_hash to compare across workers.
+        """
+        return self._versions.get(project_id, 0)
+    
+    def get_content_hash(self, project: Project) -> int:
+        """
+        Hash of a project's content. Unlike the version it is the same in every
+        worker process holding the same data, so it keys reports shared between
+        workers. Built with one pass on first use and then updated per change.
+        """
+        content_hash = self._content_hashes.get(project.id)
+        if content_hash is None:
+            content_hash = project_content_hash(project)
+            if self.holds(project):
+                self._content_hashes[project.id] = content_hash
+        return content_hash
+    
+    async def get_content_hashes(self, projects: List[Project]) -> List[int]:
+        """
+        Content hashes of many projects, hashing off the event loop. Cached hashes
+        are returned as they are; the rest are computed in the executor from
+        snapshots of the projects' item lists, and kept only if the project did
+        not change while they were computed.
+        """
+        hashes = [self._content_hashes.get(project.id) for project in projects]
+        cold = [
+            (i, self._versions.get(project.id, 0), _hash_snapshot(project))
+            for i, (project, content_hash) in enumerate(zip(projects, hashes))
+            if content_hash is None
+        ]
+        if not cold:
+            return hashes
+        computed = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [project_content_hash(snapshot) for _, _, snapshot in cold]
+        )
+        for (i, version, _), content_hash in zip(cold, computed):
+            project = projects[i]
+            hashes[i] = content_hash
+            if self.holds(project) and self._versions.get(project.id, 0) == version:
+                self._content_hashes.setdefault(project.id, content_hash)
+        return hashes
+    
+    def invalidate(self, project_id: str) -> int:
+        """Record that a project changed and notify change listeners. Returns the new version."""
+        version = self._versions.get(project_id, 0) + 1
+        self._versions[project_id] = version
+        for listener in self._change_listeners:
+            listener(project_id, version)
+        return version
+    
+    def add_change_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Register a callback invoked with (project_id, version) whenever a project changes."""
+        self._change_listeners.append(listener)
     
     def get_project_history(self, project_id: str, days: int = 30) -> List[Project]:
         """
-        Get historical project snapshots for trend analysis.
-        For mock data, returns current project (real implementation would store snapshots).
+        Get historical project snapshots for trend analysis, oldest first.
+        Snapshots are evenly spaced over the window and rebuilt from the project's
+        timeline; history starts when the adapter first saw the project.
         """
         project = self.get_project(project_id)
-        if project:
-            return [project]  # Mock: return current state
-        return []
-    
-    # Future methods for real API integration:
-    # def _fetch_from_api(self, project_id: str) -> Project:
-    #     """Fetch project from real API (Notion, Jira, etc.)"""
-    #     pass
-    #
-    # def _fetch_all_from_api(self) -> List[Project]:
-    #     """Fetch all projects from real API"""
-    #     pass
+        if not project:
+            return []
+        if not self._track(project):
+            return [project]
+        return [snapshot for _, snapshot in self._snapshots.sample(project_id, days)]
+    
+    def _track(self, project: Project) -> bool:
+        """Start recording a project's timeline. Only stored projects are tracked."""
+        if self._snapshots.is_tracked(project.id):
+            return True
+        if self.holds(project):
+            self._snapshots.track(project)
+            return True
+        return False
+
+
+def _is_newer(task: Task, stored: Optional[Task]) -> bool:
+    if stored is None:
+        return True
+    return task.updated_at > stored.updated_at or (task.updated_at == stored.updated_at and task != stored)
+
+
+def _hash_snapshot(project: Project) -> Project:
+    """Shallow copy of a project whose lists stay fixed while it is hashed in another thread."""
+    return project.model_copy(update={
+        "tasks": list(project.tasks),
+        "communications": list(project.communications),
+        "team_members": list(project.team_members),
+    })
+
 
+def _lost_items(project: Project, change: ProjectChanges) -> bool:
+    """Whether a full fetch of a project is missing tasks or communications the stored project holds."""
+    task_ids = {task.id for task in change.tasks}
+    communication_ids = {c.id for c in change.communications}
+    return (
+        any(task.id not in task_ids for task in project.tasks)
+        or any(c.id not in communication_ids for c in project.communications)
+    )
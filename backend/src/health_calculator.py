@@ -1,50 +1,157 @@
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import Callable, ContextManager, List, Dict, Optional
 import sys
 import os
 
 # Handle imports
 try:
     from .models import (
-        Project, Task, TaskStatus, HealthScore, HealthStatus,
-        DimensionScore, Risk
+        Project, Task, TeamMember, Communication, TaskStatus, AssigneeIndex, HealthScore,
+        HealthStatus, DimensionScore, Risk
     )
-    from .config import get_scoring_config
+    from .scoring_plan import ScoringPlan, ScoringPlans, current_plans
+    from .batch_scoring import score_projects_batch
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     from models import (
-        Project, Task, TaskStatus, HealthScore, HealthStatus,
-        DimensionScore, Risk
+        Project, Task, TeamMember, Communication, TaskStatus, AssigneeIndex, HealthScore,
+        HealthStatus, DimensionScore, Risk
     )
-    from config import get_scoring_config
+    from scoring_plan import ScoringPlan, ScoringPlans, current_plans
+    from batch_scoring import score_projects_batch
+
+
+# Tags that mark a task as a high-risk item
+RISK_KEYWORDS = frozenset(["urgent", "critical", "blocker", "bug"])
+
+
+class ScoringSignals:
+    """
+    Counters behind every health dimension, gathered in a single pass over
+    a project's tasks and communications.
+    """
+
+    __slots__ = (
+        "now", "total_tasks", "done", "in_progress", "todo",
+        "aging_tasks", "overdue_tasks", "upcoming_deadlines",
+        "blocked_tasks", "reopened_tasks", "high_risk_tagged_tasks",
+        "recent_completions", "previous_completions", "assignees",
+        "total_communications", "sentiment_counts",
+        "recent_communications", "recent_negative",
+    )
+
+    def __init__(self, now: datetime, assignees: Optional[AssigneeIndex] = None):
+        self.now = now
+        self.total_tasks = 0
+        self.done = 0
+        self.in_progress = 0
+        self.todo = 0
+        self.aging_tasks = 0
+        self.overdue_tasks = 0
+        self.upcoming_deadlines = 0
+        self.blocked_tasks = 0
+        self.reopened_tasks = 0
+        self.high_risk_tagged_tasks = 0
+        self.recent_completions = 0
+        self.previous_completions = 0
+        self.assignees = assignees or AssigneeIndex()
+        self.total_communications = 0
+        self.sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
+        self.recent_communications = 0
+        self.recent_negative = 0
 
 
 class HealthCalculator:
-    def __init__(self):
-        self.config = get_scoring_config()
-        self.weights = self.config["dimension_weights"]
-        self.thresholds = self.config["health_thresholds"]
-        self.aging_threshold = self.config["aging_task_threshold_days"]
-        self.overload_threshold = self.config["overload_threshold_tasks"]
-        self.underutilization_threshold = self.config["underutilization_threshold_tasks"]
+    def __init__(self, plans: Optional[ScoringPlans] = None):
+        # Fixed plans, or None to follow the process-wide plans a ScoringPlanWatcher may swap
+        self._plans = plans
+        self.risk_keywords = RISK_KEYWORDS
+        # Optional hook returning a context manager that times a named stage (see metrics.py)
+        self.stage_timer: Optional[Callable[[str], ContextManager]] = None
+    
+    @property
+    def plans(self) -> ScoringPlans:
+        return self._plans if self._plans is not None else current_plans()
+    
+    def plan_for(self, project_id: Optional[str]) -> ScoringPlan:
+        """The compiled scoring plan of a project's profile."""
+        return self.plans.for_project(project_id)
+    
+    def _stage(self, name: str) -> ContextManager:
+        return self.stage_timer(name) if self.stage_timer is not None else nullcontext()
     
     def calculate_health_score(self, project: Project, previous_score: float = None) -> HealthScore:
         """Calculate overall health score for a project."""
-        dimensions = [
-            self._calculate_delivery_health(project),
-            self._calculate_workload_balance(project),
-            self._calculate_communication_sentiment(project),
-            self._calculate_risk_signals(project),
-            self._calculate_momentum_trend(project, previous_score),
-        ]
+        plan = self.plan_for(project.id)
+        with self._stage("collect_signals"):
+            signals = self.collect_signals(project, datetime.now(), plan)
+        return self.score_signals(signals, project.team_members, previous_score, plan)
+    
+    def calculate_health_score_from_aggregates(
+        self,
+        aggregates,
+        team_members: List[TeamMember],
+        previous_score: float = None,
+        project_id: Optional[str] = None
+    ) -> HealthScore:
+        """Calculate the health score from incrementally maintained ProjectAggregates."""
+        plan = self.plan_for(project_id)
+        with self._stage("collect_signals"):
+            signals = aggregates.to_signals(datetime.now(), plan.aging_threshold_days)
+        return self.score_signals(signals, team_members, previous_score, plan)
+    
+    def calculate_health_scores_batch(
+        self,
+        projects: List[Project],
+        previous_scores: Optional[Dict[str, float]] = None,
+        plans: Optional[ScoringPlans] = None
+    ) -> List[HealthScore]:
+        """
+        Calculate health scores for many projects at once.
+        Uses vectorized column reductions; results match calculate_health_score.
+        """
+        return score_projects_batch(self, projects, previous_scores, plans=plans)
+    
+    def score_signals(
+        self,
+        signals: ScoringSignals,
+        team_members: List[TeamMember],
+        previous_score: float = None,
+        plan: Optional[ScoringPlan] = None
+    ) -> HealthScore:
+        """Build the full health score from pre-collected signals."""
+        plan = plan or self.plans.default
+        with self._stage("delivery"):
+            delivery = self._delivery_dimension(signals, plan)
+        with self._stage("workload"):
+            workload = self._workload_dimension(signals, team_members, plan)
+        with self._stage("sentiment"):
+            sentiment = self._sentiment_dimension(signals, plan)
+        with self._stage("risk"):
+            risk = self._risk_dimension(signals, plan)
+        with self._stage("momentum"):
+            momentum = self._momentum_dimension(signals, plan, previous_score, delivery, workload)
+        dimensions = [delivery, workload, sentiment, risk, momentum]
+        return self.build_health_score(dimensions, signals.now, previous_score, plan)
+    
+    def build_health_score(
+        self,
+        dimensions: List[DimensionScore],
+        calculated_at: datetime,
+        previous_score: float = None,
+        plan: Optional[ScoringPlan] = None
+    ) -> HealthScore:
+        """Combine dimension scores into the overall score, status and trend."""
+        plan = plan or self.plans.default
         
         # Calculate weighted overall score
         overall_score = sum(dim.score * dim.weight for dim in dimensions)
         
         # Determine status
-        if overall_score >= self.thresholds["healthy"]:
+        if overall_score >= plan.healthy_threshold:
             status = HealthStatus.HEALTHY
-        elif overall_score >= self.thresholds["watch"]:
+        elif overall_score >= plan.watch_threshold:
             status = HealthStatus.WATCH
         else:
             status = HealthStatus.AT_RISK
@@ -52,9 +159,9 @@ class HealthCalculator:
         # Determine trend
         trend = None
         if previous_score is not None:
-            if overall_score > previous_score + 5:
+            if overall_score > previous_score + plan.trend_margin:
                 trend = "improving"
-            elif overall_score < previous_score - 5:
+            elif overall_score < previous_score - plan.trend_margin:
                 trend = "declining"
             else:
                 trend = "stable"
@@ -63,279 +170,311 @@ class HealthCalculator:
             overall_score=round(overall_score, 1),
             status=status,
             dimensions=dimensions,
-            calculated_at=datetime.now(),
+            calculated_at=calculated_at,
             previous_score=previous_score,
             trend=trend
         )
     
+    def collect_signals(self, project: Project, now: datetime, plan: Optional[ScoringPlan] = None) -> ScoringSignals:
+        """Walk tasks and communications once, collecting every dimension's counters."""
+        signals = ScoringSignals(now, project.assignee_index())
+        aging_threshold = (plan or self.plan_for(project.id)).aging_threshold_days
+        week_ago = now - timedelta(days=7)
+        two_weeks_ago = now - timedelta(days=14)
+        
+        for t in project.tasks:
+            status = t.status
+            is_done = status == TaskStatus.DONE
+            
+            if is_done:
+                signals.done += 1
+                if t.updated_at >= week_ago:
+                    signals.recent_completions += 1
+                elif t.updated_at >= two_weeks_ago:
+                    signals.previous_completions += 1
+            elif status == TaskStatus.IN_PROGRESS:
+                signals.in_progress += 1
+            elif status == TaskStatus.TODO:
+                signals.todo += 1
+            
+            due_date = t.due_date
+            if not is_done:
+                if (now - t.updated_at).days > aging_threshold:
+                    signals.aging_tasks += 1
+                if due_date and due_date < now:
+                    signals.overdue_tasks += 1
+            if due_date and due_date > now and (due_date - now).days <= 7:
+                signals.upcoming_deadlines += 1
+            
+            if t.is_blocked:
+                signals.blocked_tasks += 1
+            if t.is_reopened:
+                signals.reopened_tasks += 1
+            if t.tags and any(tag.lower() in self.risk_keywords for tag in t.tags):
+                signals.high_risk_tagged_tasks += 1
+        signals.total_tasks = len(project.tasks)
+        
+        self._collect_communication_signals(signals, project.communications)
+        return signals
+    
+    def _collect_communication_signals(self, signals: ScoringSignals, communications: List[Communication]) -> None:
+        now = signals.now
+        sentiment_counts = signals.sentiment_counts
+        for comm in communications:
+            sentiment = comm.sentiment
+            if sentiment:
+                sentiment_counts[sentiment] = sentiment_counts.get(sentiment, 0) + 1
+            if (now - comm.timestamp).days <= 7:
+                signals.recent_communications += 1
+                if sentiment == "negative":
+                    signals.recent_negative += 1
+        signals.total_communications = len(communications)
+    
     def _calculate_delivery_health(self, project: Project) -> DimensionScore:
-        """Calculate delivery health score (30% weight)."""
-        tasks = project.tasks
-        if not tasks:
+        """Calculate delivery health score (30% weight by default)."""
+        plan = self.plan_for(project.id)
+        return self._delivery_dimension(self.collect_signals(project, datetime.now(), plan), plan)
+    
+    def _calculate_workload_balance(self, project: Project) -> DimensionScore:
+        """Calculate workload balance score (20% weight by default)."""
+        plan = self.plan_for(project.id)
+        signals = self.collect_signals(project, datetime.now(), plan)
+        return self._workload_dimension(signals, project.team_members, plan)
+    
+    def _calculate_communication_sentiment(self, project: Project) -> DimensionScore:
+        """Calculate communication & sentiment score (25% weight by default)."""
+        plan = self.plan_for(project.id)
+        return self._sentiment_dimension(self.collect_signals(project, datetime.now(), plan), plan)
+    
+    def _calculate_risk_signals(self, project: Project) -> DimensionScore:
+        """Calculate risk & dependency signals score (15% weight by default)."""
+        plan = self.plan_for(project.id)
+        return self._risk_dimension(self.collect_signals(project, datetime.now(), plan), plan)
+    
+    def _calculate_momentum_trend(self, project: Project, previous_score: float = None) -> DimensionScore:
+        """Calculate momentum trend score (10% weight by default)."""
+        plan = self.plan_for(project.id)
+        signals = self.collect_signals(project, datetime.now(), plan)
+        if previous_score is None:
+            return self._momentum_dimension(signals, plan)
+        return self._momentum_dimension(
+            signals,
+            plan,
+            previous_score,
+            self._delivery_dimension(signals, plan),
+            self._workload_dimension(signals, project.team_members, plan),
+        )
+    
+    def _delivery_dimension(self, signals: ScoringSignals, plan: ScoringPlan) -> DimensionScore:
+        """Delivery health from task status, aging and deadline counters."""
+        total = signals.total_tasks
+        if not total:
             return DimensionScore(
                 name="Delivery Health",
                 score=0,
-                weight=self.weights["delivery_health"],
+                weight=plan.delivery_weight,
                 details={"error": "No tasks found"}
             )
         
-        # Task status ratios
-        total = len(tasks)
-        done = sum(1 for t in tasks if t.status == TaskStatus.DONE)
-        in_progress = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
-        todo = sum(1 for t in tasks if t.status == TaskStatus.TODO)
-        
-        done_ratio = done / total if total > 0 else 0
-        in_progress_ratio = in_progress / total if total > 0 else 0
-        
-        # Aging tasks (no movement for X days)
-        now = datetime.now()
-        aging_tasks = sum(
-            1 for t in tasks
-            if (now - t.updated_at).days > self.aging_threshold
-            and t.status != TaskStatus.DONE
-        )
-        aging_ratio = aging_tasks / total if total > 0 else 0
-        
-        # Deadline tracking
-        overdue = sum(
-            1 for t in tasks
-            if t.due_date and t.due_date < now and t.status != TaskStatus.DONE
-        )
-        upcoming_deadlines = sum(
-            1 for t in tasks
-            if t.due_date and t.due_date > now and (t.due_date - now).days <= 7
-        )
-        
-        overdue_ratio = overdue / total if total > 0 else 0
+        done_ratio = signals.done / total
+        in_progress_ratio = signals.in_progress / total
+        aging_ratio = signals.aging_tasks / total
+        overdue_ratio = signals.overdue_tasks / total
         
         # Calculate score (0-100)
         # Positive factors: high done ratio, good in-progress ratio
         # Negative factors: aging tasks, overdue tasks
         score = 100
-        score -= (aging_ratio * 30)  # Penalize aging tasks
-        score -= (overdue_ratio * 40)  # Penalize overdue tasks
-        score += (done_ratio * 20)  # Reward completed tasks
-        score += (in_progress_ratio * 10)  # Reward active work
+        score -= (aging_ratio * plan.aging_penalty)  # Penalize aging tasks
+        score -= (overdue_ratio * plan.overdue_penalty)  # Penalize overdue tasks
+        score += (done_ratio * plan.done_reward)  # Reward completed tasks
+        score += (in_progress_ratio * plan.in_progress_reward)  # Reward active work
         
         score = max(0, min(100, score))
         
         return DimensionScore(
             name="Delivery Health",
             score=round(score, 1),
-            weight=self.weights["delivery_health"],
+            weight=plan.delivery_weight,
             details={
                 "total_tasks": total,
-                "done": done,
-                "in_progress": in_progress,
-                "todo": todo,
-                "aging_tasks": aging_tasks,
-                "overdue_tasks": overdue,
-                "upcoming_deadlines": upcoming_deadlines,
+                "done": signals.done,
+                "in_progress": signals.in_progress,
+                "todo": signals.todo,
+                "aging_tasks": signals.aging_tasks,
+                "overdue_tasks": signals.overdue_tasks,
+                "upcoming_deadlines": signals.upcoming_deadlines,
             }
         )
     
-    def _calculate_workload_balance(self, project: Project) -> DimensionScore:
-        """Calculate workload balance score (20% weight)."""
-        team_members = project.team_members
-        tasks = project.tasks
-        
+    def _workload_dimension(
+        self,
+        signals: ScoringSignals,
+        team_members: List[TeamMember],
+        plan: ScoringPlan
+    ) -> DimensionScore:
+        """Workload balance from the project's assignee index."""
         if not team_members:
             return DimensionScore(
                 name="Workload Balance",
                 score=0,
-                weight=self.weights["workload_balance"],
+                weight=plan.workload_weight,
                 details={"error": "No team members found"}
             )
         
         # Count tasks per team member
         task_counts = {}
         for tm in team_members:
-            assigned_tasks = [t for t in tasks if t.assignee_id == tm.id]
+            counts = signals.assignees.counts_for(tm.id)
             task_counts[tm.id] = {
                 "name": tm.name,
-                "total": len(assigned_tasks),
-                "done": sum(1 for t in assigned_tasks if t.status == TaskStatus.DONE),
-                "in_progress": sum(1 for t in assigned_tasks if t.status == TaskStatus.IN_PROGRESS),
+                "total": counts["total"],
+                "done": counts[TaskStatus.DONE.value],
+                "in_progress": counts[TaskStatus.IN_PROGRESS.value],
             }
         
         # Calculate workload distribution metrics
-        if task_counts:
-            task_totals = [counts["total"] for counts in task_counts.values()]
-            avg_tasks = sum(task_totals) / len(task_totals) if task_totals else 0
-            max_tasks = max(task_totals) if task_totals else 0
-            min_tasks = min(task_totals) if task_totals else 0
-            
-            # Overload detection
-            overloaded = sum(1 for total in task_totals if total > self.overload_threshold)
-            underutilized = sum(1 for total in task_totals if total < self.underutilization_threshold)
-            
-            # Calculate score
-            score = 100
-            
-            # Penalize overload
-            if max_tasks > self.overload_threshold:
-                overload_ratio = (max_tasks - self.overload_threshold) / self.overload_threshold
-                score -= min(30, overload_ratio * 20)
-            
-            # Penalize underutilization
-            if min_tasks < self.underutilization_threshold and avg_tasks > 0:
-                score -= 15
-            
-            # Penalize high variance (uneven distribution)
-            if avg_tasks > 0:
-                variance = sum((total - avg_tasks) ** 2 for total in task_totals) / len(task_totals)
-                std_dev = variance ** 0.5
-                if std_dev > avg_tasks * 0.5:  # High variance
-                    score -= 20
-            
-            score = max(0, min(100, score))
-        else:
-            score = 50  # Neutral if no assignments
+        task_totals = [counts["total"] for counts in task_counts.values()]
+        avg_tasks = sum(task_totals) / len(task_totals)
+        max_tasks = max(task_totals)
+        min_tasks = min(task_totals)
+        
+        # Overload detection
+        overload_threshold = plan.overload_threshold_tasks
+        underutilization_threshold = plan.underutilization_threshold_tasks
+        overloaded = sum(1 for total in task_totals if total > overload_threshold)
+        underutilized = sum(1 for total in task_totals if total < underutilization_threshold)
+        
+        # Calculate score
+        score = 100
+        
+        # Penalize overload
+        if max_tasks > overload_threshold:
+            overload_ratio = (max_tasks - overload_threshold) / overload_threshold
+            score -= min(plan.overload_penalty_cap, overload_ratio * plan.overload_penalty_rate)
+        
+        # Penalize underutilization
+        if min_tasks < underutilization_threshold and avg_tasks > 0:
+            score -= plan.underutilization_penalty
+        
+        # Penalize high variance (uneven distribution)
+        if avg_tasks > 0:
+            variance = sum((total - avg_tasks) ** 2 for total in task_totals) / len(task_totals)
+            std_dev = variance ** 0.5
+            if std_dev > avg_tasks * plan.imbalance_ratio:  # High variance
+                score -= plan.imbalance_penalty
+        
+        score = max(0, min(100, score))
         
         return DimensionScore(
             name="Workload Balance",
             score=round(score, 1),
-            weight=self.weights["workload_balance"],
+            weight=plan.workload_weight,
             details={
                 "task_distribution": task_counts,
-                "overloaded_members": overloaded if task_counts else 0,
-                "underutilized_members": underutilized if task_counts else 0,
+                "overloaded_members": overloaded,
+                "underutilized_members": underutilized,
             }
         )
     
-    def _calculate_communication_sentiment(self, project: Project) -> DimensionScore:
-        """Calculate communication & sentiment score (25% weight)."""
-        communications = project.communications
-        
-        if not communications:
+    def _sentiment_dimension(self, signals: ScoringSignals, plan: ScoringPlan) -> DimensionScore:
+        """Communication & sentiment from sentiment counters."""
+        total = signals.total_communications
+        if not total:
             return DimensionScore(
                 name="Communication & Sentiment",
                 score=50,  # Neutral if no communications
-                weight=self.weights["communication_sentiment"],
+                weight=plan.sentiment_weight,
                 details={"message": "No communications found"}
             )
         
-        # Count sentiment
-        sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
-        for comm in communications:
-            if comm.sentiment:
-                sentiment_counts[comm.sentiment] = sentiment_counts.get(comm.sentiment, 0) + 1
-        
-        total = len(communications)
-        positive_ratio = sentiment_counts["positive"] / total if total > 0 else 0
-        neutral_ratio = sentiment_counts["neutral"] / total if total > 0 else 0
-        negative_ratio = sentiment_counts["negative"] / total if total > 0 else 0
+        sentiment_counts = signals.sentiment_counts
+        positive_ratio = sentiment_counts["positive"] / total
+        negative_ratio = sentiment_counts["negative"] / total
         
         # Calculate score
-        score = 50  # Start neutral
-        score += (positive_ratio * 50)  # Boost for positive
-        score -= (negative_ratio * 50)  # Penalize negative
+        score = plan.sentiment_base  # Start neutral
+        score += (positive_ratio * plan.sentiment_swing)  # Boost for positive
+        score -= (negative_ratio * plan.sentiment_swing)  # Penalize negative
         
         score = max(0, min(100, score))
         
         # Recent sentiment trend (last 7 days)
-        now = datetime.now()
-        recent_comms = [c for c in communications if (now - c.timestamp).days <= 7]
-        recent_negative = sum(1 for c in recent_comms if c.sentiment == "negative")
-        if recent_comms and recent_negative / len(recent_comms) > 0.3:
-            score -= 10  # Penalize recent negative trend
+        recent_total = signals.recent_communications
+        recent_negative = signals.recent_negative
+        if recent_total and recent_negative / recent_total > plan.recent_negative_ratio:
+            score -= plan.recent_negative_penalty  # Penalize recent negative trend
         
         score = max(0, min(100, score))
         
         return DimensionScore(
             name="Communication & Sentiment",
             score=round(score, 1),
-            weight=self.weights["communication_sentiment"],
+            weight=plan.sentiment_weight,
             details={
                 "total_communications": total,
                 "positive": sentiment_counts["positive"],
                 "neutral": sentiment_counts["neutral"],
                 "negative": sentiment_counts["negative"],
-                "recent_negative_trend": recent_negative > len(recent_comms) * 0.3 if recent_comms else False,
+                "recent_negative_trend": (
+                    recent_negative > recent_total * plan.recent_negative_ratio if recent_total else False
+                ),
             }
         )
     
-    def _calculate_risk_signals(self, project: Project) -> DimensionScore:
-        """Calculate risk & dependency signals score (15% weight)."""
-        tasks = project.tasks
-        
-        if not tasks:
+    def _risk_dimension(self, signals: ScoringSignals, plan: ScoringPlan) -> DimensionScore:
+        """Risk & dependency signals from blocked, reopened and tagged counters."""
+        total = signals.total_tasks
+        if not total:
             return DimensionScore(
                 name="Risk & Dependency Signals",
                 score=100,  # No tasks = no risks
-                weight=self.weights["risk_signals"],
+                weight=plan.risk_weight,
                 details={}
             )
         
-        # Count risk indicators
-        blocked = sum(1 for t in tasks if t.is_blocked)
-        reopened = sum(1 for t in tasks if t.is_reopened)
-        
-        # High-risk keywords/tags
-        risk_keywords = ["urgent", "critical", "blocker", "bug"]
-        high_risk_tags = sum(
-            1 for t in tasks
-            if any(keyword in [tag.lower() for tag in t.tags] for keyword in risk_keywords)
-        )
-        
-        total = len(tasks)
-        blocked_ratio = blocked / total if total > 0 else 0
-        reopened_ratio = reopened / total if total > 0 else 0
-        risk_tag_ratio = high_risk_tags / total if total > 0 else 0
+        blocked_ratio = signals.blocked_tasks / total
+        reopened_ratio = signals.reopened_tasks / total
+        risk_tag_ratio = signals.high_risk_tagged_tasks / total
         
         # Calculate score
         score = 100
-        score -= (blocked_ratio * 40)  # Heavy penalty for blocked tasks
-        score -= (reopened_ratio * 30)  # Penalty for reopened issues
-        score -= (risk_tag_ratio * 20)  # Penalty for high-risk tags
+        score -= (blocked_ratio * plan.blocked_penalty)  # Heavy penalty for blocked tasks
+        score -= (reopened_ratio * plan.reopened_penalty)  # Penalty for reopened issues
+        score -= (risk_tag_ratio * plan.risk_tag_penalty)  # Penalty for high-risk tags
         
         score = max(0, min(100, score))
         
         return DimensionScore(
             name="Risk & Dependency Signals",
             score=round(score, 1),
-            weight=self.weights["risk_signals"],
+            weight=plan.risk_weight,
             details={
-                "blocked_tasks": blocked,
-                "reopened_tasks": reopened,
-                "high_risk_tagged_tasks": high_risk_tags,
+                "blocked_tasks": signals.blocked_tasks,
+                "reopened_tasks": signals.reopened_tasks,
+                "high_risk_tagged_tasks": signals.high_risk_tagged_tasks,
             }
         )
     
-    def _calculate_momentum_trend(self, project: Project, previous_score: float = None) -> DimensionScore:
-        """Calculate momentum trend score (10% weight)."""
-        tasks = project.tasks
-        
-        if not tasks:
+    def _momentum_dimension(
+        self,
+        signals: ScoringSignals,
+        plan: ScoringPlan,
+        previous_score: float = None,
+        delivery: Optional[DimensionScore] = None,
+        workload: Optional[DimensionScore] = None
+    ) -> DimensionScore:
+        """Momentum from week-over-week completions, reusing delivery and workload scores."""
+        if not signals.total_tasks:
             return DimensionScore(
                 name="Momentum Trend",
                 score=50,  # Neutral
-                weight=self.weights["momentum_trend"],
+                weight=plan.momentum_weight,
                 details={"message": "No tasks found"}
             )
         
-        # Week-over-week completion rate
-        now = datetime.now()
-        week_ago = now - timedelta(days=7)
-        
-        # Tasks completed in last week
-        recent_completed = [
-            t for t in tasks
-            if t.status == TaskStatus.DONE
-            and t.updated_at >= week_ago
-        ]
-        
-        # Tasks completed in previous week
-        two_weeks_ago = now - timedelta(days=14)
-        previous_week_completed = [
-            t for t in tasks
-            if t.status == TaskStatus.DONE
-            and two_weeks_ago <= t.updated_at < week_ago
-        ]
-        
-        recent_count = len(recent_completed)
-        previous_count = len(previous_week_completed)
+        recent_count = signals.recent_completions
+        previous_count = signals.previous_completions
         
         # Calculate momentum
         if previous_count > 0:
@@ -344,32 +483,30 @@ class HealthCalculator:
             momentum_ratio = 1.0 if recent_count > 0 else 0.5
         
         # Calculate score
-        score = 50  # Start neutral
-        
-        if momentum_ratio > 1.2:  # Improving
-            score = 80
-        elif momentum_ratio > 0.8:  # Stable
-            score = 60
+        if momentum_ratio > plan.improving_ratio:  # Improving
+            score = plan.improving_score
+        elif momentum_ratio > plan.stable_ratio:  # Stable
+            score = plan.stable_score
         else:  # Declining
-            score = 30
+            score = plan.declining_score
         
         # Factor in previous health score if available
         if previous_score is not None:
-            delivery_score = self._calculate_delivery_health(project).score * self.weights["delivery_health"]
-            workload_score = self._calculate_workload_balance(project).score * self.weights["workload_balance"]
+            delivery_score = delivery.score * plan.delivery_weight
+            workload_score = workload.score * plan.workload_weight
             current_health = delivery_score + workload_score  # Simplified for momentum calculation
             
-            if current_health > previous_score + 5:
-                score = min(100, score + 20)
-            elif current_health < previous_score - 5:
-                score = max(0, score - 20)
+            if current_health > previous_score + plan.momentum_health_margin:
+                score = min(100, score + plan.momentum_health_adjustment)
+            elif current_health < previous_score - plan.momentum_health_margin:
+                score = max(0, score - plan.momentum_health_adjustment)
         
         score = max(0, min(100, score))
         
         return DimensionScore(
             name="Momentum Trend",
             score=round(score, 1),
-            weight=self.weights["momentum_trend"],
+            weight=plan.momentum_weight,
             details={
                 "recent_completions": recent_count,
                 "previous_completions": previous_count,
@@ -381,6 +518,7 @@ class HealthCalculator:
         """Detect and list specific risks based on health analysis."""
         risks = []
         now = datetime.now()
+        plan = self.plan_for(project.id)
         
         # Delivery risks
         delivery_dim = next((d for d in health_score.dimensions if d.name == "Delivery Health"), None)
@@ -390,7 +528,7 @@ class HealthCalculator:
                 risks.append(Risk(
                     id="risk_1",
                     title="Multiple Aging Tasks",
-                    description=f"{details['aging_tasks']} tasks have not been updated in over {self.aging_threshold} days",
+                    description=f"{details['aging_tasks']} tasks have not been updated in over {plan.aging_threshold_days} days",
                     severity="high" if details['aging_tasks'] > 5 else "medium",
                     category="delivery",
                     detected_at=now
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import HealthScore, Risk
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import HealthScore, Risk
+
+
+class HealthEvent:
+    """
+    One health change, pre-encoded as a Server-Sent Events message. The SSE
+    ID is ``<epoch>-<sequence>``, so an ID from another process or an earlier
+    run is recognised as foreign.
+    """
+
+    __slots__ = ("id", "project_id", "data", "message")
+
+    def __init__(self, epoch: str, event_id: int, project_id: str, data: dict):
+        self.id = event_id
+        self.project_id = project_id
+        self.data = data
+        self.message = f"id: {epoch}-{event_id}\nevent: health\ndata: {json.dumps(data)}\n\n"
+
+
+class _Subscriber:
+    __slots__ = ("project_id", "queue", "loop", "lagged")
+
+    def __init__(self, project_id: Optional[str], queue: asyncio.Queue, loop: asyncio.AbstractEventLoop):
+        self.project_id = project_id
+        self.queue = queue
+        self.loop = loop
+        self.lagged = False
+
+
+class HealthEventBroker:
+    """
+    Fans out health changes to Server-Sent Events subscribers.
+    An event is published only when a project's score, status or risk set
+    differs from the last one seen, and the most recent events are kept in a
+    ring buffer so clients can resume with Last-Event-ID.
+
+    Sequences are per process, so IDs carry an epoch unique to this broker. A
+    client whose Last-Event-ID comes from another worker or an earlier run,
+    or has fallen out of the buffer, is sent the current health of every
+    project it follows and then continues from the newest event.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 1000,
+        queue_size: int = 256,
+        keepalive_seconds: float = 15,
+        epoch: Optional[str] = None
+    ):
+        self.queue_size = queue_size
+        self.keepalive_seconds = keepalive_seconds
+        self.epoch = epoch or f"{int(time.time() * 1000):x}{os.getpid():x}"
+        self._events: deque = deque(maxlen=buffer_size)
+        self._states: Dict[str, Tuple[float, str, frozenset]] = {}
+        self._latest: Dict[str, HealthEvent] = {}  # last event per project: its current health
+        self._subscribers: List[_Subscriber] = []
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, project_id: str, health_score: HealthScore, risks: List[Risk]) -> Optional[HealthEvent]:
+        """Publish a project's latest health if it changed. Returns the event, or None."""
+        risk_set = frozenset((risk.id, risk.severity) for risk in risks)
+        state = (health_score.overall_score, health_score.status.value, risk_set)
+        with self._lock:
+            if self._states.get(project_id) == state:
+                return None
+            self._states[project_id] = state
+            event = HealthEvent(self.epoch, self._next_id, project_id, {
+                "project_id": project_id,
+                "score": health_score.overall_score,
+                "status": health_score.status.value,
+                "trend": health_score.trend,
+                "risks": sorted(risk_id for risk_id, _ in risk_set),
+                "calculated_at": health_score.calculated_at.isoformat(),
+            })
+            self._next_id += 1
+            self._events.append(event)
+            self._latest[project_id] = event
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.project_id is None or subscriber.project_id == project_id:
+                # Publishers may run outside the subscriber's event loop thread
+                subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, event)
+        return event
+
+    def replay(self, last_event_id: Optional[str], project_id: Optional[str] = None) -> Tuple[List[HealthEvent], int]:
+        """
+        Events a client resuming after ``last_event_id`` has missed, optionally
+        for one project, and the sequence it is then up to. When the ID cannot
+        be resumed from the buffer, the latest event of every project is
+        returned instead, so the client catches up on the current state.
+        """
+        with self._lock:
+            events = list(self._events)
+            latest = list(self._latest.values())
+            newest = self._next_id - 1
+        sequence = self._resumable(last_event_id, events, newest)
+        if sequence is None:
+            events = sorted(latest, key=lambda event: event.id)
+        else:
+            events = [event for event in events if event.id > sequence]
+        return [event for event in events if project_id is None or event.project_id == project_id], newest
+
+    def _resumable(self, last_event_id: Optional[str], events: List[HealthEvent], newest: int) -> Optional[int]:
+        """The sequence to replay after, or None if the ID is foreign, unknown or expired."""
+        epoch, _, sequence = (last_event_id or "").rpartition("-")
+        if epoch != self.epoch or not sequence.isdigit():
+            return None
+        sequence = int(sequence)
+        oldest = events[0].id if events else newest + 1
+        if sequence > newest or sequence < oldest - 1:
+            return None
+        return sequence
+
+    async def subscribe(self, project_id: Optional[str] = None, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Yield SSE messages for one project (or all when ``project_id`` is None).
+        Missed events are replayed first when ``last_event_id`` is given; a
+        comment line is sent while idle so proxies keep the connection open.
+        """
+        subscriber = _Subscriber(project_id, asyncio.Queue(maxsize=self.queue_size), asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.append(subscriber)
+            sent = self._next_id - 1
+        try:
+            yield "retry: 3000\n\n"
+            if last_event_id is not None:
+                events, sent = self.replay(last_event_id, project_id)
+                for event in events:
+                    yield event.message
+            while not subscriber.lagged:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), timeout=self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                # Events queued while the replay was being sent are skipped
+                if event.id > sent:
+                    sent = event.id
+                    yield event.message
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    @staticmethod
+    def _deliver(subscriber: _Subscriber, event: HealthEvent) -> None:
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow client is disconnected; it reconnects and resumes from the buffer
+            subscriber.lagged = True
@@ -0,0 +1,65 @@
+import re
+from typing import Iterable, List
+import sys
+import os
+
+# Handle imports
+try:
+    from .config import get_sentiment_keywords
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from config import get_sentiment_keywords
+
+
+class KeywordSentimentClassifier:
+    """
+    Keyword-based sentiment used when the LLM is unavailable.
+    All keywords are compiled into one case-insensitive regex alternation
+    with word boundaries, so "bug" matches "bug" but not "debug". Matching
+    is exact, so plurals are listed as keywords of their own ("bugs").
+    """
+
+    def __init__(self, positive: Iterable[str], negative: Iterable[str]):
+        self.positive = frozenset(word.lower() for word in positive)
+        self.negative = frozenset(word.lower() for word in negative)
+        self._pattern = re.compile(
+            r"\b(?:(?P<positive>{})|(?P<negative>{}))\b".format(
+                self._alternation(self.positive), self._alternation(self.negative)
+            ),
+            re.IGNORECASE
+        )
+
+    @classmethod
+    def from_config(cls) -> "KeywordSentimentClassifier":
+        keywords = get_sentiment_keywords()
+        return cls(keywords["positive"], keywords["negative"])
+
+    @staticmethod
+    def _alternation(words: frozenset) -> str:
+        # Longest first so overlapping keywords prefer the most specific match;
+        # an empty list compiles to a group that never matches
+        if not words:
+            return "(?!)"
+        return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+    def classify(self, text: str) -> str:
+        """Classify one text; each distinct keyword counts once."""
+        positive = set()
+        negative = set()
+        for match in self._pattern.finditer(text):
+            if match.lastgroup == "positive":
+                positive.add(match.group().lower())
+            else:
+                negative.add(match.group().lower())
+
+        if len(negative) > len(positive):
+            return "negative"
+        elif len(positive) > len(negative):
+            return "positive"
+        else:
+            return "neutral"
+
+    def classify_many(self, texts: List[str]) -> List[str]:
+        """Classify a list of texts in one call."""
+        classify = self.classify
+        return [classify(text) for text in texts]
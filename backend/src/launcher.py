@@ -0,0 +1,105 @@
+"""
+Server entry points.
+
+Development runs one auto-reloading uvicorn process. Production runs
+gunicorn with uvicorn workers: the app (config, prompts, scoring plans and
+project data) is loaded once in the master and the workers are forked from
+it, so every worker starts from the same state. Scores, precomputed reports
+and sentiment results are kept in SQLite files that all workers share.
+
+    python start_server.py
+    python start_server.py --production --workers 4
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional
+
+SRC_DIR = Path(__file__).parent
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse launch options and export them as SERVER_* variables, so they are
+    in place before config.py is imported. Call this before importing the server.
+    """
+    parser = argparse.ArgumentParser(description="Run the Project Health Monitor API")
+    parser.add_argument("--production", action="store_true", help="preloaded multi-worker server (SERVER_MODE=production)")
+    parser.add_argument("--workers", type=int, help="production worker processes; 0 means one per CPU (SERVER_WORKERS)")
+    parser.add_argument("--host", help="bind address (SERVER_HOST)")
+    parser.add_argument("--port", type=int, help="bind port (SERVER_PORT)")
+    args = parser.parse_args(argv)
+    if args.production:
+        os.environ["SERVER_MODE"] = "production"
+    for name, value in (("SERVER_WORKERS", args.workers), ("SERVER_HOST", args.host), ("SERVER_PORT", args.port)):
+        if value is not None:
+            os.environ[name] = str(value)
+    return args
+
+
+def run_development(host: str, port: int) -> None:
+    """One uvicorn process that restarts when source files change."""
+    import uvicorn
+
+    uvicorn.run(
+        "server:app", host=host, port=port, reload=True, reload_dirs=[str(SRC_DIR)], app_dir=str(SRC_DIR)
+    )
+
+
+def run_production(host: str, port: int, workers: int, server: Optional[ModuleType] = None) -> None:
+    """Preload the app, then fork gunicorn workers running it on uvicorn's event loop."""
+    from config import SERVER_WORKER_TIMEOUT_SECONDS
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # gunicorn is POSIX only. uvicorn's own workers would each import the app and
+        # build their own mock data and version counters, so run a single process instead.
+        import uvicorn
+        import config
+        if workers > 1:
+            print(f"gunicorn is not installed; starting 1 worker instead of {workers}")
+        config.SERVER_WORKERS = 1  # the one process gets every CPU for portfolio scoring
+        uvicorn.run("server:app", host=host, port=port, app_dir=str(SRC_DIR))
+        return
+
+    if server is None:
+        import server
+    server.preload()
+
+    class Application(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+            self.cfg.set("preload_app", True)
+            self.cfg.set("timeout", SERVER_WORKER_TIMEOUT_SECONDS)
+            self.cfg.set("graceful_timeout", SERVER_WORKER_TIMEOUT_SECONDS)
+
+        def load(self):
+            return server.app
+
+    print(f"Starting {workers} workers on {host}:{port}")
+    Application().run()
+
+
+def main(server: Optional[ModuleType] = None, argv: Optional[List[str]] = None) -> None:
+    """
+    Run the server in SERVER_MODE. ``server`` is the already imported server
+    module, when there is one (running server.py as a script); settings that
+    config.py derives at import, like the shared sentiment cache, then follow
+    the environment rather than the command line.
+    """
+    args = parse_args(argv)
+    sys.path.insert(0, str(SRC_DIR))
+    from config import SERVER_MODE, SERVER_HOST, SERVER_PORT, SERVER_WORKERS
+
+    host = args.host or SERVER_HOST
+    port = args.port or SERVER_PORT
+    if args.production or SERVER_MODE == "production":
+        workers = args.workers if args.workers is not None else SERVER_WORKERS
+        run_production(host, port, workers or os.cpu_count() or 1, server)
+    else:
+        run_development(host, port)
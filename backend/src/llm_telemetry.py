@@ -0,0 +1,142 @@
+"""
+Accounting for LLM calls: latency, token usage, model and outcome.
+
+Every chat completion made by the AI services is recorded here. Recent
+calls are kept in memory for rolling aggregates (served by the admin
+endpoint), and each call can also be appended to a JSONL log for offline
+analysis.
+"""
+import json
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+# Outcomes of one LLM call
+OK = "ok"
+PARSE_FALLBACK = "parse_fallback"  # answered, but the reply had to be padded or replaced by fallbacks
+EXCEPTION_FALLBACK = "exception_fallback"  # the call failed and a fallback was used
+
+
+class LLMCall:
+    """One chat completion call."""
+
+    __slots__ = (
+        "operation", "model", "started_at", "duration_seconds", "outcome",
+        "prompt_tokens", "completion_tokens", "items", "recommendation_count", "error",
+    )
+
+    def __init__(
+        self,
+        operation: str,
+        model: str,
+        started_at: float,
+        duration_seconds: float,
+        outcome: str,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        items: int = 1,
+        recommendation_count: Optional[int] = None,
+        error: Optional[str] = None
+    ):
+        self.operation = operation
+        self.model = model
+        self.started_at = started_at  # epoch seconds
+        self.duration_seconds = duration_seconds
+        self.outcome = outcome
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.items = items  # texts classified by a batch sentiment call
+        self.recommendation_count = recommendation_count  # recommendations parsed from the reply
+        self.error = error
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["started_at"] = datetime.fromtimestamp(self.started_at).isoformat()
+        data["duration_seconds"] = round(self.duration_seconds, 4)
+        return data
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LLMTelemetry:
+    """
+    Rolling record of LLM calls. Keeps at most ``max_calls`` calls from the
+    last ``window_seconds`` and optionally appends every call to ``log_path``.
+    """
+
+    def __init__(self, window_seconds: float = 3600, max_calls: int = 10000, log_path: Optional[str] = None):
+        self.window_seconds = window_seconds
+        self._calls: Deque[LLMCall] = deque(maxlen=max_calls)
+        self._lock = threading.Lock()
+        self._log = open(log_path, "a", encoding="utf-8", buffering=1) if log_path else None
+
+    def record(self, call: LLMCall) -> None:
+        with self._lock:
+            self._calls.append(call)
+            if self._log is not None:
+                try:
+                    self._log.write(json.dumps(call.to_dict()) + "\n")
+                except (OSError, ValueError) as e:
+                    print(f"Error writing LLM telemetry log: {e}")
+
+    def recent(self, limit: int = 50) -> List[dict]:
+        """The latest calls, newest first."""
+        with self._lock:
+            calls = list(self._calls)[-limit:] if limit > 0 else []
+        return [call.to_dict() for call in reversed(calls)]
+
+    def summary(self, now: Optional[float] = None) -> dict:
+        """Aggregates per operation and model over the rolling window."""
+        now = now or time.time()
+        cutoff = now - self.window_seconds
+        with self._lock:
+            calls = [call for call in self._calls if call.started_at >= cutoff]
+
+        groups: Dict[tuple, List[LLMCall]] = {}
+        for call in calls:
+            groups.setdefault((call.operation, call.model), []).append(call)
+
+        operations = []
+        for (operation, model), group in sorted(groups.items()):
+            durations = sorted(call.duration_seconds for call in group)
+            outcomes: Dict[str, int] = {}
+            for call in group:
+                outcomes[call.outcome] = outcomes.get(call.outcome, 0) + 1
+            recommendation_counts = [c.recommendation_count for c in group if c.recommendation_count is not None]
+            operations.append({
+                "operation": operation,
+                "model": model,
+                "calls": len(group),
+                "items": sum(call.items for call in group),
+                "outcomes": outcomes,
+                "latency_seconds": {
+                    "mean": round(sum(durations) / len(durations), 4),
+                    "p50": round(_percentile(durations, 0.5), 4),
+                    "p95": round(_percentile(durations, 0.95), 4),
+                    "max": round(durations[-1], 4),
+                    "total": round(sum(durations), 4),
+                },
+                "tokens": {
+                    "prompt": sum(call.prompt_tokens or 0 for call in group),
+                    "completion": sum(call.completion_tokens or 0 for call in group),
+                },
+                "mean_recommendations": (
+                    round(sum(recommendation_counts) / len(recommendation_counts), 2)
+                    if recommendation_counts else None
+                ),
+            })
+        return {"window_seconds": self.window_seconds, "calls": len(calls), "operations": operations}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
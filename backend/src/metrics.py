@@ -0,0 +1,311 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Recording is lock-free: every thread writes to its own shard of a metric
+(a preallocated list of bucket counts), and shards are only summed when
+/metrics is scraped. Under the GIL a thread's shard has a single writer, so
+increments need no lock; the lock is only taken when a thread or label set
+is seen for the first time.
+"""
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Seconds; covers sub-millisecond scoring stages up to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Sharded:
+    """Per-thread lists of ``size`` numbers, summed on read."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[list] = []
+        self._lock = threading.Lock()
+
+    def shard(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0] * self._size
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def totals(self) -> list:
+        totals = [0] * self._size
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+
+class CounterChild:
+    __slots__ = ("_values",)
+
+    def __init__(self):
+        self._values = _Sharded(1)
+
+    def inc(self, amount: float = 1) -> None:
+        self._values.shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._values.totals()[0]
+
+
+class HistogramChild:
+    __slots__ = ("_buckets", "_values")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        # One count per bucket plus +Inf, then the sum and the total count
+        self._values = _Sharded(len(buckets) + 3)
+
+    def observe(self, value: float) -> None:
+        shard = self._values.shard()
+        shard[bisect_left(self._buckets, value)] += 1
+        shard[-2] += value
+        shard[-1] += 1
+
+    def time(self) -> "_Timer":
+        """Context manager observing the elapsed seconds of its block."""
+        return _Timer(self)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """Cumulative bucket counts (including +Inf), sum and count."""
+        totals = self._values.totals()
+        cumulative = []
+        running = 0
+        for count in totals[:-2]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-2], totals[-1]
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: HistogramChild):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start)
+        return False
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **labels: str):
+        """The child for one label set, created on first use and reused after."""
+        key = values if values else tuple(labels[name] for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self) -> Iterable[str]:
+        for values, child in self._items():
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self, **labels: str) -> _Timer:
+        return self.labels(**labels).time()
+
+    def _samples(self) -> Iterable[str]:
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for values, child in self._items():
+            cumulative, total, count = child.snapshot()
+            for bound, running in zip(bounds, cumulative):
+                labels = _format_labels(self.labelnames, values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {running}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(float(total))}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class CallbackMetric(_Metric):
+    """Values read from a callback at scrape time, e.g. counters a cache already keeps."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        type_name: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Iterable[Tuple[Sequence[str], float]]]
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type_name = type_name
+        self._collect = collect
+
+    def _samples(self) -> Iterable[str]:
+        for values, value in self._collect():
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """Creates metrics and renders all of them for /metrics."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4"  # Starlette appends the charset
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        type_name: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Iterable[Tuple[Sequence[str], float]]]
+    ) -> CallbackMetric:
+        return self._register(CallbackMetric(name, documentation, type_name, labelnames, collect))
+
+    def _register(self, metric: _Metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                print(f"Error collecting metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware observing request latency per route template (not raw
+    path, to bound label cardinality). Server-Sent Events responses are
+    skipped, since their duration is the connection lifetime.
+    """
+
+    def __init__(self, app, histogram: Histogram):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        state = {"status": "500", "streaming": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = str(message["status"])
+                for key, value in message.get("headers", ()):
+                    if key == b"content-type" and value.startswith(b"text/event-stream"):
+                        state["streaming"] = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not state["streaming"]:
+                route = scope.get("route")
+                self.histogram.labels(
+                    scope["method"],
+                    getattr(route, "path", "unmatched"),
+                    state["status"]
+                ).observe(time.perf_counter() - start)
@@ -1,6 +1,7 @@
 import random
 from datetime import datetime, timedelta
-from typing import List
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
 import sys
 import os
 
@@ -9,11 +10,33 @@ try:
     from .models import (
         Project, Task, TeamMember, Communication, TaskStatus
     )
+    from .bulk_loader import write_jsonl
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     from models import (
         Project, Task, TeamMember, Communication, TaskStatus
     )
+    from bulk_loader import write_jsonl
+
+
+COMMENTS = {
+    "positive": [
+        "Great progress on this!",
+        "Looks good, ready to merge.",
+        "Excellent work, thanks!",
+    ],
+    "neutral": [
+        "Please review when you have a chance.",
+        "Updated the implementation.",
+        "Added requested changes.",
+    ],
+    "negative": [
+        "This is blocking our release.",
+        "We need this fixed ASAP, client is waiting.",
+        "This has been delayed too long.",
+        "Not meeting the requirements.",
+    ],
+}
 
 
 def generate_mock_team_members() -> List[TeamMember]:
@@ -80,28 +103,11 @@ def generate_mock_tasks(team_member_ids: List[str], days_ago: int = 30) -> List[
 
 def generate_mock_comments(include_negative: bool = False) -> List[str]:
     """Generate mock comments with varying sentiment."""
-    positive_comments = [
-        "Great progress on this!",
-        "Looks good, ready to merge.",
-        "Excellent work, thanks!",
-    ]
-    neutral_comments = [
-        "Please review when you have a chance.",
-        "Updated the implementation.",
-        "Added requested changes.",
-    ]
-    negative_comments = [
-        "This is blocking our release.",
-        "We need this fixed ASAP, client is waiting.",
-        "This has been delayed too long.",
-        "Not meeting the requirements.",
-    ]
-    
     comments = []
     if include_negative:
-        comments.extend(random.sample(negative_comments, k=random.randint(1, 2)))
+        comments.extend(random.sample(COMMENTS["negative"], k=random.randint(1, 2)))
     else:
-        comments.extend(random.sample(positive_comments + neutral_comments, k=random.randint(0, 2)))
+        comments.extend(random.sample(COMMENTS["positive"] + COMMENTS["neutral"], k=random.randint(0, 2)))
     
     return comments
 
@@ -141,25 +147,22 @@ def generate_mock_project(project_id: str = "proj_1", project_name: str = "E-Com
     team_member_ids = [tm.id for tm in team_members]
     
     tasks = generate_mock_tasks(team_member_ids)
-    
-    # Update team members with their assigned tasks
-    for task in tasks:
-        if task.assignee_id:
-            for tm in team_members:
-                if tm.id == task.assignee_id:
-                    tm.tasks.append(task.id)
-    
     communications = generate_mock_communications(project_id)
     
-    return Project(
+    project = Project(
         id=project_id,
         name=project_name,
         description="A modern e-commerce platform with AI-powered recommendations",
-        tasks=tasks,
         team_members=team_members,
         communications=communications,
         created_at=datetime.now() - timedelta(days=60)
     )
+    
+    # Adding through the project keeps team members' task lists and the assignee index in sync
+    for task in tasks:
+        project.add_task(task)
+    
+    return project
 
 
 def generate_multiple_projects() -> List[Project]:
@@ -171,3 +174,173 @@ def generate_multiple_projects() -> List[Project]:
     ]
     return projects
 
+
+
+# Synthetic workloads: seeded, parameterized portfolios for benchmarks and load tests
+
+TASK_VERBS = ["Implement", "Fix", "Refactor", "Design", "Test", "Document", "Migrate", "Review", "Optimize", "Deploy"]
+TASK_SUBJECTS = [
+    "checkout flow", "login page", "search API", "billing service", "user dashboard", "data pipeline",
+    "notification system", "CI pipeline", "mobile layout", "reporting module", "cache layer", "audit log",
+]
+TASK_TAGS = ["bug", "feature", "urgent", "backend", "frontend", "critical", "blocker", "tech-debt"]
+FIRST_NAMES = ["Alice", "Bob", "Carol", "David", "Erin", "Frank", "Grace", "Heidi", "Ivan", "Judy", "Mallory", "Niaj"]
+LAST_NAMES = ["Johnson", "Smith", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Lopez", "Wilson"]
+MESSAGES = {
+    "positive": [
+        "The project is looking great! Keep up the good work.",
+        "Thanks for the quick turnaround on the last issue.",
+        "The demo went really well, the client is happy.",
+    ],
+    "neutral": [
+        "Can we discuss the API changes in the standup?",
+        "I've completed the frontend updates.",
+        "Sharing the notes from today's planning meeting.",
+    ],
+    "negative": [
+        "This bug is critical and needs immediate attention.",
+        "The login feature is not working as expected. This is urgent.",
+        "We are frustrated with the repeated delays.",
+    ],
+}
+
+
+class WorkloadSpec:
+    """
+    Parameters of a synthetic portfolio. The same spec, seed and ``now``
+    always produce the same projects.
+
+    Task ages follow an exponential distribution around ``mean_task_age_days``
+    (capped at ``max_task_age_days``); statuses, comment and communication
+    sentiment are drawn from the given weights.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        projects: int = 3,
+        tasks_per_project: int = 100,
+        team_size: int = 5,
+        communications_per_project: int = 10,
+        status_weights: Optional[Dict[TaskStatus, float]] = None,
+        sentiment_weights: Optional[Dict[str, float]] = None,
+        mean_task_age_days: float = 10,
+        max_task_age_days: float = 90,
+        communication_window_days: float = 14,
+        unassigned_rate: float = 0.1,
+        reopened_rate: float = 0.05,
+        due_date_rate: float = 0.7,
+        tag_rate: float = 0.5
+    ):
+        self.seed = seed
+        self.projects = projects
+        self.tasks_per_project = tasks_per_project
+        self.team_size = team_size
+        self.communications_per_project = communications_per_project
+        self.status_weights = status_weights or {
+            TaskStatus.TODO: 0.3,
+            TaskStatus.IN_PROGRESS: 0.25,
+            TaskStatus.DONE: 0.4,
+            TaskStatus.BLOCKED: 0.05,
+        }
+        self.sentiment_weights = sentiment_weights or {"positive": 0.35, "neutral": 0.45, "negative": 0.2}
+        self.mean_task_age_days = mean_task_age_days
+        self.max_task_age_days = max_task_age_days
+        self.communication_window_days = communication_window_days
+        self.unassigned_rate = unassigned_rate
+        self.reopened_rate = reopened_rate
+        self.due_date_rate = due_date_rate
+        self.tag_rate = tag_rate
+
+
+def generate_synthetic_project(spec: WorkloadSpec, index: int, now: Optional[datetime] = None) -> Project:
+    """Generate project ``index`` of a synthetic portfolio; each project has its own seeded stream."""
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    now = now or datetime.now()
+    project_id = f"proj_{index + 1}"
+
+    team_members = []
+    for m in range(spec.team_size):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        team_members.append(TeamMember(
+            id=f"{project_id}_tm{m + 1}",
+            name=f"{first} {last}",
+            email=f"{first.lower()}.{last.lower()}{m + 1}@example.com"
+        ))
+
+    statuses = list(spec.status_weights)
+    status_weights = list(spec.status_weights.values())
+    sentiments = list(spec.sentiment_weights)
+    sentiment_weights = list(spec.sentiment_weights.values())
+    tasks = []
+    for t in range(spec.tasks_per_project):
+        status = rng.choices(statuses, status_weights)[0]
+        age_days = min(rng.expovariate(1 / spec.mean_task_age_days), spec.max_task_age_days)
+        created_at = now - timedelta(days=age_days)
+        updated_at = created_at + timedelta(days=age_days * rng.random())
+        due_date = None
+        if rng.random() < spec.due_date_rate:
+            due_date = created_at + timedelta(days=rng.uniform(3, 30))
+        assignee_id = None
+        if team_members and rng.random() >= spec.unassigned_rate:
+            assignee_id = rng.choice(team_members).id
+        comment_count = rng.randint(1, 2) if status == TaskStatus.BLOCKED else rng.randint(0, 2)
+        comments = [
+            rng.choice(COMMENTS["negative"] if status == TaskStatus.BLOCKED else COMMENTS[rng.choices(sentiments, sentiment_weights)[0]])
+            for _ in range(comment_count)
+        ]
+        tags = rng.sample(TASK_TAGS, k=rng.randint(1, 2)) if rng.random() < spec.tag_rate else []
+        tasks.append(Task(
+            id=f"task_{t + 1}",
+            title=f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_SUBJECTS)} #{t + 1}",
+            status=status,
+            assignee_id=assignee_id,
+            created_at=created_at,
+            updated_at=updated_at,
+            due_date=due_date,
+            is_blocked=status == TaskStatus.BLOCKED,
+            is_reopened=rng.random() < spec.reopened_rate,
+            comments=comments,
+            tags=tags
+        ))
+
+    authors = [tm.name for tm in team_members] + ["client@example.com"]
+    communications = []
+    for c in range(spec.communications_per_project):
+        sentiment = rng.choices(sentiments, sentiment_weights)[0]
+        communications.append(Communication(
+            id=f"comm_{c + 1}",
+            source=rng.choice(["email", "slack", "comment", "bug"]),
+            author=rng.choice(authors),
+            content=rng.choice(MESSAGES[sentiment]),
+            timestamp=now - timedelta(days=rng.uniform(0, spec.communication_window_days)),
+            sentiment=sentiment
+        ))
+    communications.sort(key=lambda comm: comm.timestamp)
+
+    project = Project(
+        id=project_id,
+        name=f"{rng.choice(TASK_SUBJECTS).title()} {index + 1}",
+        description=f"Synthetic project {index + 1} (seed {spec.seed})",
+        team_members=team_members,
+        communications=communications,
+        created_at=now - timedelta(days=spec.max_task_age_days + 30)
+    )
+    # Adding through the project keeps team members' task lists and the assignee index in sync
+    project.add_tasks(tasks)
+    return project
+
+
+def iter_synthetic_projects(spec: WorkloadSpec, now: Optional[datetime] = None) -> Iterator[Project]:
+    """Stream the projects of a synthetic portfolio one at a time."""
+    now = now or datetime.now()
+    for index in range(spec.projects):
+        yield generate_synthetic_project(spec, index, now)
+
+
+def dump_synthetic_projects(spec: WorkloadSpec, path: Union[str, Path], now: Optional[datetime] = None) -> int:
+    """
+    Write a synthetic portfolio as JSONL for bulk_loader (gzip-compressed for
+    a .gz path), holding one project in memory at a time. Returns the line count.
+    """
+    return write_jsonl(iter_synthetic_projects(spec, now), path)
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Set, Tuple
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, field_validator
 
 
 class TaskStatus(str, Enum):
@@ -47,6 +47,133 @@ class Communication(BaseModel):
     sentiment: Optional[str] = None  # "positive", "neutral", "negative"
 
 
+class AssigneeIndex:
+    """
+    Assignee -> task index with per-status counts.
+    Built once from a task list and updated per task as tasks are added,
+    reassigned or change status, so lookups never rescan all tasks.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, Dict[str, Task]] = {}  # assignee_id -> {task_id: task}
+        self._counts: Dict[str, Dict[TaskStatus, int]] = {}  # assignee_id -> status counts
+        self._entries: Dict[str, Tuple[Optional[str], TaskStatus]] = {}  # task_id -> (assignee_id, status)
+
+    @classmethod
+    def from_tasks(cls, tasks: List[Task]) -> "AssigneeIndex":
+        index = cls()
+        for task in tasks:
+            index.add(task)
+        return index
+
+    @property
+    def task_count(self) -> int:
+        return len(self._entries)
+
+    def add(self, task: Task) -> None:
+        """Index a task; replaces any previous entry for the same task ID."""
+        if task.id in self._entries:
+            self.remove(task.id)
+        self._entries[task.id] = (task.assignee_id, task.status)
+        if task.assignee_id is None:
+            return
+        self._tasks.setdefault(task.assignee_id, {})[task.id] = task
+        counts = self._counts.setdefault(task.assignee_id, {})
+        counts[task.status] = counts.get(task.status, 0) + 1
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the index."""
+        entry = self._entries.pop(task_id, None)
+        if entry is None or entry[0] is None:
+            return
+        assignee_id, status = entry
+        del self._tasks[assignee_id][task_id]
+        self._counts[assignee_id][status] -= 1
+
+    def update(self, task: Task) -> None:
+        """Re-index a task after its assignee or status changed."""
+        self.add(task)
+
+    def assignee_of(self, task_id: str) -> Optional[str]:
+        entry = self._entries.get(task_id)
+        return entry[0] if entry else None
+
+    def tasks_for(self, assignee_id: str) -> List[Task]:
+        """Tasks currently assigned to a team member."""
+        return list(self._tasks.get(assignee_id, {}).values())
+
+    def counts_for(self, assignee_id: str) -> Dict[str, int]:
+        """Total and per-status task counts for a team member."""
+        counts = self._counts.get(assignee_id, {})
+        result = {"total": len(self._tasks.get(assignee_id, ()))}
+        for status in TaskStatus:
+            result[status.value] = counts.get(status, 0)
+        return result
+
+
+class TaskList(list):
+    """
+    List of a project's tasks that counts its own mutations, so the project's
+    indexes notice any in-place change, including ``tasks[i] = task``.
+    """
+
+    version = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._changed()
+        return result
+
+    def append(self, task) -> None:
+        super().append(task)
+        self._changed()
+
+    def extend(self, tasks) -> None:
+        super().extend(tasks)
+        self._changed()
+
+    def insert(self, index, task) -> None:
+        super().insert(index, task)
+        self._changed()
+
+    def pop(self, index=-1):
+        task = super().pop(index)
+        self._changed()
+        return task
+
+    def remove(self, task) -> None:
+        super().remove(task)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+
 class Project(BaseModel):
     id: str
     name: str
@@ -56,6 +183,113 @@ class Project(BaseModel):
     communications: List[Communication] = []
     created_at: datetime
 
+    _assignee_index: Optional[AssigneeIndex] = PrivateAttr(default=None)
+    _task_positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _indexed_tasks: Optional[List[Task]] = PrivateAttr(default=None)
+    _indexed_task_version: int = PrivateAttr(default=-1)
+    _members: Dict[str, TeamMember] = PrivateAttr(default_factory=dict)
+    _member_task_ids: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _indexed_members: Optional[List[TeamMember]] = PrivateAttr(default=None)
+    _indexed_member_count: int = PrivateAttr(default=0)
+
+    @field_validator("tasks")
+    @classmethod
+    def _track_task_mutations(cls, tasks: List[Task]) -> List[Task]:
+        return tasks if isinstance(tasks, TaskList) else TaskList(tasks)
+
+    def assignee_index(self) -> AssigneeIndex:
+        """
+        Get the assignee index, building it on first use.
+        add_task/update_task/close_task keep it current in place; any other
+        change to the task list (replacing it, or mutating it directly, even
+        ``tasks[i] = task``) makes the next call rebuild it.
+        """
+        tasks = self.tasks
+        if (
+            self._assignee_index is None
+            or self._indexed_tasks is not tasks
+            or self._indexed_task_version != tasks.version
+        ):
+            if not isinstance(tasks, TaskList):
+                # Assigned after validation, e.g. by model_copy(update=...)
+                tasks = self.tasks = TaskList(tasks)
+            self._assignee_index = AssigneeIndex.from_tasks(tasks)
+            self._task_positions = {t.id: i for i, t in enumerate(tasks)}
+            self._indexed_tasks = tasks
+            self._indexed_task_version = tasks.version
+        return self._assignee_index
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        self.assignee_index()
+        position = self._task_positions.get(task_id)
+        return self.tasks[position] if position is not None else None
+
+    def add_task(self, task: Task) -> None:
+        """Add a new task, or replace an existing task with the same ID."""
+        self.add_tasks((task,))
+
+    def update_task(self, task: Task) -> None:
+        """Replace a task by ID, re-indexing its assignee and status; an unknown task is added."""
+        self.add_tasks((task,))
+
+    def add_tasks(self, tasks: Iterable[Task]) -> None:
+        """Add or replace many tasks in order, looking the indexes up once for the whole batch."""
+        index = self.assignee_index()
+        own, positions = self.tasks, self._task_positions
+        members, member_task_ids = self._member_index()
+        for task in tasks:
+            position = positions.get(task.id)
+            # The list's own methods, so the indexes updated here are not counted as stale
+            if position is None:
+                previous_assignee = None
+                positions[task.id] = len(own)
+                list.append(own, task)
+            else:
+                previous_assignee = index.assignee_of(task.id)
+                list.__setitem__(own, position, task)
+            index.add(task)
+            if position is None or previous_assignee != task.assignee_id:
+                _move_member_task(members, member_task_ids, task.id, previous_assignee, task.assignee_id)
+
+    def close_task(self, task_id: str, closed_at: Optional[datetime] = None) -> Optional[Task]:
+        """Mark a task as done. Returns the updated task, or None if not found."""
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        closed = task.model_copy(update={
+            "status": TaskStatus.DONE,
+            "updated_at": closed_at or datetime.now(),
+        })
+        self.update_task(closed)
+        return closed
+
+    def _member_index(self) -> Tuple[Dict[str, TeamMember], Dict[str, Set[str]]]:
+        """Team members by ID and their task ID sets, rebuilt when the member list is replaced or resized."""
+        if self._indexed_members is not self.team_members or self._indexed_member_count != len(self.team_members):
+            self._members = {tm.id: tm for tm in self.team_members}
+            self._member_task_ids = {tm.id: set(tm.tasks) for tm in self.team_members}
+            self._indexed_members = self.team_members
+            self._indexed_member_count = len(self.team_members)
+        return self._members, self._member_task_ids
+
+
+def _move_member_task(
+    members: Dict[str, TeamMember],
+    member_task_ids: Dict[str, Set[str]],
+    task_id: str,
+    from_id: Optional[str],
+    to_id: Optional[str]
+) -> None:
+    """Move a task ID between team members' task lists; either side may be None or unknown."""
+    task_ids = member_task_ids.get(from_id)
+    if task_ids is not None and task_id in task_ids:
+        task_ids.discard(task_id)
+        members[from_id].tasks.remove(task_id)
+    task_ids = member_task_ids.get(to_id)
+    if task_ids is not None and task_id not in task_ids:
+        task_ids.add(task_id)
+        members[to_id].tasks.append(task_id)
+
 
 class DimensionScore(BaseModel):
     name: str
@@ -99,3 +333,15 @@ class HealthReport(BaseModel):
     recommendations: List[Recommendation]
     generated_at: datetime
 
+
+class SentimentBatchRequest(BaseModel):
+    texts: List[str]
+
+
+class SentimentResult(BaseModel):
+    text: str
+    sentiment: str  # "positive", "neutral", "negative"
+
+
+class SentimentBatchResponse(BaseModel):
+    results: List[SentimentResult]
@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import Project, HealthScore
+    from .health_calculator import HealthCalculator
+    from .scoring_plan import ScoringPlans
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project, HealthScore
+    from health_calculator import HealthCalculator
+    from scoring_plan import ScoringPlans
+
+
+# One calculator per worker process (or per importing process for the thread pool)
+_calculator: Optional[HealthCalculator] = None
+
+
+def _get_calculator() -> HealthCalculator:
+    global _calculator
+    if _calculator is None:
+        _calculator = HealthCalculator()
+    return _calculator
+
+
+def summarize_health(project: Project, health_score: HealthScore) -> dict:
+    """Compact per-project portfolio entry."""
+    return {
+        "project_id": project.id,
+        "project_name": project.name,
+        "score": health_score.overall_score,
+        "status": health_score.status.value,
+        "trend": health_score.trend,
+        "dimensions": {dim.name: dim.score for dim in health_score.dimensions},
+        "calculated_at": health_score.calculated_at.isoformat(),
+    }
+
+
+def score_chunk(
+    projects: List[Project],
+    previous_scores: Dict[str, float],
+    plans: Optional[ScoringPlans] = None
+) -> List[dict]:
+    """Score one chunk of projects with the vectorized batch path."""
+    health_scores = _get_calculator().calculate_health_scores_batch(projects, previous_scores, plans=plans)
+    return [summarize_health(p, hs) for p, hs in zip(projects, health_scores)]
+
+
+class PortfolioScorer:
+    """
+    Scores a whole portfolio off the event loop.
+    Projects are split into chunks that run on a process pool, or on a thread
+    pool when the portfolio is too small to pay for pickling; results are
+    yielded in project order as soon as each chunk finishes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 50, process_threshold_tasks: int = 20000):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.process_threshold_tasks = process_threshold_tasks
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+    def _executor_for(self, projects: List[Project]) -> Executor:
+        total_tasks = sum(len(p.tasks) for p in projects)
+        if total_tasks >= self.process_threshold_tasks and self.max_workers > 1:
+            if self._process_pool is None:
+                # spawn avoids forking a process that is running an event loop and threads
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._thread_pool
+
+    async def stream(
+        self,
+        projects: List[Project],
+        previous_scores: Optional[Dict[str, float]] = None
+    ) -> AsyncIterator[dict]:
+        """Yield one summary per project, in input order."""
+        if not projects:
+            return
+        previous_scores = previous_scores or {}
+        loop = asyncio.get_running_loop()
+        executor = self._executor_for(projects)
+        # Resolved here so process pool workers score with this process's (possibly reloaded) plans
+        plans = _get_calculator().plans
+        futures = []
+        for start in range(0, len(projects), self.chunk_size):
+            chunk = projects[start:start + self.chunk_size]
+            chunk_previous = {p.id: previous_scores[p.id] for p in chunk if p.id in previous_scores}
+            futures.append(loop.run_in_executor(executor, score_chunk, chunk, chunk_previous, plans))
+        try:
+            for future in futures:
+                for summary in await future:
+                    yield summary
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(cancel_futures=True)
+            self._thread_pool = None
@@ -0,0 +1,244 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import Project, HealthReport, Recommendation
+    from .report_cache import CachedReport
+    from .sqlite_store import SQLiteDatabase
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project, HealthReport, Recommendation
+    from report_cache import CachedReport
+    from sqlite_store import SQLiteDatabase
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, every process runs its own scheduler
+    fcntl = None
+
+
+class MaterializedReport:
+    __slots__ = ("project_id", "content_hash", "body", "computed_at")
+
+    def __init__(self, project_id: str, content_hash: int, body: bytes, computed_at: float):
+        self.project_id = project_id
+        self.content_hash = content_hash
+        self.body = body
+        self.computed_at = computed_at
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.computed_at
+
+
+class MaterializedReportStore:
+    """
+    Latest serialized health report per project in a SQLite table, written by
+    the precompute scheduler and read by request handlers in every worker.
+    Reports are keyed by the content hash of the project they were built
+    from, which every worker computes the same way from the same data.
+    """
+
+    def __init__(self, db_path: str):
+        self._db = SQLiteDatabase(db_path)
+        self._db.add_initializer(
+            "CREATE TABLE IF NOT EXISTS materialized_reports ("
+            " project_id TEXT PRIMARY KEY, content_hash INTEGER NOT NULL,"
+            " body BLOB NOT NULL, computed_at REAL NOT NULL)"
+        )
+
+    def get(self, project_id: str) -> Optional[MaterializedReport]:
+        with self._db.lock:
+            row = self._db.connection().execute(
+                "SELECT content_hash, body, computed_at FROM materialized_reports WHERE project_id = ?",
+                (project_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return MaterializedReport(project_id, row[0], bytes(row[1]), row[2])
+
+    def put(self, project_id: str, content_hash: int, cached: CachedReport) -> None:
+        with self._db.lock:
+            conn = self._db.connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO materialized_reports (project_id, content_hash, body, computed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (project_id, content_hash, cached.body, time.time())
+            )
+            conn.commit()
+
+    def delete(self, project_ids: Iterable[str]) -> None:
+        with self._db.lock:
+            conn = self._db.connection()
+            conn.executemany("DELETE FROM materialized_reports WHERE project_id = ?", [(pid,) for pid in project_ids])
+            conn.commit()
+
+    def states(self) -> Dict[str, Tuple[int, float]]:
+        """(content_hash, computed_at) of every stored report."""
+        with self._db.lock:
+            rows = self._db.connection().execute(
+                "SELECT project_id, content_hash, computed_at FROM materialized_reports"
+            ).fetchall()
+        return {project_id: (content_hash, computed_at) for project_id, content_hash, computed_at in rows}
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class SchedulerLock:
+    """
+    Non-blocking exclusive lock on a file next to the report store, so only
+    one of the workers sharing the store runs the precompute scheduler. The
+    OS releases it when the holder exits; a replacement worker picks it up
+    when it starts.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        if fcntl is None or self._file is not None:
+            return True
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        f = open(self.path, "a")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        self._file = f
+        return True
+
+    def release(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ReportScheduler:
+    """
+    Recomputes health reports in the background so handlers can serve them
+    from the materialized store. Each cycle refreshes changed projects first,
+    then the stalest ones, up to ``batch_size`` projects. Recommendations are
+    regenerated for a project at most once per ``recommendation_interval_seconds``;
+    in between, its last recommendations are reused.
+    """
+
+    def __init__(
+        self,
+        get_projects: Callable[[], List[Project]],
+        get_content_hashes: Callable[[List[Project]], Awaitable[List[int]]],
+        build_report: Callable[[Project, Optional[List[Recommendation]]], Awaitable[HealthReport]],
+        store: MaterializedReportStore,
+        interval_seconds: float = 60,
+        stale_seconds: float = 240,
+        batch_size: int = 100,
+        recommendation_interval_seconds: float = 900
+    ):
+        self.get_projects = get_projects
+        self.get_content_hashes = get_content_hashes
+        self.build_report = build_report
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self.stale_seconds = stale_seconds
+        self.batch_size = batch_size
+        self.recommendation_interval_seconds = recommendation_interval_seconds
+        self._recommendations: Dict[str, Tuple[float, List[Recommendation]]] = {}
+        self._started_at = time.time()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._started_at = time.time()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify_change(self, project_id: str, version: int) -> None:
+        """Change listener: start the next cycle early so changed projects refresh promptly."""
+        if self._wakeup is not None and self._task is not None:
+            self._task.get_loop().call_soon_threadsafe(self._wakeup.set)
+
+    def invalidate_all(self) -> None:
+        """Treat every stored report as outdated, e.g. after the scoring plans change."""
+        self._started_at = time.time()
+        self.notify_change("", 0)
+
+    async def due_projects(self) -> List[Project]:
+        """
+        Projects needing a refresh, changed ones first, then oldest first.
+        Stored reports of projects the adapter no longer holds are deleted.
+        Store reads and writes run in the executor, as does hashing.
+        """
+        loop = asyncio.get_running_loop()
+        states = await loop.run_in_executor(None, self.store.states)
+        projects = self.get_projects()
+        gone = states.keys() - {project.id for project in projects}
+        if gone:
+            await loop.run_in_executor(None, self.store.delete, gone)
+        # Only projects with a current stored report need their hash compared
+        stored = [
+            project for project in projects
+            if project.id in states and states[project.id][1] >= self._started_at
+        ]
+        hashes = dict(zip((project.id for project in stored), await self.get_content_hashes(stored)))
+        now = time.time()
+        due = []
+        for project in projects:
+            state = states.get(project.id)
+            if project.id not in hashes:
+                due.append((0, 0.0, project))
+            elif state[0] != hashes[project.id]:
+                due.append((0, state[1], project))
+            elif now - state[1] >= self.stale_seconds:
+                due.append((1, state[1], project))
+        due.sort(key=lambda item: (item[0], item[1]))
+        return [project for _, _, project in due[:self.batch_size]]
+
+    async def run_once(self) -> int:
+        """Refresh one batch of due projects. Returns how many were refreshed."""
+        projects = await self.due_projects()
+        for project in projects:
+            await self.refresh(project)
+            # Let request handlers run between projects
+            await asyncio.sleep(0)
+        return len(projects)
+
+    async def refresh(self, project: Project) -> CachedReport:
+        content_hash = (await self.get_content_hashes([project]))[0]
+        recent = self._recommendations.get(project.id)
+        reuse = None
+        if recent is not None and time.monotonic() - recent[0] < self.recommendation_interval_seconds:
+            reuse = recent[1]
+        report = await self.build_report(project, reuse)
+        if reuse is None:
+            self._recommendations[project.id] = (time.monotonic(), report.recommendations)
+        cached = CachedReport.from_report(content_hash, report)
+        await asyncio.get_running_loop().run_in_executor(None, self.store.put, project.id, content_hash, cached)
+        return cached
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"Error precomputing health reports: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
@@ -0,0 +1,46 @@
+from typing import List, Optional
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import HealthScore, Risk, Recommendation
+    from .cache import TTLCache
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import HealthScore, Risk, Recommendation
+    from cache import TTLCache
+
+
+def recommendation_signature(health_score: HealthScore, risks: List[Risk], bucket_width: float) -> tuple:
+    """
+    Quantized summary of everything the recommendation prompt depends on:
+    bucketed dimension scores, health status and the set of (risk id, severity).
+    """
+    buckets = tuple((dim.name, int(dim.score // bucket_width)) for dim in health_score.dimensions)
+    risk_set = tuple(sorted((risk.id, risk.severity) for risk in risks))
+    return (health_score.status.value, buckets, risk_set)
+
+
+class RecommendationCache:
+    """
+    LLM recommendations shared by projects in the same quantized health state.
+    Wider buckets mean more sharing at the cost of less tailored advice.
+    """
+
+    def __init__(self, bucket_width: float = 10, ttl_seconds: Optional[float] = 3600, max_entries: int = 1024):
+        self.bucket_width = bucket_width
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def get(self, health_score: HealthScore, risks: List[Risk]) -> Optional[List[Recommendation]]:
+        cached = self._cache.get(recommendation_signature(health_score, risks, self.bucket_width))
+        return list(cached) if cached is not None else None
+
+    def put(self, health_score: HealthScore, risks: List[Risk], recommendations: List[Recommendation]) -> None:
+        self._cache.set(
+            recommendation_signature(health_score, risks, self.bucket_width),
+            tuple(recommendations)
+        )
+
+    def stats(self) -> dict:
+        return self._cache.stats()
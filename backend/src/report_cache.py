@@ -0,0 +1,72 @@
+import hashlib
+from typing import Optional
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import HealthReport
+    from .cache import TTLCache
+    from .serialization import dump_model
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import HealthReport
+    from cache import TTLCache
+    from serialization import dump_model
+
+
+class CachedReport:
+    """A serialized health report and its strong ETag."""
+
+    __slots__ = ("version", "body", "etag")
+
+    def __init__(self, version: int, body: bytes):
+        self.version = version
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+    @classmethod
+    def from_report(cls, version: int, report: HealthReport) -> "CachedReport":
+        return cls(version, dump_model(report))
+
+
+class ReportCache:
+    """
+    Health reports keyed by project ID and project content version.
+    A report is served until the project's version changes, it is explicitly
+    invalidated, or its TTL passes (aging and deadlines move with time).
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 300):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def get(self, project_id: str, version: int) -> Optional[CachedReport]:
+        cached = self._cache.get(project_id)
+        if cached is None or cached.version != version:
+            return None
+        return cached
+
+    def put(self, project_id: str, version: int, report: HealthReport) -> CachedReport:
+        return self.put_cached(project_id, CachedReport.from_report(version, report))
+
+    def put_cached(self, project_id: str, cached: CachedReport) -> CachedReport:
+        self._cache.set(project_id, cached)
+        return cached
+
+    def invalidate(self, project_id: str) -> None:
+        self._cache.pop(project_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = [value.strip().replace("W/", "", 1) for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
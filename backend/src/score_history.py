@@ -0,0 +1,240 @@
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+import sys
+import os
+
+# Handle imports
+try:
+    from .sqlite_store import SQLiteDatabase
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from sqlite_store import SQLiteDatabase
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS score_history (
+    project_id TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    score REAL NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_score_history_project_time
+    ON score_history (project_id, recorded_at);
+"""
+
+
+class ScorePoint:
+    __slots__ = ("project_id", "recorded_at", "score", "status")
+
+    def __init__(self, project_id: str, recorded_at: datetime, score: float, status: str):
+        self.project_id = project_id
+        self.recorded_at = recorded_at
+        self.score = score
+        self.status = status
+
+    def to_dict(self) -> dict:
+        return {
+            "recorded_at": self.recorded_at.isoformat(),
+            "score": self.score,
+            "status": self.status,
+        }
+
+
+class ScoreHistoryStore:
+    """
+    Append-only health score history in SQLite (WAL mode).
+    Writes are buffered and flushed in batches by a background thread; reads
+    merge the samples still in this process's buffer, so they never wait for a
+    flush. Every worker process sharing the database file sees the same
+    flushed history, so trends agree across workers.
+    Old samples are downsampled to one per bucket and dropped after the retention period.
+    A project gets at most one sample per ``min_interval_seconds`` from each
+    process, so frequently polled endpoints do not flood the table.
+    """
+
+    # Project IDs per query, well below SQLite's bound parameter limit
+    QUERY_CHUNK = 400
+
+    def __init__(
+        self,
+        db_path: str,
+        flush_interval_seconds: float = 1.0,
+        max_batch: int = 500,
+        retention_days: float = 365,
+        downsample_after_days: float = 7,
+        downsample_bucket_seconds: float = 3600,
+        maintenance_interval_seconds: float = 3600,
+        min_interval_seconds: float = 0
+    ):
+        self._db = SQLiteDatabase(db_path)
+        self._db.add_initializer(SCHEMA)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch = max_batch
+        self.retention_days = retention_days
+        self.downsample_after_days = downsample_after_days
+        self.downsample_bucket_seconds = downsample_bucket_seconds
+        self.maintenance_interval_seconds = maintenance_interval_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self._last_recorded: Dict[str, float] = {}  # project_id -> timestamp of its latest sample
+        self._buffer: List[tuple] = []
+        self._writing: List[tuple] = []  # taken from the buffer, not yet committed
+        self._buffer_lock = threading.Lock()
+        self._last_maintenance = 0.0
+        self._flusher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+
+    def record(self, project_id: str, score: float, status: str, recorded_at: Optional[datetime] = None) -> None:
+        """
+        Queue a score sample; it is written with the next batch. Never touches the database.
+        Dropped if the project already has a sample less than ``min_interval_seconds`` older.
+        """
+        timestamp = (recorded_at or datetime.now()).timestamp()
+        with self._buffer_lock:
+            last = self._last_recorded.get(project_id)
+            if last is not None and 0 <= timestamp - last < self.min_interval_seconds:
+                return
+            self._last_recorded[project_id] = timestamp
+            self._buffer.append((project_id, timestamp, score, status))
+            full = len(self._buffer) >= self.max_batch
+        self._ensure_flusher()
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Write all buffered samples in one transaction."""
+        with self._db.lock:
+            with self._buffer_lock:
+                rows, self._buffer = self._buffer, []
+                self._writing = rows
+            if not rows:
+                return
+            try:
+                conn = self._db.connection()
+                conn.executemany(
+                    "INSERT INTO score_history (project_id, recorded_at, score, status) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                conn.commit()
+            finally:
+                # Readers hold the database lock, so they see these rows either here or in the table
+                with self._buffer_lock:
+                    self._writing = []
+        if time.monotonic() - self._last_maintenance >= self.maintenance_interval_seconds:
+            self.maintain()
+
+    def _pending(self, project_ids) -> List[tuple]:
+        """Unflushed samples of the given projects. Call with the database lock held."""
+        with self._buffer_lock:
+            return [row for row in self._writing + self._buffer if row[0] in project_ids]
+
+    def history(
+        self,
+        project_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[ScorePoint]:
+        """Samples for a project within [since, until], oldest first."""
+        start = since.timestamp() if since else float("-inf")
+        end = until.timestamp() if until else float("inf")
+        with self._db.lock:
+            rows = self._db.connection().execute(
+                "SELECT recorded_at, score, status FROM score_history"
+                " WHERE project_id = ? AND recorded_at BETWEEN ? AND ?"
+                " ORDER BY recorded_at",
+                (project_id, start, end)
+            ).fetchall()
+            pending = self._pending((project_id,))
+        pending = [row[1:] for row in pending if start <= row[1] <= end]
+        if pending:
+            rows = sorted(rows + pending, key=lambda row: row[0])
+        return [ScorePoint(project_id, datetime.fromtimestamp(ts), score, status) for ts, score, status in rows]
+
+    def previous_score(self, project_id: str, min_age_seconds: float = 0) -> Optional[float]:
+        return self.previous_scores([project_id], min_age_seconds).get(project_id)
+
+    def previous_scores(self, project_ids: List[str], min_age_seconds: float = 0) -> Dict[str, float]:
+        """
+        Baseline score for trends: the latest sample at least ``min_age_seconds`` old,
+        or the oldest sample if none is that old yet.
+        """
+        if not project_ids:
+            return {}
+        cutoff = time.time() - min_age_seconds
+        # project_id -> [(recorded_at, score) of the latest sample before the cutoff, of the oldest sample]
+        candidates: Dict[str, List[Optional[tuple]]] = {}
+
+        def consider(project_id: str, kind: int, recorded_at: float, score: float) -> None:
+            best = candidates.setdefault(project_id, [None, None])
+            current = best[kind]
+            if current is None or (recorded_at > current[0] if kind == 0 else recorded_at < current[0]):
+                best[kind] = (recorded_at, score)
+
+        with self._db.lock:
+            conn = self._db.connection()
+            for i in range(0, len(project_ids), self.QUERY_CHUNK):
+                chunk = project_ids[i:i + self.QUERY_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                # SQLite takes the bare score column from the row holding the MAX/MIN
+                rows = conn.execute(
+                    "SELECT 0, project_id, MAX(recorded_at), score FROM score_history"
+                    f" WHERE project_id IN ({marks}) AND recorded_at <= ? GROUP BY project_id"
+                    " UNION ALL"
+                    " SELECT 1, project_id, MIN(recorded_at), score FROM score_history"
+                    f" WHERE project_id IN ({marks}) GROUP BY project_id",
+                    (*chunk, cutoff, *chunk)
+                ).fetchall()
+                for kind, project_id, recorded_at, score in rows:
+                    consider(project_id, kind, recorded_at, score)
+            pending = self._pending(set(project_ids))
+        for project_id, recorded_at, score, _ in pending:
+            if recorded_at <= cutoff:
+                consider(project_id, 0, recorded_at, score)
+            consider(project_id, 1, recorded_at, score)
+        return {
+            project_id: (latest or oldest)[1]
+            for project_id, (latest, oldest) in candidates.items()
+        }
+
+    def maintain(self) -> None:
+        """Drop samples past retention and downsample old ones to one per bucket."""
+        self._last_maintenance = time.monotonic()
+        now = time.time()
+        retention_cutoff = now - self.retention_days * 86400
+        downsample_cutoff = now - self.downsample_after_days * 86400
+        with self._db.lock:
+            conn = self._db.connection()
+            conn.execute("DELETE FROM score_history WHERE recorded_at < ?", (retention_cutoff,))
+            conn.execute(
+                "DELETE FROM score_history WHERE recorded_at < ? AND rowid NOT IN ("
+                " SELECT MAX(rowid) FROM score_history WHERE recorded_at < ?"
+                " GROUP BY project_id, CAST(recorded_at / ? AS INTEGER))",
+                (downsample_cutoff, downsample_cutoff, self.downsample_bucket_seconds)
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        self.flush()
+        self._db.close()
+
+    def _ensure_flusher(self) -> None:
+        # Background thread so buffered samples reach other workers without waiting for the next batch
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._stopped.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="score-history-flusher", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        # Wakes early when record() fills a batch
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error flushing score history: {e}")
@@ -0,0 +1,317 @@
+"""
+Compiled scoring plans.
+
+scoring_config.json is resolved once into flat, immutable ScoringPlan
+tuples: dimension weights, status thresholds and every penalty coefficient
+the dimension formulas use. Named profiles override parts of the base
+configuration and are assigned to projects by ID; projects without a
+profile use the default plan.
+
+The compiled plans are held in one process-wide reference. A
+ScoringPlanWatcher polls the config file and swaps that reference when the
+file changes, so new weights apply without a restart. A calculator reads
+the reference once per score, so a swap never mixes two plans in one score.
+"""
+import json
+import os
+import sys
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+# Handle imports
+try:
+    from .config import SCORING_CONFIG_PATH
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from config import SCORING_CONFIG_PATH
+
+DEFAULT_PROFILE = "default"
+
+
+class ScoringPlan(NamedTuple):
+    """Every coefficient of the health score for one profile. Defaults are the built-in values."""
+
+    profile: str = DEFAULT_PROFILE
+
+    # Dimension weights
+    delivery_weight: float = 0.30
+    workload_weight: float = 0.20
+    sentiment_weight: float = 0.25
+    risk_weight: float = 0.15
+    momentum_weight: float = 0.10
+
+    # Status thresholds and trend
+    healthy_threshold: float = 80
+    watch_threshold: float = 60
+    trend_margin: float = 5
+
+    # Signal thresholds
+    aging_threshold_days: int = 7
+    overload_threshold_tasks: float = 10
+    underutilization_threshold_tasks: float = 2
+
+    # Delivery health: ratio of tasks times coefficient
+    aging_penalty: float = 30
+    overdue_penalty: float = 40
+    done_reward: float = 20
+    in_progress_reward: float = 10
+
+    # Workload balance
+    overload_penalty_rate: float = 20
+    overload_penalty_cap: float = 30
+    underutilization_penalty: float = 15
+    imbalance_ratio: float = 0.5  # standard deviation above this fraction of the mean
+    imbalance_penalty: float = 20
+
+    # Communication & sentiment
+    sentiment_base: float = 50
+    sentiment_swing: float = 50
+    recent_negative_ratio: float = 0.3
+    recent_negative_penalty: float = 10
+
+    # Risk & dependency signals
+    blocked_penalty: float = 40
+    reopened_penalty: float = 30
+    risk_tag_penalty: float = 20
+
+    # Momentum trend
+    improving_ratio: float = 1.2
+    stable_ratio: float = 0.8
+    improving_score: float = 80
+    stable_score: float = 60
+    declining_score: float = 30
+    momentum_health_margin: float = 5
+    momentum_health_adjustment: float = 20
+
+
+# Plan field -> location in scoring_config.json
+_CONFIG_KEYS = {
+    "delivery_weight": ("dimension_weights", "delivery_health"),
+    "workload_weight": ("dimension_weights", "workload_balance"),
+    "sentiment_weight": ("dimension_weights", "communication_sentiment"),
+    "risk_weight": ("dimension_weights", "risk_signals"),
+    "momentum_weight": ("dimension_weights", "momentum_trend"),
+    "healthy_threshold": ("health_thresholds", "healthy"),
+    "watch_threshold": ("health_thresholds", "watch"),
+    "trend_margin": ("health_thresholds", "trend_margin"),
+    "aging_threshold_days": ("aging_task_threshold_days",),
+    "overload_threshold_tasks": ("overload_threshold_tasks",),
+    "underutilization_threshold_tasks": ("underutilization_threshold_tasks",),
+    "aging_penalty": ("penalties", "delivery", "aging"),
+    "overdue_penalty": ("penalties", "delivery", "overdue"),
+    "done_reward": ("penalties", "delivery", "done_reward"),
+    "in_progress_reward": ("penalties", "delivery", "in_progress_reward"),
+    "overload_penalty_rate": ("penalties", "workload", "overload_rate"),
+    "overload_penalty_cap": ("penalties", "workload", "overload_cap"),
+    "underutilization_penalty": ("penalties", "workload", "underutilization"),
+    "imbalance_ratio": ("penalties", "workload", "imbalance_ratio"),
+    "imbalance_penalty": ("penalties", "workload", "imbalance"),
+    "sentiment_base": ("penalties", "sentiment", "base"),
+    "sentiment_swing": ("penalties", "sentiment", "swing"),
+    "recent_negative_ratio": ("penalties", "sentiment", "recent_negative_ratio"),
+    "recent_negative_penalty": ("penalties", "sentiment", "recent_negative"),
+    "blocked_penalty": ("penalties", "risk", "blocked"),
+    "reopened_penalty": ("penalties", "risk", "reopened"),
+    "risk_tag_penalty": ("penalties", "risk", "risk_tag"),
+    "improving_ratio": ("penalties", "momentum", "improving_ratio"),
+    "stable_ratio": ("penalties", "momentum", "stable_ratio"),
+    "improving_score": ("penalties", "momentum", "improving_score"),
+    "stable_score": ("penalties", "momentum", "stable_score"),
+    "declining_score": ("penalties", "momentum", "declining_score"),
+    "momentum_health_margin": ("penalties", "momentum", "health_margin"),
+    "momentum_health_adjustment": ("penalties", "momentum", "health_adjustment"),
+}
+_PLAN_SECTIONS = ("dimension_weights", "health_thresholds", "penalties") + tuple(
+    path[0] for path in _CONFIG_KEYS.values() if len(path) == 1
+)
+
+
+def _merge(base: dict, overrides: dict, where: str) -> dict:
+    """Recursively apply ``overrides`` to ``base``, rejecting keys the base config does not know."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(merged.get(key), dict):
+            if not isinstance(value, dict):
+                raise ValueError(f"{where}.{key} must be an object")
+            merged[key] = _merge(merged[key], value, f"{where}.{key}")
+        elif key in merged:
+            merged[key] = value
+        else:
+            raise ValueError(f"Unknown scoring setting {where}.{key}")
+    return merged
+
+
+def _defaults_config() -> dict:
+    """The built-in plan in scoring_config.json shape, so profiles can override settings the file omits."""
+    config: dict = {}
+    defaults = ScoringPlan()
+    for field, path in _CONFIG_KEYS.items():
+        node = config
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = getattr(defaults, field)
+    return config
+
+
+def compile_plan(config: dict, profile: str = DEFAULT_PROFILE) -> ScoringPlan:
+    """Resolve one scoring_config.json-shaped dict into a validated ScoringPlan."""
+    values = {}
+    for field, path in _CONFIG_KEYS.items():
+        node = config
+        for key in path:
+            node = node[key]
+        if isinstance(node, bool) or not isinstance(node, (int, float)):
+            raise ValueError(f"Scoring setting {'.'.join(path)} must be a number")
+        values[field] = node
+    plan = ScoringPlan(profile=profile, **values)
+
+    total_weight = (
+        plan.delivery_weight + plan.workload_weight + plan.sentiment_weight
+        + plan.risk_weight + plan.momentum_weight
+    )
+    if abs(total_weight - 1.0) > 1e-6:
+        raise ValueError(f"Dimension weights of profile '{profile}' sum to {total_weight:g}, not 1")
+    if plan.watch_threshold > plan.healthy_threshold:
+        raise ValueError(f"Watch threshold of profile '{profile}' is above its healthy threshold")
+    return plan
+
+
+class ScoringPlans:
+    """The default plan, the named profile plans and the project-to-profile assignments."""
+
+    __slots__ = ("default", "profiles", "project_profiles", "modified_at")
+
+    def __init__(
+        self,
+        default: ScoringPlan,
+        profiles: Optional[Dict[str, ScoringPlan]] = None,
+        project_profiles: Optional[Dict[str, str]] = None,
+        modified_at: float = 0.0
+    ):
+        self.default = default
+        self.profiles: Mapping[str, ScoringPlan] = MappingProxyType(dict(profiles or {}))
+        self.project_profiles: Mapping[str, str] = MappingProxyType(dict(project_profiles or {}))
+        self.modified_at = modified_at  # mtime of the config file the plans were compiled from
+
+    def __reduce__(self):
+        # MappingProxyType does not pickle; process pool workers receive plain dicts
+        return (
+            ScoringPlans,
+            (self.default, dict(self.profiles), dict(self.project_profiles), self.modified_at)
+        )
+
+    @classmethod
+    def from_config(cls, config: dict, modified_at: float = 0.0) -> "ScoringPlans":
+        """Compile the base configuration and every profile in ``config["profiles"]``."""
+        base = _merge(
+            _defaults_config(),
+            {key: value for key, value in config.items() if key in _PLAN_SECTIONS},
+            "scoring"
+        )
+        profiles = {
+            name: compile_plan(_merge(base, overrides, f"profiles.{name}"), name)
+            for name, overrides in config.get("profiles", {}).items()
+        }
+        project_profiles = config.get("project_profiles", {})
+        for project_id, name in project_profiles.items():
+            if name not in profiles:
+                raise ValueError(f"Project {project_id} uses unknown scoring profile '{name}'")
+        return cls(compile_plan(base), profiles, project_profiles, modified_at)
+
+    def for_project(self, project_id: Optional[str]) -> ScoringPlan:
+        """The plan of a project's assigned profile, or the default plan."""
+        name = self.project_profiles.get(project_id) if project_id is not None else None
+        return self.profiles[name] if name is not None else self.default
+
+
+def load_scoring_plans(path: str = SCORING_CONFIG_PATH) -> ScoringPlans:
+    """Read and compile a scoring config file."""
+    modified_at = os.stat(path).st_mtime
+    with open(path, "r") as f:
+        config = json.load(f)
+    return ScoringPlans.from_config(config, modified_at)
+
+
+_current: Optional[ScoringPlans] = None
+_current_lock = threading.Lock()
+
+
+def current_plans() -> ScoringPlans:
+    """The process-wide scoring plans, compiled from SCORING_CONFIG_PATH on first use."""
+    plans = _current
+    if plans is None:
+        with _current_lock:
+            if _current is None:
+                set_current_plans(load_scoring_plans())
+            plans = _current
+    return plans
+
+
+def set_current_plans(plans: ScoringPlans) -> Optional[ScoringPlans]:
+    """Swap in new process-wide plans. Returns the previous ones."""
+    global _current
+    previous = _current
+    _current = plans
+    return previous
+
+
+class ScoringPlanWatcher:
+    """
+    Polls a scoring config file and swaps in recompiled plans when its mtime
+    changes. A file that fails to parse or validate is reported and the
+    current plans stay in place.
+    """
+
+    def __init__(
+        self,
+        path: str = SCORING_CONFIG_PATH,
+        interval_seconds: float = 5.0,
+        on_change: Optional[Callable[[ScoringPlans, ScoringPlans], None]] = None
+    ):
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.on_change = on_change  # called with (previous, current) after a swap
+        self._seen_mtime = current_plans().modified_at
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def check(self) -> bool:
+        """Reload the file if it changed since the last check. Returns whether plans were swapped."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            print(f"Error reading scoring config: {e}")
+            return False
+        if mtime == self._seen_mtime:
+            return False
+        self._seen_mtime = mtime
+        try:
+            plans = load_scoring_plans(self.path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error compiling scoring config, keeping the current plans: {e!r}")
+            return False
+        previous = set_current_plans(plans)
+        print(f"Reloaded scoring config {self.path} ({len(plans.profiles)} profiles)")
+        if self.on_change is not None:
+            try:
+                self.on_change(previous, plans)
+            except Exception as e:
+                print(f"Error applying scoring config change: {e}")
+        return True
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="scoring-plan-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            self.check()
@@ -0,0 +1,141 @@
+import hashlib
+import time
+from typing import List, Optional
+import sys
+import os
+
+# Handle imports
+try:
+    from .cache import TTLCache
+    from .sqlite_store import SQLiteDatabase
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from cache import TTLCache
+    from sqlite_store import SQLiteDatabase
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold and collapse whitespace so trivially different copies share an entry."""
+    return " ".join(text.casefold().split())
+
+
+def text_key(text: str) -> str:
+    """Content address of a text: SHA-256 of its normalized form."""
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+
+class SentimentCache:
+    """
+    Content-addressed sentiment cache.
+    A bounded in-memory LRU sits in front of an optional SQLite tier that
+    survives restarts and is shared by every worker using the same file.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: Optional[float] = None, db_path: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self._memory = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._db = None
+        if db_path:
+            self._db = SQLiteDatabase(db_path)
+            self._db.add_initializer(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                " key TEXT PRIMARY KEY, sentiment TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def persistent(self) -> bool:
+        return self._db is not None
+
+    def get(self, text: str) -> Optional[str]:
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: List[str]) -> List[Optional[str]]:
+        """Look up many texts in both tiers; entries found on disk are promoted to memory."""
+        keys = [text_key(text) for text in texts]
+        return self.load(keys, self.lookup(keys))
+
+    def lookup(self, keys: List[str]) -> List[Optional[str]]:
+        """Memory-tier results for cache keys, None for misses; never touches the disk."""
+        return [self._memory.get(key) for key in keys]
+
+    def load(self, keys: List[str], results: List[Optional[str]]) -> List[Optional[str]]:
+        """
+        Fill the misses in ``lookup`` results from the disk tier and count the lookup.
+        Entries found on disk are promoted to memory with the expiry they were stored with.
+        Reads SQLite when there are misses, so async callers run it in an executor.
+        """
+        results = list(results)
+        missing = [key for key, result in zip(keys, results) if result is None]
+        if missing and self._db is not None:
+            found = self._load(missing)
+            now = time.time()
+            for i, key in enumerate(keys):
+                if results[i] is None and key in found:
+                    sentiment, created_at = found[key]
+                    ttl = created_at + self.ttl_seconds - now if self.ttl_seconds else None
+                    if ttl is not None and ttl <= 0:
+                        continue
+                    results[i] = sentiment
+                    self._memory.set(key, sentiment, ttl)
+                    self.disk_hits += 1
+        hits = sum(1 for result in results if result is not None)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    def set(self, text: str, sentiment: str) -> None:
+        self.set_many([(text, sentiment)])
+
+    def set_many(self, items: List[tuple]) -> None:
+        """Store (text, sentiment) pairs in memory and, if configured, on disk."""
+        self.store(self.remember(items))
+
+    def remember(self, items: List[tuple]) -> List[tuple]:
+        """Store (text, sentiment) pairs in memory only; returns the rows to pass to ``store``."""
+        rows = [(text_key(text), sentiment, time.time()) for text, sentiment in items]
+        for key, sentiment, _ in rows:
+            self._memory.set(key, sentiment)
+        return rows
+
+    def store(self, rows: List[tuple]) -> None:
+        """Write rows from ``remember`` to the disk tier, if configured; async callers run it in an executor."""
+        if self._db is not None and rows:
+            with self._db.lock:
+                conn = self._db.connection()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache (key, sentiment, created_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                conn.commit()
+
+    def _load(self, keys: List[str]) -> dict:
+        """Unexpired disk entries by key, as (sentiment, created_at)."""
+        cutoff = time.time() - self.ttl_seconds if self.ttl_seconds else 0
+        found = {}
+        with self._db.lock:
+            conn = self._db.connection()
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, sentiment, created_at FROM sentiment_cache"
+                    f" WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*chunk, cutoff)
+                ).fetchall()
+                found.update((key, (sentiment, created_at)) for key, sentiment, created_at in rows)
+        return found
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "memory": self._memory.stats(),
+            "persistent": self._db is not None,
+        }
@@ -0,0 +1,46 @@
+"""
+JSON serialization fast path for API responses.
+
+Reports are trusted internal models, so they are written straight from
+their field values with orjson instead of going through FastAPI's
+response_model validation and jsonable_encoder. Pydantic's own serializer
+is the fallback when orjson is not installed; both produce the same JSON.
+"""
+import json
+from typing import Any
+
+from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    orjson = None
+    FastJSONResponse = JSONResponse
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None else 0
+)
+
+
+def _model_fields(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_model(model: BaseModel) -> bytes:
+    """Serialize a model without re-validating it."""
+    if orjson is None:
+        return model.model_dump_json().encode()
+    # Untyped dicts (DimensionScore.details) are far cheaper for orjson than for pydantic
+    return orjson.dumps(model, default=_model_fields, option=_ORJSON_OPTIONS)
+
+
+def dumps(value: Any) -> str:
+    """Serialize plain JSON data to a string."""
+    if orjson is None:
+        return json.dumps(value)
+    return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
@@ -1,25 +1,272 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import gc
+import hmac
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
-from datetime import datetime
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
 import sys
 import os
 
 # Handle imports - support both relative (package) and absolute (script) imports
 try:
-    from .models import HealthReport, Project
+    from .models import HealthReport, Project, Recommendation, SentimentBatchRequest, SentimentBatchResponse
     from .data_adapter import DataAdapter
     from .health_calculator import HealthCalculator
-    from .ai_service import AIService
+    from .ai_service import AsyncAIService
+    from .report_cache import CachedReport, ReportCache, etag_matches
+    from .portfolio import PortfolioScorer
+    from .score_history import ScoreHistoryStore
+    from .health_events import HealthEventBroker
+    from .precompute import MaterializedReportStore, ReportScheduler, SchedulerLock
+    from .connectors import RestTrackerConnector
+    from .serialization import FastJSONResponse, dumps
+    from .metrics import MetricsRegistry, MetricsMiddleware
+    from .scoring_plan import ScoringPlanWatcher, current_plans
+    from .config import (
+        REPORT_CACHE_SIZE, REPORT_CACHE_TTL_SECONDS, PORTFOLIO_WORKERS,
+        PORTFOLIO_CHUNK_SIZE, PORTFOLIO_PROCESS_THRESHOLD_TASKS,
+        SCORE_HISTORY_DB, SCORE_HISTORY_FLUSH_SECONDS, SCORE_HISTORY_BASELINE_SECONDS,
+        SCORE_HISTORY_MIN_INTERVAL_SECONDS, SCORE_HISTORY_RETENTION_DAYS, SCORE_HISTORY_DOWNSAMPLE_AFTER_DAYS,
+        SCORE_HISTORY_DOWNSAMPLE_BUCKET_SECONDS, HEALTH_EVENT_BUFFER_SIZE,
+        HEALTH_EVENT_KEEPALIVE_SECONDS, REPORT_STORE_DB, PRECOMPUTE_ENABLED,
+        PRECOMPUTE_INTERVAL_SECONDS, PRECOMPUTE_STALE_SECONDS, PRECOMPUTE_BATCH_SIZE,
+        PRECOMPUTE_RECOMMENDATION_INTERVAL_SECONDS, DATA_SOURCE, TRACKER_BASE_URL,
+        TRACKER_API_TOKEN, TRACKER_PAGE_SIZE, TRACKER_MAX_CONCURRENCY, TRACKER_MAX_RETRIES,
+        TRACKER_SYNC_INTERVAL_SECONDS, TRACKER_FULL_SYNC_INTERVAL_SECONDS, TRACKER_SYNC_OVERLAP_SECONDS,
+        DATA_FILE, BULK_LOAD_BATCH_SIZE, ADMIN_API_TOKEN,
+        SCORING_CONFIG_PATH, SCORING_CONFIG_WATCH_SECONDS, server_worker_count
+    )
 except ImportError:
     # If relative imports fail, use absolute imports
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from models import HealthReport, Project
+    from models import HealthReport, Project, Recommendation, SentimentBatchRequest, SentimentBatchResponse
     from data_adapter import DataAdapter
     from health_calculator import HealthCalculator
-    from ai_service import AIService
+    from ai_service import AsyncAIService
+    from report_cache import CachedReport, ReportCache, etag_matches
+    from portfolio import PortfolioScorer
+    from score_history import ScoreHistoryStore
+    from health_events import HealthEventBroker
+    from precompute import MaterializedReportStore, ReportScheduler, SchedulerLock
+    from connectors import RestTrackerConnector
+    from serialization import FastJSONResponse, dumps
+    from metrics import MetricsRegistry, MetricsMiddleware
+    from scoring_plan import ScoringPlanWatcher, current_plans
+    from config import (
+        REPORT_CACHE_SIZE, REPORT_CACHE_TTL_SECONDS, PORTFOLIO_WORKERS,
+        PORTFOLIO_CHUNK_SIZE, PORTFOLIO_PROCESS_THRESHOLD_TASKS,
+        SCORE_HISTORY_DB, SCORE_HISTORY_FLUSH_SECONDS, SCORE_HISTORY_BASELINE_SECONDS,
+        SCORE_HISTORY_MIN_INTERVAL_SECONDS, SCORE_HISTORY_RETENTION_DAYS, SCORE_HISTORY_DOWNSAMPLE_AFTER_DAYS,
+        SCORE_HISTORY_DOWNSAMPLE_BUCKET_SECONDS, HEALTH_EVENT_BUFFER_SIZE,
+        HEALTH_EVENT_KEEPALIVE_SECONDS, REPORT_STORE_DB, PRECOMPUTE_ENABLED,
+        PRECOMPUTE_INTERVAL_SECONDS, PRECOMPUTE_STALE_SECONDS, PRECOMPUTE_BATCH_SIZE,
+        PRECOMPUTE_RECOMMENDATION_INTERVAL_SECONDS, DATA_SOURCE, TRACKER_BASE_URL,
+        TRACKER_API_TOKEN, TRACKER_PAGE_SIZE, TRACKER_MAX_CONCURRENCY, TRACKER_MAX_RETRIES,
+        TRACKER_SYNC_INTERVAL_SECONDS, TRACKER_FULL_SYNC_INTERVAL_SECONDS, TRACKER_SYNC_OVERLAP_SECONDS,
+        DATA_FILE, BULK_LOAD_BATCH_SIZE, ADMIN_API_TOKEN,
+        SCORING_CONFIG_PATH, SCORING_CONFIG_WATCH_SECONDS, server_worker_count
+    )
+
+# Initialize services
+if DATA_SOURCE == "tracker":
+    data_adapter = DataAdapter(use_mock=False, connector=RestTrackerConnector(
+        TRACKER_BASE_URL,
+        api_token=TRACKER_API_TOKEN or None,
+        page_size=TRACKER_PAGE_SIZE,
+        max_concurrency=TRACKER_MAX_CONCURRENCY,
+        max_retries=TRACKER_MAX_RETRIES,
+        overlap_seconds=TRACKER_SYNC_OVERLAP_SECONDS
+    ), full_sync_interval_seconds=TRACKER_FULL_SYNC_INTERVAL_SECONDS)
+elif DATA_SOURCE == "file":
+    data_adapter = DataAdapter(use_mock=False)
+    load_stats = data_adapter.load_file(DATA_FILE, batch_size=BULK_LOAD_BATCH_SIZE)
+    print(f"Loaded {DATA_FILE}: {load_stats.to_dict()}")
+else:
+    data_adapter = DataAdapter(use_mock=True)
+health_calculator = HealthCalculator()
+ai_service = AsyncAIService()
+report_cache = ReportCache(max_entries=REPORT_CACHE_SIZE, ttl_seconds=REPORT_CACHE_TTL_SECONDS)
+# Server workers split the CPUs between their portfolio pools
+portfolio_scorer = PortfolioScorer(
+    max_workers=PORTFOLIO_WORKERS or max(1, (os.cpu_count() or 1) // server_worker_count()),
+    chunk_size=PORTFOLIO_CHUNK_SIZE,
+    process_threshold_tasks=PORTFOLIO_PROCESS_THRESHOLD_TASKS
+)
+# Score history drives trends; it lives in SQLite so every worker sees the same baseline
+score_history = ScoreHistoryStore(
+    SCORE_HISTORY_DB,
+    flush_interval_seconds=SCORE_HISTORY_FLUSH_SECONDS,
+    retention_days=SCORE_HISTORY_RETENTION_DAYS,
+    downsample_after_days=SCORE_HISTORY_DOWNSAMPLE_AFTER_DAYS,
+    downsample_bucket_seconds=SCORE_HISTORY_DOWNSAMPLE_BUCKET_SECONDS,
+    min_interval_seconds=SCORE_HISTORY_MIN_INTERVAL_SECONDS
+)
+health_events = HealthEventBroker(
+    buffer_size=HEALTH_EVENT_BUFFER_SIZE,
+    keepalive_seconds=HEALTH_EVENT_KEEPALIVE_SECONDS
+)
+
+# Precomputed reports; handlers fall back to inline scoring when a stored report is missing or stale.
+# Workers sharing the store elect one of them to run the scheduler.
+report_store = MaterializedReportStore(REPORT_STORE_DB)
+scheduler_lock = SchedulerLock(REPORT_STORE_DB + ".scheduler.lock")
+report_scheduler = ReportScheduler(
+    get_projects=data_adapter.get_all_projects,
+    get_content_hashes=data_adapter.get_content_hashes,
+    build_report=lambda project, recommendations: _build_health_report(project, recommendations),
+    store=report_store,
+    interval_seconds=PRECOMPUTE_INTERVAL_SECONDS,
+    stale_seconds=PRECOMPUTE_STALE_SECONDS,
+    batch_size=PRECOMPUTE_BATCH_SIZE,
+    recommendation_interval_seconds=PRECOMPUTE_RECOMMENDATION_INTERVAL_SECONDS
+)
+
+
+# Projects with a rescore for the event stream in flight; later changes fold into it
+_pending_health_changes: Dict[str, asyncio.Task] = {}
+
+
+def _publish_health_change(project_id: str, version: int) -> None:
+    """Schedule a rescore of a changed project; the event is pushed only if its health moved."""
+    if project_id in _pending_health_changes:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Changes made outside the server's loop (e.g. loading at import) have no subscribers yet
+        return
+    task = loop.create_task(_rescore_and_publish(project_id))
+    _pending_health_changes[project_id] = task
+
+
+async def _rescore_and_publish(project_id: str) -> None:
+    """Rescore a changed project once and push an event to stream subscribers if its health moved."""
+    try:
+        # The baseline is a SQLite read, so it runs in the executor; scoring after it sees the latest state
+        previous_score = await _in_thread(score_history.previous_score, project_id, SCORE_HISTORY_BASELINE_SECONDS)
+        project = data_adapter.get_project(project_id)
+        if not project:
+            return
+        health_score = health_calculator.calculate_health_score_from_aggregates(
+            data_adapter.get_aggregates(project), project.team_members, previous_score, project_id
+        )
+        health_events.publish(project_id, health_score, health_calculator.detect_risks(project, health_score))
+    except Exception as e:
+        print(f"Error publishing health change for {project_id}: {e}")
+    finally:
+        _pending_health_changes.pop(project_id, None)
+
+
+# Drop cached reports as soon as the adapter sees a project change
+data_adapter.add_change_listener(lambda project_id, version: report_cache.invalidate(project_id))
+data_adapter.add_change_listener(_publish_health_change)
+data_adapter.add_change_listener(report_scheduler.notify_change)
+
+# Scoring plans are swapped in place when the config file changes; reports scored
+# with the previous plans are dropped, while sentiment and recommendation caches stay warm
+scoring_changed_at = 0.0
+
+
+def _apply_scoring_change(previous, plans) -> None:
+    global scoring_changed_at
+    scoring_changed_at = time.time()
+    report_cache.clear()
+    report_scheduler.invalidate_all()
+
+
+scoring_watcher = ScoringPlanWatcher(
+    SCORING_CONFIG_PATH,
+    interval_seconds=SCORING_CONFIG_WATCH_SECONDS,
+    on_change=_apply_scoring_change
+)
+
+# Metrics exposed at /metrics
+metrics = MetricsRegistry()
+request_latency = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ["method", "route", "status"]
+)
+stage_latency = metrics.histogram(
+    "health_stage_duration_seconds", "Latency of health report pipeline stages.", ["stage"]
+)
+report_lookups = metrics.counter(
+    "health_report_lookups_total", "Health report requests by where the report came from.", ["source"]
+)
+llm_fallbacks = metrics.counter(
+    "llm_fallbacks_total", "AI calls answered by keyword or template fallbacks.", ["operation", "reason"]
+)
+
+
+def _cache_counts(key: str):
+    return [
+        (("report",), report_cache.stats()[key]),
+        (("sentiment",), ai_service.sentiment_cache.stats()[key]),
+        (("recommendation",), ai_service.recommendation_cache.stats()[key]),
+    ]
 
-app = FastAPI(title="AI Project Health Monitor API", version="1.0.0")
+
+metrics.callback("cache_hits_total", "Cache hits by cache.", "counter", ["cache"], lambda: _cache_counts("hits"))
+metrics.callback("cache_misses_total", "Cache misses by cache.", "counter", ["cache"], lambda: _cache_counts("misses"))
+health_calculator.stage_timer = lambda stage: stage_latency.labels(stage).time()
+ai_service.on_fallback = lambda operation, reason: llm_fallbacks.labels(operation, reason).inc()
+
+
+async def _in_thread(func, *args):
+    """Run a blocking store call on the default thread pool, off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def preload() -> None:
+    """
+    Load everything workers can share before a production server forks:
+    scoring plans, projects, their aggregates and content hashes. Workers then start from the
+    same data (generated mock projects included) in copy-on-write memory.
+    """
+    current_plans()
+    for project in data_adapter.get_all_projects():
+        data_adapter.get_aggregates(project)
+        data_adapter.get_content_hash(project)
+    # Keep preloaded objects out of the collector, so collections in workers don't copy their pages
+    gc.freeze()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Sync from the tracker and start background work; release pooled clients and worker pools on shutdown."""
+    sync_task = None
+    if data_adapter.connector is not None:
+        try:
+            await data_adapter.sync()
+        except Exception as e:
+            print(f"Error syncing from tracker: {e}")
+        sync_task = asyncio.create_task(data_adapter.run_sync_loop(TRACKER_SYNC_INTERVAL_SECONDS))
+    if PRECOMPUTE_ENABLED and scheduler_lock.acquire():
+        report_scheduler.start()
+    if SCORING_CONFIG_WATCH_SECONDS > 0:
+        scoring_watcher.start()
+    yield
+    scoring_watcher.stop()
+    if sync_task is not None:
+        sync_task.cancel()
+        await data_adapter.connector.aclose()
+    await report_scheduler.stop()
+    scheduler_lock.release()
+    await ai_service.aclose()
+    ai_service.telemetry.close()
+    portfolio_scorer.shutdown()
+    score_history.close()
+    report_store.close()
+
+
+app = FastAPI(
+    title="AI Project Health Monitor API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
+)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -28,15 +275,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
-
-# Initialize services
-data_adapter = DataAdapter(use_mock=True)
-health_calculator = HealthCalculator()
-ai_service = AIService()
-
-# Store previous scores for trend calculation (in production, use a database)
-previous_scores = {}
+app.add_middleware(MetricsMiddleware, histogram=request_latency)
 
 
 @app.get("/")
@@ -51,11 +292,18 @@ async def health_check():
     return {"status": "healthy", "service": "AI Project Health Monitor API"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Request and pipeline stage latencies, cache and fallback counters in Prometheus text format."""
+    return Response(content=metrics.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
+
 @app.get("/api/projects", response_model=List[dict])
 async def get_projects():
     """Get list of all projects."""
     projects = data_adapter.get_all_projects()
-    return [
+    # Returned as a response so the list skips response_model validation
+    return FastJSONResponse([
         {
             "id": p.id,
             "name": p.name,
@@ -63,7 +311,7 @@ async def get_projects():
             "created_at": p.created_at.isoformat(),
         }
         for p in projects
-    ]
+    ])
 
 
 @app.get("/api/projects/{project_id}", response_model=dict)
@@ -84,28 +332,80 @@ async def get_project(project_id: str):
 
 
 @app.get("/api/projects/{project_id}/health", response_model=HealthReport)
-async def get_project_health(project_id: str):
-    """Get comprehensive health report for a project."""
-    project = data_adapter.get_project(project_id)
+async def get_project_health(project_id: str, fresh: bool = False, if_none_match: Optional[str] = Header(None)):
+    """
+    Get comprehensive health report for a project.
+    Reports are served from the in-memory cache when they match the project's
+    current version, or from the precomputed report table when they were built
+    from the project's current content; ``fresh=true`` recomputes inline.
+    Reports carry a strong ETag and a matching If-None-Match gets 304 Not
+    Modified. The cached bytes are sent as-is; response_model only documents
+    the schema.
+    """
+    with stage_latency.time(stage="data_fetch"):
+        project = data_adapter.get_project(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
+    version = data_adapter.get_project_version(project_id)
+    # Mock projects generated for unknown IDs are never stored
+    held = data_adapter.holds(project)
+    content_hash = (await data_adapter.get_content_hashes([project]))[0] if held else None
+    cached = None if fresh else report_cache.get(project_id, version)
+    source = "memory"
+    if cached is None and not fresh and held:
+        stored = await _in_thread(report_store.get, project_id)
+        if (
+            stored is not None and stored.content_hash == content_hash
+            and stored.age_seconds < REPORT_CACHE_TTL_SECONDS and stored.computed_at >= scoring_changed_at
+        ):
+            cached = report_cache.put_cached(project_id, CachedReport(version, stored.body))
+            source = "store"
+    if cached is None:
+        report = await _build_health_report(project)
+        with stage_latency.time(stage="serialize"):
+            cached = CachedReport.from_report(version, report)
+        report_cache.put_cached(project_id, cached)
+        if held:
+            await _in_thread(report_store.put, project_id, content_hash, cached)
+        source = "computed"
+    report_lookups.labels(source).inc()
+    
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def _build_health_report(
+    project: Project,
+    recommendations: Optional[List[Recommendation]] = None
+) -> HealthReport:
+    """Score a project, detect risks and generate recommendations (unless given)."""
+    project_id = project.id
+    
     # Get previous score for trend calculation
-    previous_score = previous_scores.get(project_id)
+    previous_score = await _in_thread(score_history.previous_score, project_id, SCORE_HISTORY_BASELINE_SECONDS)
     
-    # Calculate health score
-    health_score = health_calculator.calculate_health_score(project, previous_score)
+    # Calculate health score from the project's incremental aggregates
+    health_score = health_calculator.calculate_health_score_from_aggregates(
+        data_adapter.get_aggregates(project), project.team_members, previous_score, project_id
+    )
     
-    # Store current score for next calculation
-    previous_scores[project_id] = health_score.overall_score
+    # Record current score for later trends
+    score_history.record(project_id, health_score.overall_score, health_score.status.value)
     
     # Detect risks
-    risks = health_calculator.detect_risks(project, health_score)
+    with stage_latency.time(stage="detect_risks"):
+        risks = health_calculator.detect_risks(project, health_score)
+    health_events.publish(project_id, health_score, risks)
     
     # Generate AI recommendations
-    recommendations = ai_service.generate_recommendations(
-        health_score, risks, project.name
-    )
+    if recommendations is None:
+        with stage_latency.time(stage="generate_recommendations"):
+            recommendations = await ai_service.generate_recommendations(
+                health_score, risks, project.name
+            )
     
     # Create health report
     report = HealthReport(
@@ -127,9 +427,11 @@ async def get_health_score(project_id: str):
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    previous_score = previous_scores.get(project_id)
-    health_score = health_calculator.calculate_health_score(project, previous_score)
-    previous_scores[project_id] = health_score.overall_score
+    previous_score = await _in_thread(score_history.previous_score, project_id, SCORE_HISTORY_BASELINE_SECONDS)
+    health_score = health_calculator.calculate_health_score_from_aggregates(
+        data_adapter.get_aggregates(project), project.team_members, previous_score, project_id
+    )
+    score_history.record(project_id, health_score.overall_score, health_score.status.value)
     
     return {
         "score": health_score.overall_score,
@@ -139,14 +441,117 @@ async def get_health_score(project_id: str):
     }
 
 
+@app.get("/api/projects/{project_id}/health/stream")
+async def stream_project_health(project_id: str, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-Sent Events stream of a project's health changes.
+    An event is sent when the score, status or risk set changes; reconnecting
+    clients resume from Last-Event-ID.
+    """
+    if not data_adapter.get_project(project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+    return _event_stream(project_id, last_event_id)
+
+
+@app.get("/api/portfolio/health/stream")
+async def stream_portfolio_health(last_event_id: Optional[str] = Header(None)):
+    """Server-Sent Events stream of health changes across all projects."""
+    return _event_stream(None, last_event_id)
+
+
+def _event_stream(project_id: Optional[str], last_event_id: Optional[str]) -> StreamingResponse:
+    return StreamingResponse(
+        health_events.subscribe(project_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/api/projects/{project_id}/health/history", response_model=dict)
+async def get_health_history(project_id: str, days: int = 30):
+    """Recorded health scores for a project over the last N days, oldest first."""
+    project = data_adapter.get_project(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    points = await _in_thread(score_history.history, project_id, datetime.now() - timedelta(days=days))
+    return FastJSONResponse({
+        "project_id": project_id,
+        "days": days,
+        "points": [point.to_dict() for point in points],
+    })
+
+
+@app.get("/api/admin/llm-telemetry")
+async def get_llm_telemetry(limit: int = 20, x_admin_token: Optional[str] = Header(None)):
+    """
+    Rolling LLM call aggregates per operation and model, plus the most recent calls.
+    Disabled (404) unless ADMIN_API_TOKEN is set, and then it must be sent in X-Admin-Token.
+    """
+    if not ADMIN_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not hmac.compare_digest((x_admin_token or "").encode(), ADMIN_API_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    return {
+        **ai_service.telemetry.summary(),
+        "recent": ai_service.telemetry.recent(limit),
+    }
+
+
+@app.get("/api/portfolio/health")
+async def get_portfolio_health():
+    """
+    Score, status, trend and dimension scores for every project.
+    Scoring runs on a worker pool; entries stream out in project order.
+    A failure before the first entry is an ordinary error response; one
+    after streaming started ends the array with an ``{"error": ...}`` entry.
+    """
+    projects = data_adapter.get_all_projects()
+    previous = await _in_thread(
+        score_history.previous_scores, [p.id for p in projects], SCORE_HISTORY_BASELINE_SECONDS
+    )
+    summaries = portfolio_scorer.stream(projects, previous)
+    first = await anext(summaries, None)
+    
+    async def body():
+        yield "["
+        if first is None:
+            yield "]"
+            return
+        score_history.record(first["project_id"], first["score"], first["status"])
+        yield dumps(first)
+        try:
+            async for summary in summaries:
+                score_history.record(summary["project_id"], summary["score"], summary["status"])
+                yield "," + dumps(summary)
+        except Exception as e:
+            print(f"Error streaming portfolio health: {e}")
+            yield "," + dumps({"error": "Portfolio scoring failed; the list is incomplete"})
+        yield "]"
+    
+    return StreamingResponse(body(), media_type="application/json")
+
+
 @app.post("/api/analyze-sentiment")
 async def analyze_sentiment(text: str):
     """Analyze sentiment of provided text."""
-    sentiment = ai_service.analyze_sentiment(text)
+    sentiment = await ai_service.analyze_sentiment(text)
     return {"text": text, "sentiment": sentiment}
 
 
+@app.post("/api/analyze-sentiment/batch", response_model=SentimentBatchResponse)
+async def analyze_sentiment_batch(request: SentimentBatchRequest):
+    """Analyze sentiment of many texts, packing them into as few LLM calls as possible."""
+    sentiments = await ai_service.analyze_sentiments(request.texts)
+    return {
+        "results": [
+            {"text": text, "sentiment": sentiment}
+            for text, sentiment in zip(request.texts, sentiments)
+        ]
+    }
+
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001, reload=True)
+    from launcher import main
+    main(sys.modules[__name__])
 
@@ -0,0 +1,223 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+# Handle imports
+try:
+    from .models import Project, Task, TeamMember, Communication
+    from .config import SNAPSHOT_RETENTION_DAYS
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from models import Project, Task, TeamMember, Communication
+    from config import SNAPSHOT_RETENTION_DAYS
+
+
+class ProjectTimeline:
+    """
+    Project state over time as a base snapshot plus a log of deltas.
+    A task delta holds the replacement task row and communications are
+    append-only, so rebuilding a past state never copies task data: every
+    rebuilt project shares task objects with the log. Checkpoints taken
+    every ``checkpoint_interval`` deltas bound how much of the log a rebuild
+    replays; each holds only the tasks changed since the previous one.
+
+    Checkpoints older than ``retention`` are folded into the base snapshot
+    and their deltas dropped, so the timeline covers the retention window
+    and no more.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        recorded_at: datetime,
+        checkpoint_interval: int = 256,
+        retention: timedelta = timedelta(days=SNAPSHOT_RETENTION_DAYS)
+    ):
+        self.project_id = project.id
+        self.name = project.name
+        self.description = project.description
+        self.created_at = project.created_at
+        self.members = [(tm.id, tm.name, tm.email) for tm in project.team_members]
+        self.base_at = recorded_at
+        self.checkpoint_interval = checkpoint_interval
+        self.retention = retention
+        self.communications: List[Communication] = list(project.communications)
+        self._delta_times: List[datetime] = []
+        self._deltas: List[Optional[Task]] = []  # None marks an appended communication
+        # (delta index, task_id -> task, communication count); the first is the full base
+        # snapshot, later ones overlay the tasks changed since the checkpoint before them
+        self._checkpoint_times: List[datetime] = [recorded_at]
+        self._checkpoints: List[Tuple[int, Dict[str, Task], int]] = [
+            (0, {t.id: t for t in project.tasks}, len(self.communications))
+        ]
+
+    @property
+    def delta_count(self) -> int:
+        return len(self._deltas)
+
+    def record_task(self, task: Task, at: datetime) -> None:
+        self._append(task, at)
+
+    def record_communication(self, communication: Communication, at: datetime) -> None:
+        self.communications.append(communication)
+        self._append(None, at)
+
+    def _append(self, delta: Optional[Task], at: datetime) -> None:
+        # The log is kept in time order; late arrivals are recorded at the latest time seen
+        if self._delta_times and at < self._delta_times[-1]:
+            at = self._delta_times[-1]
+        at = max(at, self.base_at)
+        self._delta_times.append(at)
+        self._deltas.append(delta)
+        if len(self._deltas) % self.checkpoint_interval == 0:
+            previous_index, _, comm_count = self._checkpoints[-1]
+            overlay = {}
+            for task in self._deltas[previous_index:]:
+                if task is None:
+                    comm_count += 1
+                else:
+                    overlay[task.id] = task
+            self._checkpoint_times.append(at)
+            self._checkpoints.append((len(self._deltas), overlay, comm_count))
+            self._prune(at - self.retention)
+
+    def _prune(self, cutoff: datetime) -> None:
+        """Fold the checkpoints at or before ``cutoff`` into the base snapshot and drop their deltas."""
+        position = bisect_right(self._checkpoint_times, cutoff) - 1
+        if position <= 0:
+            return
+        index, tasks, comm_count = self._checkpoint_state(position)
+        self._checkpoints = [(0, tasks, comm_count)] + [
+            (checkpoint_index - index, overlay, count)
+            for checkpoint_index, overlay, count in self._checkpoints[position + 1:]
+        ]
+        self._checkpoint_times = self._checkpoint_times[position:]
+        self._deltas = self._deltas[index:]
+        self._delta_times = self._delta_times[index:]
+        self.base_at = self._checkpoint_times[0]
+
+    def _checkpoint_state(self, position: int) -> Tuple[int, Dict[str, Task], int]:
+        """The full state at checkpoint ``position``: the base with every overlay up to it applied."""
+        index, tasks, comm_count = self._checkpoints[position]
+        if position == 0:
+            return index, tasks, comm_count
+        tasks = dict(self._checkpoints[0][1])
+        for _, overlay, _ in self._checkpoints[1:position + 1]:
+            tasks.update(overlay)
+        return index, tasks, comm_count
+
+    def _state_at(self, delta_end: int, start: Optional[Tuple[int, Dict[str, Task], int]] = None):
+        """Replay deltas up to (not including) ``delta_end`` from the nearest checkpoint or ``start``."""
+        if start is None or start[0] > delta_end:
+            position = bisect_right([c[0] for c in self._checkpoints], delta_end) - 1
+            start = self._checkpoint_state(position)
+        index, tasks, comm_count = start
+        tasks = dict(tasks)
+        for delta in self._deltas[index:delta_end]:
+            if delta is None:
+                comm_count += 1
+            else:
+                tasks[delta.id] = delta
+        return delta_end, tasks, comm_count
+
+    def states_at(self, times: List[datetime]) -> List[Tuple[datetime, Project]]:
+        """
+        Rebuild the project at each of ``times`` (ascending). Times before the
+        base snapshot, including those past the retention window, are skipped;
+        consecutive times with no change in between share one Project object.
+        """
+        results = []
+        state = None
+        project = None
+        for at in times:
+            if at < self.base_at:
+                continue
+            delta_end = bisect_right(self._delta_times, at)
+            if state is None or delta_end != state[0]:
+                state = self._state_at(delta_end, state)
+                project = self._build(state[1], state[2])
+            results.append((at, project))
+        return results
+
+    def _build(self, tasks: Dict[str, Task], comm_count: int) -> Project:
+        task_list = list(tasks.values())
+        member_tasks: Dict[str, List[str]] = {member_id: [] for member_id, _, _ in self.members}
+        for task in task_list:
+            if task.assignee_id in member_tasks:
+                member_tasks[task.assignee_id].append(task.id)
+        return Project(
+            id=self.project_id,
+            name=self.name,
+            description=self.description,
+            tasks=task_list,
+            team_members=[
+                TeamMember(id=member_id, name=name, email=email, tasks=member_tasks[member_id])
+                for member_id, name, email in self.members
+            ],
+            communications=self.communications[:comm_count],
+            created_at=self.created_at
+        )
+
+
+class SnapshotStore:
+    """Timelines for every tracked project, sampled on demand for history queries."""
+
+    def __init__(
+        self,
+        checkpoint_interval: int = 256,
+        max_points: int = 60,
+        retention_days: float = SNAPSHOT_RETENTION_DAYS
+    ):
+        self.checkpoint_interval = checkpoint_interval
+        self.max_points = max_points
+        self.retention = timedelta(days=retention_days)
+        self._timelines: Dict[str, ProjectTimeline] = {}
+
+    def is_tracked(self, project_id: str) -> bool:
+        return project_id in self._timelines
+
+    def track(self, project: Project, recorded_at: Optional[datetime] = None) -> ProjectTimeline:
+        """Start a timeline with the project's current state as its base snapshot."""
+        timeline = self._timelines.get(project.id)
+        if timeline is None:
+            timeline = ProjectTimeline(
+                project, recorded_at or datetime.now(), self.checkpoint_interval, self.retention
+            )
+            self._timelines[project.id] = timeline
+        return timeline
+
+    def forget(self, project_id: str) -> None:
+        """Drop a project's timeline, e.g. when the project is replaced wholesale."""
+        self._timelines.pop(project_id, None)
+
+    def record_task(self, project_id: str, task: Task, at: Optional[datetime] = None) -> None:
+        timeline = self._timelines.get(project_id)
+        if timeline is not None:
+            timeline.record_task(task, at or datetime.now())
+
+    def record_communication(self, project_id: str, communication: Communication, at: Optional[datetime] = None) -> None:
+        timeline = self._timelines.get(project_id)
+        if timeline is not None:
+            timeline.record_communication(communication, at or datetime.now())
+
+    def sample(
+        self,
+        project_id: str,
+        days: int = 30,
+        now: Optional[datetime] = None,
+        points: Optional[int] = None
+    ) -> List[Tuple[datetime, Project]]:
+        """
+        Evenly spaced snapshots over the last ``days`` days, at most daily and
+        at most ``points`` of them, ending at ``now``.
+        """
+        timeline = self._timelines.get(project_id)
+        if timeline is None:
+            return []
+        now = now or datetime.now()
+        points = max(1, min(points or self.max_points, days))
+        step = timedelta(days=days) / points
+        times = [now - step * i for i in range(points, -1, -1)]
+        return timeline.states_at(times)
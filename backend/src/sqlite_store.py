@@ -0,0 +1,45 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SQLiteDatabase:
+    """
+    Lazily opened SQLite connection in WAL mode, shared by the threads of one process.
+    The connection is reopened after a fork so each worker process gets its own.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+        self._initializers = []
+
+    def add_initializer(self, sql: str) -> None:
+        """Register schema statements to run whenever a connection is opened."""
+        self._initializers.append(sql)
+        if self._conn is not None and self._pid == os.getpid():
+            with self.lock:
+                self._conn.executescript(sql)
+
+    def connection(self) -> sqlite3.Connection:
+        with self.lock:
+            if self._conn is None or self._pid != os.getpid():
+                if self.path != ":memory:":
+                    Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                for sql in self._initializers:
+                    conn.executescript(sql)
+                self._conn = conn
+                self._pid = os.getpid()
+            return self._conn
+
+    def close(self) -> None:
+        with self.lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""Startup script for the backend server."""
+"""
+Startup script for the backend server.
+
+    python start_server.py                                # development: one auto-reloading process
+    python start_server.py --production --workers 4       # production: preloaded workers (see src/launcher.py)
+"""
 import sys
 import os
 from pathlib import Path
@@ -11,7 +16,5 @@ sys.path.insert(0, str(src_dir))
 
 # Now import and run
 if __name__ == "__main__":
-    import uvicorn
-    from server import app
-    uvicorn.run(app, host="0.0.0.0", port=8001, reload=True)
-
+    from launcher import main
+    main()
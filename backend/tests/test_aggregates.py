@@ -0,0 +1,63 @@
+"""Parity of incrementally maintained ProjectAggregates with a full rescan after every task change."""
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from aggregates import ProjectAggregates  # noqa: E402
+from health_calculator import HealthCalculator, ScoringSignals  # noqa: E402
+from mock_data import WorkloadSpec, iter_synthetic_projects  # noqa: E402
+from models import TaskStatus  # noqa: E402
+
+COUNTERS = [name for name in ScoringSignals.__slots__ if name not in ("now", "assignees")]
+
+
+def _counters(signals, member_ids):
+    values = {name: getattr(signals, name) for name in COUNTERS}
+    values["assignees"] = {member_id: signals.assignees.counts_for(member_id) for member_id in member_ids}
+    return values
+
+
+def _changed(task, rng, member_ids, now):
+    """A close, reassignment, due-date change or reopen of ``task``."""
+    kind = rng.choice(["close", "reassign", "due", "reopen"])
+    if kind == "close":
+        update = {"status": TaskStatus.DONE}
+    elif kind == "reassign":
+        update = {"assignee_id": rng.choice(member_ids + [None])}
+    elif kind == "due":
+        update = {"due_date": rng.choice([None, now + timedelta(days=rng.randint(-20, 20), hours=rng.randint(0, 23))])}
+    else:
+        update = {"status": TaskStatus.IN_PROGRESS, "is_reopened": True}
+    update["updated_at"] = now - timedelta(days=rng.randint(0, 30), minutes=rng.randint(0, 59))
+    return task.model_copy(update=update)
+
+
+def test_incremental_updates_match_a_full_rescan():
+    calculator = HealthCalculator()
+    now = datetime.now()
+    rng = random.Random(7)
+    spec = WorkloadSpec(seed=7, projects=3, tasks_per_project=120, team_size=5, communications_per_project=15)
+
+    for project in iter_synthetic_projects(spec, now):
+        plan = calculator.plan_for(project.id)
+        member_ids = [member.id for member in project.team_members]
+        aggregates = ProjectAggregates.from_project(project)
+
+        for _ in range(200):
+            old = rng.choice(project.tasks)
+            new = _changed(old, rng, member_ids, now)
+            project.update_task(new)
+            aggregates.apply_task_change(old, new)
+
+            incremental = aggregates.to_signals(now, plan.aging_threshold_days)
+            rescanned = calculator.collect_signals(project, now, plan)
+            assert _counters(incremental, member_ids) == _counters(rescanned, member_ids)
+
+        from_aggregates = calculator.calculate_health_score_from_aggregates(
+            aggregates, project.team_members, 60.0, project.id
+        )
+        from_project = calculator.calculate_health_score(project, 60.0)
+        assert from_aggregates.model_dump(exclude={"calculated_at"}) == from_project.model_dump(exclude={"calculated_at"})
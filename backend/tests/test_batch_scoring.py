@@ -0,0 +1,86 @@
+"""Parity of the vectorized batch scorer with the per-project scalar path."""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from health_calculator import HealthCalculator  # noqa: E402
+from mock_data import WorkloadSpec, generate_multiple_projects, iter_synthetic_projects  # noqa: E402
+from models import Project  # noqa: E402
+from scoring_plan import ScoringPlan, ScoringPlans  # noqa: E402
+
+PROFILE = ScoringPlan(
+    profile="deadline_driven",
+    delivery_weight=0.50,
+    sentiment_weight=0.05,
+    overdue_penalty=60,
+    overload_threshold_tasks=6,
+    healthy_threshold=85,
+)
+
+
+def _edge_projects(template: Project, now: datetime):
+    return [
+        Project(id="empty", name="Empty", description="", created_at=now),
+        Project(
+            id="no_members", name="No members", description="",
+            tasks=list(template.tasks), communications=list(template.communications), created_at=now
+        ),
+        Project(
+            id="no_communications", name="No communications", description="",
+            tasks=list(template.tasks), team_members=list(template.team_members), created_at=now
+        ),
+    ]
+
+
+def _portfolio(seed: int):
+    now = datetime.now()
+    spec = WorkloadSpec(seed=seed, projects=12, tasks_per_project=150, team_size=6, communications_per_project=25)
+    projects = list(iter_synthetic_projects(spec, now)) + generate_multiple_projects()
+    return projects + _edge_projects(projects[0], now)
+
+
+def _risk_keys(risks):
+    return [(r.id, r.title, r.description, r.severity, r.category) for r in risks]
+
+
+def _assert_parity(calculator: HealthCalculator, projects, previous_scores):
+    batch = calculator.calculate_health_scores_batch(projects, previous_scores)
+    assert len(batch) == len(projects)
+    for project, batch_score in zip(projects, batch):
+        scalar_score = calculator.calculate_health_score(project, previous_scores.get(project.id))
+        assert batch_score.overall_score == scalar_score.overall_score, project.id
+        assert batch_score.status == scalar_score.status, project.id
+        assert batch_score.trend == scalar_score.trend, project.id
+        assert [(d.name, d.score, d.weight, d.details) for d in batch_score.dimensions] == \
+            [(d.name, d.score, d.weight, d.details) for d in scalar_score.dimensions], project.id
+        assert _risk_keys(calculator.detect_risks(project, batch_score)) == \
+            _risk_keys(calculator.detect_risks(project, scalar_score)), project.id
+
+
+@pytest.mark.parametrize("seed", [0, 7, 42])
+def test_batch_matches_scalar(seed):
+    projects = _portfolio(seed)
+    previous_scores = {p.id: 40.0 + 10 * (i % 5) for i, p in enumerate(projects) if i % 3}
+    _assert_parity(HealthCalculator(plans=ScoringPlans(ScoringPlan())), projects, previous_scores)
+
+
+def test_batch_matches_scalar_with_profiles():
+    projects = _portfolio(3)
+    assigned = [p.id for p in projects[::2]] + ["empty", "no_members"]
+    plans = ScoringPlans(ScoringPlan(), {PROFILE.profile: PROFILE}, {pid: PROFILE.profile for pid in assigned})
+    calculator = HealthCalculator(plans=plans)
+    _assert_parity(calculator, projects, {p.id: 65.0 for p in projects})
+
+    # The profile actually changes scores, so parity is not vacuous
+    default = HealthCalculator(plans=ScoringPlans(ScoringPlan()))
+    project = projects[0]
+    assert calculator.calculate_health_score(project).dimensions[0].weight == PROFILE.delivery_weight
+    assert default.calculate_health_score(project).dimensions[0].weight == ScoringPlan().delivery_weight
+
+
+def test_empty_batch():
+    assert HealthCalculator(plans=ScoringPlans(ScoringPlan())).calculate_health_scores_batch([]) == []
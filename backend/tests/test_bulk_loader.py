@@ -0,0 +1,26 @@
+"""Bulk JSONL loading: errors name the file line they come from."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bulk_loader import BulkLoader, write_jsonl  # noqa: E402
+from mock_data import generate_multiple_projects  # noqa: E402
+
+
+def test_invalid_json_reports_its_line_number(tmp_path):
+    path = tmp_path / "projects.jsonl"
+    projects = generate_multiple_projects()[:1]
+    write_jsonl(projects, path)
+    lines = path.read_text().splitlines()
+    # Blank lines are skipped but still counted
+    path.write_text("\n".join(lines[:1] + [""] + lines[1:] + ['{"type": "task",']) + "\n")
+
+    with pytest.raises(ValueError, match=rf"projects\.jsonl:{len(lines) + 2}: invalid JSON"):
+        BulkLoader().load(path)
+
+    path.write_text("\n".join(lines[:1] + [""] + lines[1:]) + "\n")
+    loaded, stats = BulkLoader().load(path)
+    assert list(loaded) == [projects[0].id] and stats.skipped == 0
@@ -0,0 +1,103 @@
+"""RestTrackerConnector against the fake tracker, served in-process over httpx.ASGITransport."""
+import asyncio
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from connectors import RestTrackerConnector  # noqa: E402
+from fake_tracker import create_app  # noqa: E402
+from mock_data import generate_mock_project  # noqa: E402
+
+
+def _sync(app, failures=(), **kwargs):
+    """Run one connector sync against ``app``; ``failures`` are statuses returned before the app answers."""
+    failures = list(failures)
+    sync_kwargs = {key: kwargs.pop(key) for key in ("updated_since", "known_project_ids") if key in kwargs}
+
+    async def flaky(scope, receive, send):
+        if scope["type"] == "http" and failures:
+            await send({"type": "http.response.start", "status": failures.pop(0), "headers": [(b"retry-after", b"0")]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await app(scope, receive, send)
+
+    async def run():
+        connector = RestTrackerConnector(
+            "http://tracker", backoff_seconds=0, transport=httpx.ASGITransport(app=flaky), **kwargs
+        )
+        try:
+            return connector, await connector.sync(**sync_kwargs)
+        finally:
+            await connector.aclose()
+
+    return asyncio.run(run())
+
+
+def test_fetches_every_page():
+    app = create_app(project_count=2, tasks_per_project=25)
+    connector, result = _sync(app, page_size=10)
+
+    assert result.full
+    for change in result.changes:
+        project = app.state.projects[change.project.id]
+        assert [t.id for t in change.tasks] == [t.id for t in project.tasks]
+        assert len(change.communications) == len(project.communications)
+    pages = sum(3 + math.ceil(len(p.communications) / 10) for p in app.state.projects.values())
+    assert connector.requests == 1 + pages
+
+
+def test_retries_rate_limits_and_server_errors():
+    app = create_app(project_count=1)
+    connector, result = _sync(app, failures=[429, 503], max_retries=3)
+
+    assert connector.retries == 2
+    assert len(result.changes) == 1
+
+
+def test_incremental_sync_resumes_before_the_sync_started():
+    app = create_app(project_count=1)
+    started = datetime.now()
+    _, first = _sync(app, overlap_seconds=60)
+    assert started - timedelta(seconds=60) <= first.cursor <= datetime.now() - timedelta(seconds=60)
+
+    project = app.state.projects["proj_1"]
+    for task in project.tasks:
+        project.update_task(task.model_copy(update={"updated_at": datetime.now() - timedelta(days=1)}))
+    project.update_task(project.tasks[0].model_copy(update={"title": "Changed", "updated_at": datetime.now()}))
+    _, second = _sync(app, updated_since=first.cursor, known_project_ids={"proj_1"})
+
+    assert not second.full
+    assert [(t.id, t.title) for t in second.changes[0].tasks] == [(project.tasks[0].id, "Changed")]
+
+
+def test_new_project_is_fetched_in_full_during_incremental_sync():
+    app = create_app(project_count=1)
+    _, first = _sync(app)
+    app.state.projects["proj_new"] = generate_mock_project("proj_new", "New")
+
+    _, second = _sync(app, updated_since=first.cursor + timedelta(days=1), known_project_ids={"proj_1"})
+    changes = {change.project.id: change for change in second.changes}
+
+    assert not changes["proj_1"].full and changes["proj_1"].tasks == []
+    assert changes["proj_new"].full
+    assert len(changes["proj_new"].tasks) == len(app.state.projects["proj_new"].tasks)
+
+
+def test_times_with_an_offset_become_naive_local():
+    app = create_app(project_count=1)
+    project = app.state.projects["proj_1"]
+    utc = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    project.update_task(project.tasks[0].model_copy(update={"updated_at": utc}))
+    _, result = _sync(app)
+
+    task = result.changes[0].tasks[0]
+    assert task.updated_at.tzinfo is None
+    assert task.updated_at == utc.astimezone().replace(tzinfo=None)
+    # Naive arithmetic against local now works for every synced time
+    assert all(datetime.now() - t.updated_at > timedelta(0) for t in result.changes[0].tasks)
@@ -0,0 +1,109 @@
+"""Applying tracker syncs to the DataAdapter: metadata, teams and deletions."""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from connectors import ProjectChanges, SyncResult, TrackerConnector  # noqa: E402
+from data_adapter import DataAdapter  # noqa: E402
+from models import Communication, Project, Task, TaskStatus, TeamMember  # noqa: E402
+
+START = datetime(2026, 1, 1)
+
+
+class StaticConnector(TrackerConnector):
+    """Serves whatever projects the test puts in ``projects``, filtering items by ``updated_since``."""
+
+    def __init__(self):
+        self.projects = {}
+        self.calls = []
+
+    async def sync(self, updated_since=None, known_project_ids=None):
+        self.calls.append(updated_since)
+        changes = []
+        for project in self.projects.values():
+            since = updated_since if known_project_ids is None or project.id in known_project_ids else None
+            header = project.model_copy(update={"tasks": [], "communications": [], "team_members": [
+                TeamMember(id=tm.id, name=tm.name, email=tm.email) for tm in project.team_members
+            ]})
+            changes.append(ProjectChanges(
+                header,
+                [t for t in project.tasks if since is None or t.updated_at >= since],
+                [c for c in project.communications if since is None or c.timestamp >= since],
+                full=since is None
+            ))
+        cursor = max((t.updated_at for p in self.projects.values() for t in p.tasks), default=updated_since)
+        return SyncResult(changes, cursor, full=updated_since is None)
+
+
+def _task(task_id: str, assignee_id: str, minutes: int = 0) -> Task:
+    at = START + timedelta(minutes=minutes)
+    return Task(id=task_id, title=task_id, status=TaskStatus.TODO, assignee_id=assignee_id, created_at=START, updated_at=at)
+
+
+def _project(project_id: str, name: str = "Alpha") -> Project:
+    return Project(
+        id=project_id, name=name, description="", created_at=START,
+        team_members=[TeamMember(id="u1", name="Ann", email="ann@example.com")],
+        tasks=[_task("t1", "u1"), _task("t2", "u2")],
+        communications=[Communication(id="c1", source="slack", author="u1", content="ok", timestamp=START)]
+    )
+
+
+def _adapter(connector: StaticConnector, **kwargs) -> DataAdapter:
+    adapter = DataAdapter(use_mock=False, connector=connector, **kwargs)
+    asyncio.run(adapter.sync())
+    return adapter
+
+
+def test_sync_refreshes_metadata_and_team():
+    connector = StaticConnector()
+    connector.projects["p1"] = _project("p1")
+    adapter = _adapter(connector)
+    hash_before = adapter.get_content_hash(adapter.get_project("p1"))
+
+    renamed = _project("p1", name="Beta")
+    renamed.team_members.append(TeamMember(id="u2", name="Bo", email="bo@example.com"))
+    connector.projects["p1"] = renamed
+    assert asyncio.run(adapter.sync()) == 1
+
+    project = adapter.get_project("p1")
+    assert project.name == "Beta"
+    assert [(tm.id, tm.tasks) for tm in project.team_members] == [("u1", ["t1"]), ("u2", ["t2"])]
+    assert adapter.get_content_hash(project) != hash_before
+    # Unchanged metadata is not a change
+    assert asyncio.run(adapter.sync()) == 0
+
+
+def test_sync_drops_projects_removed_from_the_tracker():
+    connector = StaticConnector()
+    connector.projects["p1"] = _project("p1")
+    connector.projects["p2"] = _project("p2")
+    adapter = _adapter(connector)
+    changes = []
+    adapter.add_change_listener(lambda project_id, version: changes.append(project_id))
+
+    del connector.projects["p2"]
+    assert asyncio.run(adapter.sync()) == 1
+    assert adapter.get_project("p2") is None
+    assert changes == ["p2"]
+
+
+def test_full_sync_replaces_projects_that_lost_items():
+    connector = StaticConnector()
+    connector.projects["p1"] = _project("p1")
+    adapter = _adapter(connector, full_sync_interval_seconds=3600)
+    connector.projects["p1"].tasks.pop()
+
+    # Incremental syncs cannot see the deletion
+    asyncio.run(adapter.sync())
+    assert adapter.get_project("p1").get_task("t2") is not None
+
+    adapter.full_sync_interval_seconds = 0
+    assert asyncio.run(adapter.sync()) == 1
+    assert connector.calls[-1] is None
+    project = adapter.get_project("p1")
+    assert project.get_task("t2") is None
+    assert adapter.get_aggregates(project).total_tasks == 1
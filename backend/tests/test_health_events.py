@@ -0,0 +1,92 @@
+"""Resuming health event streams with Last-Event-ID."""
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from health_events import HealthEventBroker  # noqa: E402
+from models import HealthScore, HealthStatus  # noqa: E402
+
+
+def _publish(broker: HealthEventBroker, project_id: str, score: float):
+    health_score = HealthScore(
+        overall_score=score, status=HealthStatus.WATCH, dimensions=[], trend="stable",
+        calculated_at=datetime(2026, 1, 1)
+    )
+    return broker.publish(project_id, health_score, [])
+
+
+def _event_ids(messages):
+    return [line[4:] for message in messages for line in message.splitlines() if line.startswith("id: ")]
+
+
+def _receive(broker: HealthEventBroker, last_event_id, project_id=None, publish=()):
+    """Subscribe, publish ``publish`` once subscribed, and collect messages until the stream idles."""
+    async def run():
+        stream = broker.subscribe(project_id, last_event_id)
+        messages = [await stream.__anext__()]  # retry hint; the subscriber is registered
+        for pid, score in publish:
+            _publish(broker, pid, score)
+        while True:
+            message = await stream.__anext__()
+            if message.startswith(": keepalive"):
+                break
+            messages.append(message)
+        await stream.aclose()
+        return messages
+
+    return asyncio.run(run())
+
+
+def _broker(**kwargs) -> HealthEventBroker:
+    return HealthEventBroker(keepalive_seconds=0.05, **kwargs)
+
+
+def test_resume_replays_missed_events():
+    broker = _broker(epoch="a")
+    first = _publish(broker, "p1", 50)
+    _publish(broker, "p2", 60)
+    _publish(broker, "p1", 55)
+    assert _event_ids(_receive(broker, f"a-{first.id}")) == ["a-2", "a-3"]
+    assert _event_ids(_receive(broker, f"a-{first.id}", project_id="p1")) == ["a-3"]
+
+
+def test_resume_after_restart_sends_current_state():
+    before = _broker(epoch="old")
+    for score in range(50, 60):
+        _publish(before, "p1", score)
+
+    # A restarted process counts from 1 again; the old ID is above its counter
+    after = _broker(epoch="new")
+    _publish(after, "p1", 70)
+    _publish(after, "p2", 80)
+    messages = _receive(after, "old-10", publish=[("p2", 81)])
+    # The current state of each project once, not a replay of every event
+    assert _event_ids(messages) == ["new-1", "new-3"]
+    assert '"score": 81' in messages[-1]
+
+
+def test_live_events_follow_a_fresh_subscription():
+    broker = _broker(epoch="a")
+    _publish(broker, "p1", 50)
+    assert _event_ids(_receive(broker, None, publish=[("p1", 51), ("p2", 60)])) == ["a-2", "a-3"]
+
+
+def test_expired_event_id_sends_current_state():
+    broker = _broker(epoch="a", buffer_size=3)
+    for score in range(50, 56):
+        _publish(broker, "p1", score)
+    _publish(broker, "p2", 90)
+    # Events 2-4 have left the buffer, so the client gets each project's latest state
+    assert _event_ids(_receive(broker, "a-1")) == ["a-6", "a-7"]
+    # An ID right before the buffer still resumes normally
+    assert _event_ids(_receive(broker, "a-4")) == ["a-5", "a-6", "a-7"]
+
+
+def test_unknown_ids_resync():
+    broker = _broker(epoch="a")
+    _publish(broker, "p1", 50)
+    for last_event_id in ("a-99", "a-x", "17", ""):
+        assert _event_ids(_receive(broker, last_event_id)) == ["a-1"]
@@ -0,0 +1,33 @@
+"""Fallback keyword sentiment: word-bounded matches from the configured keyword lists."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from keyword_sentiment import KeywordSentimentClassifier  # noqa: E402
+
+
+def test_configured_keywords_match_whole_words_and_plurals():
+    classifier = KeywordSentimentClassifier.from_config()
+    assert classifier.classify_many([
+        "Found two bugs in the release",
+        "Several issues reported overnight",
+        "The build logs show errors",
+        "More problems with the deploy",
+        "One issue left",
+        "Great work, thanks!",
+    ]) == ["negative", "negative", "negative", "negative", "negative", "positive"]
+    # Keywords inside other words do not count
+    assert classifier.classify_many([
+        "Let's debug this together",
+        "Errorless run of the suite",
+        "Checked the bugzilla export",
+        "The issuer signed it",
+        "",
+    ]) == ["neutral"] * 5
+
+
+def test_each_distinct_keyword_counts_once():
+    classifier = KeywordSentimentClassifier(positive=["good", "thanks"], negative=["bug", "bugs"])
+    assert classifier.classify("BUG, bug and more bug. Good, thanks") == "positive"
+    assert classifier.classify("A bug, then bugs. Good") == "negative"
@@ -0,0 +1,66 @@
+"""Project indexes: the assignee index and member task lists follow every task change."""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Project, Task, TaskStatus, TeamMember  # noqa: E402
+
+
+def _task(task_id, assignee_id, status=TaskStatus.TODO):
+    now = datetime(2024, 1, 1)
+    return Task(id=task_id, title=task_id, status=status, assignee_id=assignee_id, created_at=now, updated_at=now)
+
+
+def _project():
+    return Project(
+        id="p1", name="Project", description="",
+        tasks=[_task("t1", "alice"), _task("t2", "bob")],
+        team_members=[
+            TeamMember(id="alice", name="Alice", email="alice@example.com", tasks=["t1"]),
+            TeamMember(id="bob", name="Bob", email="bob@example.com", tasks=["t2"]),
+        ],
+        created_at=datetime(2024, 1, 1)
+    )
+
+
+def _assigned(project, assignee_id):
+    return sorted(t.id for t in project.assignee_index().tasks_for(assignee_id))
+
+
+def test_add_and_reassign_keep_indexes_current():
+    project = _project()
+    assert _assigned(project, "alice") == ["t1"]
+
+    project.add_task(_task("t3", "alice"))
+    assert _assigned(project, "alice") == ["t1", "t3"]
+    assert project.team_members[0].tasks == ["t1", "t3"]
+
+    project.update_task(_task("t1", "bob", TaskStatus.IN_PROGRESS))
+    assert _assigned(project, "alice") == ["t3"]
+    assert _assigned(project, "bob") == ["t1", "t2"]
+    assert project.team_members[0].tasks == ["t3"]
+    assert sorted(project.team_members[1].tasks) == ["t1", "t2"]
+    assert project.assignee_index().counts_for("bob")["in_progress"] == 1
+    assert [t.id for t in project.tasks] == ["t1", "t2", "t3"]
+
+
+def test_in_place_changes_to_the_task_list_are_seen():
+    project = _project()
+    assert _assigned(project, "alice") == ["t1"]
+
+    # Same length, so only the mutation count tells the index it is stale
+    project.tasks[0] = _task("t1", "bob")
+    assert _assigned(project, "alice") == []
+    assert _assigned(project, "bob") == ["t1", "t2"]
+
+    project.tasks.pop()
+    assert _assigned(project, "bob") == ["t1"]
+    assert project.get_task("t2") is None
+
+    copy = project.model_copy(update={"tasks": [_task("t4", "alice")]})
+    assert _assigned(copy, "alice") == ["t4"]
+    copy.tasks[0] = _task("t4", "bob")
+    assert _assigned(copy, "alice") == []
+    assert copy.model_dump()["tasks"][0]["assignee_id"] == "bob"
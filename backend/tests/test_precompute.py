@@ -0,0 +1,66 @@
+"""Background precompute: due projects, stored reports and removed projects."""
+import asyncio
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_adapter import DataAdapter  # noqa: E402
+from mock_data import generate_multiple_projects  # noqa: E402
+from models import HealthReport, HealthScore, HealthStatus  # noqa: E402
+from precompute import MaterializedReportStore, ReportScheduler  # noqa: E402
+
+
+class RecordingStore(MaterializedReportStore):
+    """Report store that records which threads read and write it."""
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self.threads = []
+
+    def states(self):
+        self.threads.append(threading.current_thread())
+        return super().states()
+
+    def delete(self, project_ids):
+        self.threads.append(threading.current_thread())
+        super().delete(project_ids)
+
+
+async def _build_report(project, recommendations):
+    health_score = HealthScore(
+        overall_score=len(project.tasks), status=HealthStatus.WATCH, dimensions=[], calculated_at=datetime.now()
+    )
+    return HealthReport(
+        project_id=project.id, project_name=project.name, health_score=health_score,
+        risks=[], recommendations=recommendations or [], generated_at=datetime.now()
+    )
+
+
+def test_refreshes_changed_projects_and_drops_removed_ones(tmp_path):
+    adapter = DataAdapter(use_mock=False)
+    adapter._projects_cache = {p.id: p for p in generate_multiple_projects()}
+    store = RecordingStore(str(tmp_path / "reports.db"))
+    scheduler = ReportScheduler(
+        get_projects=adapter.get_all_projects,
+        get_content_hashes=adapter.get_content_hashes,
+        build_report=_build_report,
+        store=store
+    )
+
+    async def run():
+        assert await scheduler.run_once() == len(adapter.get_all_projects())
+        assert await scheduler.run_once() == 0
+
+        changed, removed = adapter.get_all_projects()[:2]
+        task = changed.tasks[0]
+        adapter.update_task(changed.id, task.model_copy(update={"title": task.title + "!"}))
+        del adapter._projects_cache[removed.id]
+        assert await scheduler.due_projects() == [changed]
+        assert store.get(removed.id) is None
+
+    asyncio.run(run())
+    assert store.threads and all(thread is not threading.main_thread() for thread in store.threads)
+    assert store.get(adapter.get_all_projects()[0].id) is not None
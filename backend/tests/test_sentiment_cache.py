@@ -0,0 +1,35 @@
+"""Two-tier sentiment cache: SQLite entries promoted to memory keep their stored expiry."""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sentiment_cache import SentimentCache, text_key  # noqa: E402
+
+
+def test_disk_hit_keeps_its_stored_expiry(tmp_path):
+    db_path = str(tmp_path / "sentiment.db")
+    writer = SentimentCache(ttl_seconds=100, db_path=db_path)
+    writer.store([
+        (text_key("old"), "negative", time.time() - 90),
+        (text_key("stale"), "positive", time.time() - 200),
+    ])
+
+    reader = SentimentCache(ttl_seconds=100, db_path=db_path)
+    assert reader.get_many(["old", "stale", "unknown"]) == ["negative", None, None]
+    assert reader.disk_hits == 1 and reader.misses == 2
+    expires_at, _ = reader._memory._entries[text_key("old")]
+    # About 10 seconds were left on disk; promotion must not grant a fresh 100
+    assert expires_at - time.monotonic() < 11
+
+
+def test_lookup_never_reads_disk(tmp_path):
+    cache = SentimentCache(ttl_seconds=100, db_path=str(tmp_path / "sentiment.db"))
+    cache.set_many([("Looks great", "positive")])
+    other = SentimentCache(ttl_seconds=100, db_path=str(tmp_path / "sentiment.db"))
+
+    keys = [text_key("looks   GREAT")]
+    assert other.lookup(keys) == [None]
+    assert other.load(keys, [None]) == ["positive"]
+    assert other.lookup(keys) == ["positive"]
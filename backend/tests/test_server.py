@@ -0,0 +1,89 @@
+"""API behaviour that needs the server module: health change events, admin access and portfolio streaming."""
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+# The server opens its SQLite stores at import; keep them out of the data directory
+_data_dir = tempfile.mkdtemp()
+os.environ.setdefault("REPORT_STORE_DB", os.path.join(_data_dir, "reports.db"))
+os.environ.setdefault("SCORE_HISTORY_DB", os.path.join(_data_dir, "score_history.db"))
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import server  # noqa: E402
+
+
+def test_health_changes_are_rescored_once_off_the_loop(monkeypatch):
+    project = server.data_adapter.get_all_projects()[0]
+    lookups = []
+    previous_score = server.score_history.previous_score
+
+    def recording_previous_score(*args):
+        lookups.append(threading.current_thread())
+        return previous_score(*args)
+
+    monkeypatch.setattr(server.score_history, "previous_score", recording_previous_score)
+
+    async def run():
+        before = server.health_events._next_id
+        for _ in range(3):
+            server.data_adapter.invalidate(project.id)
+        # Changes that arrive while a rescore is pending fold into it
+        assert list(server._pending_health_changes) == [project.id]
+        await asyncio.gather(*server._pending_health_changes.values())
+        return [event.project_id for event in server.health_events._events if event.id >= before]
+
+    assert asyncio.run(run()) == [project.id]
+    assert server._pending_health_changes == {}
+    assert len(lookups) == 1 and lookups[0] is not threading.main_thread()
+
+
+def test_admin_telemetry_is_closed_without_a_token(monkeypatch):
+    client = TestClient(server.app)
+    monkeypatch.setattr(server, "ADMIN_API_TOKEN", "")
+    assert client.get("/api/admin/llm-telemetry").status_code == 404
+    assert client.get("/api/admin/llm-telemetry", headers={"X-Admin-Token": ""}).status_code == 404
+
+    monkeypatch.setattr(server, "ADMIN_API_TOKEN", "secret")
+    assert client.get("/api/admin/llm-telemetry").status_code == 403
+    assert client.get("/api/admin/llm-telemetry", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.get("/api/admin/llm-telemetry", headers={"X-Admin-Token": "secret"}).status_code == 200
+
+
+def test_portfolio_records_one_sample_per_project_per_interval(monkeypatch):
+    client = TestClient(server.app)
+    recorded = []
+    monkeypatch.setattr(server.score_history, "_last_recorded", {})
+    monkeypatch.setattr(server.score_history, "_buffer", [])
+    monkeypatch.setattr(server.score_history, "_ensure_flusher", lambda: None)
+    for _ in range(3):
+        response = client.get("/api/portfolio/health")
+        assert response.status_code == 200
+        recorded.append(len(server.score_history._buffer))
+    assert recorded == [len(response.json())] * 3
+
+
+def test_portfolio_failure_is_never_a_truncated_200(monkeypatch):
+    client = TestClient(server.app, raise_server_exceptions=False)
+
+    async def fails_midway(projects, previous):
+        yield {"project_id": projects[0].id, "score": 50.0, "status": "watch"}
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(server.portfolio_scorer, "stream", fails_midway)
+    response = client.get("/api/portfolio/health")
+    assert response.status_code == 200
+    body = response.json()
+    assert body[0]["score"] == 50.0 and "error" in body[-1]
+
+    async def fails_at_once(projects, previous):
+        raise RuntimeError("pool broken")
+        yield
+
+    monkeypatch.setattr(server.portfolio_scorer, "stream", fails_at_once)
+    assert client.get("/api/portfolio/health").status_code == 500
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Fake REST issue tracker for developing and exercising RestTrackerConnector locally.
+
+    python tools/fake_tracker.py --projects 20 --tasks 2000 --latency-ms 50 --failure-rate 0.05
+
+then start the backend with DATA_SOURCE=tracker TRACKER_BASE_URL=http://localhost:8002.
+"""
+import argparse
+import asyncio
+import math
+import random
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mock_data import generate_mock_project  # noqa: E402
+from models import Project, TaskStatus  # noqa: E402
+
+
+def build_projects(project_count: int, tasks_per_project: int) -> List[Project]:
+    """Mock projects padded to ``tasks_per_project`` tasks by cloning the mock task set."""
+    projects = []
+    for i in range(project_count):
+        project = generate_mock_project(f"proj_{i + 1}", f"Project {i + 1}")
+        templates = list(project.tasks)
+        for n in range(len(templates), tasks_per_project):
+            template = templates[n % len(templates)]
+            project.add_task(template.model_copy(update={"id": f"task_{n + 1}", "title": f"{template.title} #{n + 1}"}))
+        projects.append(project)
+    return projects
+
+
+def _page(items: list, page: int, page_size: int) -> dict:
+    page_size = max(1, min(page_size, 1000))
+    total_pages = max(1, math.ceil(len(items) / page_size))
+    start = (page - 1) * page_size
+    return {"items": items[start:start + page_size], "page": page, "total_pages": total_pages, "total": len(items)}
+
+
+def create_app(
+    project_count: int = 3,
+    tasks_per_project: int = 13,
+    latency_ms: float = 0,
+    failure_rate: float = 0,
+    churn_seconds: float = 0
+) -> FastAPI:
+    """
+    Tracker API with optional per-request latency, random 503s (to exercise
+    retries) and periodic task churn (to exercise incremental sync).
+    """
+    projects = {p.id: p for p in build_projects(project_count, tasks_per_project)}
+
+    async def churn():
+        while True:
+            await asyncio.sleep(churn_seconds)
+            for project in projects.values():
+                for task in random.sample(project.tasks, k=min(3, len(project.tasks))):
+                    project.update_task(task.model_copy(update={
+                        "status": random.choice(list(TaskStatus)),
+                        "updated_at": datetime.now(),
+                    }))
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        task = asyncio.create_task(churn()) if churn_seconds > 0 else None
+        yield
+        if task is not None:
+            task.cancel()
+
+    app = FastAPI(title="Fake Tracker", lifespan=lifespan)
+    app.state.projects = projects  # tests add, change and remove projects through this
+
+    async def simulate():
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if failure_rate and random.random() < failure_rate:
+            raise HTTPException(status_code=503, detail="Simulated outage")
+
+    def since(updated_since: Optional[datetime]) -> Optional[datetime]:
+        # Stored times are naive local; a cursor sent with an offset is converted to match
+        if updated_since is not None and updated_since.tzinfo is not None:
+            return updated_since.astimezone().replace(tzinfo=None)
+        return updated_since
+
+    def get(project_id: str) -> Project:
+        project = projects.get(project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project
+
+    @app.get("/projects")
+    async def list_projects():
+        await simulate()
+        return {
+            "projects": [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "description": p.description,
+                    "created_at": p.created_at.isoformat(),
+                    "team_members": [{"id": tm.id, "name": tm.name, "email": tm.email} for tm in p.team_members],
+                }
+                for p in projects.values()
+            ]
+        }
+
+    @app.get("/projects/{project_id}/tasks")
+    async def list_tasks(project_id: str, page: int = 1, page_size: int = 100, updated_since: Optional[datetime] = None):
+        await simulate()
+        tasks = get(project_id).tasks
+        updated_since = since(updated_since)
+        if updated_since is not None:
+            tasks = [t for t in tasks if t.updated_at >= updated_since]
+        return _page([t.model_dump(mode="json") for t in tasks], page, page_size)
+
+    @app.get("/projects/{project_id}/communications")
+    async def list_communications(project_id: str, page: int = 1, page_size: int = 100, updated_since: Optional[datetime] = None):
+        await simulate()
+        communications = get(project_id).communications
+        updated_since = since(updated_since)
+        if updated_since is not None:
+            communications = [c for c in communications if c.timestamp >= updated_since]
+        return _page([c.model_dump(mode="json") for c in communications], page, page_size)
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=13, help="tasks per project")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--failure-rate", type=float, default=0)
+    parser.add_argument("--churn-seconds", type=float, default=0, help="touch a few tasks per project this often")
+    args = parser.parse_args()
+    uvicorn.run(
+        create_app(args.projects, args.tasks, args.latency_ms, args.failure_rate, args.churn_seconds),
+        host="0.0.0.0",
+        port=args.port
+    )
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Write a seeded synthetic portfolio as JSONL for DATA_SOURCE=file or benchmarks.
+
+    python tools/generate_workload.py data/portfolio.jsonl.gz --projects 200 --tasks 5000 --seed 42
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mock_data import WorkloadSpec, dump_synthetic_projects  # noqa: E402
+from models import TaskStatus  # noqa: E402
+
+
+def parse_weights(value: str) -> dict:
+    """Parse ``name=weight,name=weight``."""
+    weights = {}
+    for pair in value.split(","):
+        name, _, weight = pair.partition("=")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", help="output path; .gz is compressed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=100, help="tasks per project")
+    parser.add_argument("--team-size", type=int, default=5)
+    parser.add_argument("--communications", type=int, default=10, help="communications per project")
+    parser.add_argument("--mean-age-days", type=float, default=10)
+    parser.add_argument("--statuses", type=parse_weights, help="e.g. todo=0.3,in_progress=0.3,done=0.3,blocked=0.1")
+    parser.add_argument("--sentiments", type=parse_weights, help="e.g. positive=0.3,neutral=0.4,negative=0.3")
+    args = parser.parse_args()
+
+    spec = WorkloadSpec(
+        seed=args.seed,
+        projects=args.projects,
+        tasks_per_project=args.tasks,
+        team_size=args.team_size,
+        communications_per_project=args.communications,
+        status_weights={TaskStatus(name): weight for name, weight in args.statuses.items()} if args.statuses else None,
+        sentiment_weights=args.sentiments,
+        mean_task_age_days=args.mean_age_days
+    )
+    start = time.perf_counter()
+    lines = dump_synthetic_projects(spec, args.output)
+    print(f"Wrote {lines} records to {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
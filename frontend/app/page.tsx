@@ -48,6 +48,17 @@ export default function Home() {
     }
   }, [selectedProjectId, currentPage]);
 
+  // Refetch the report only when the server pushes a health change
+  useEffect(() => {
+    if (!selectedProjectId || currentPage !== 'dashboard') {
+      return;
+    }
+    return apiClient.subscribeHealth(selectedProjectId, () => {
+      refreshHealthReport(selectedProjectId);
+    });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [selectedProjectId, currentPage]);
+
   const loadProjects = async () => {
     try {
       setLoadingProjects(true);
@@ -84,6 +95,15 @@ export default function Home() {
     }
   };
 
+  const refreshHealthReport = async (projectId: string) => {
+    try {
+      const report = await apiClient.getProjectHealth(projectId);
+      setHealthReport(report);
+    } catch (err: any) {
+      console.error('Error refreshing health report:', err);
+    }
+  };
+
   // Mock trend data (in production, this would come from the API)
   const trendData = healthReport
     ? [
@@ -83,6 +83,18 @@ export interface HealthReport {
   generated_at: string;
 }
 
+export interface HealthChangeEvent {
+  project_id: string;
+  score: number;
+  status: 'healthy' | 'watch' | 'at_risk';
+  trend?: 'improving' | 'declining' | 'stable' | null;
+  risks: string[];
+  calculated_at: string;
+}
+
+// Last health report and its ETag per project, revalidated with If-None-Match
+const healthReportCache = new Map<string, { etag: string; report: HealthReport }>();
+
 export const apiClient = {
   getProjects: async (): Promise<Project[]> => {
     const response = await api.get('/api/projects');
@@ -95,10 +107,30 @@ export const apiClient = {
   },
 
   getProjectHealth: async (projectId: string): Promise<HealthReport> => {
-    const response = await api.get(`/api/projects/${projectId}/health`);
+    const cached = healthReportCache.get(projectId);
+    const response = await api.get(`/api/projects/${projectId}/health`, {
+      headers: cached ? { 'If-None-Match': cached.etag } : undefined,
+      validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+    });
+    if (response.status === 304 && cached) {
+      return cached.report;
+    }
+    const etag = response.headers['etag'];
+    if (etag) {
+      healthReportCache.set(projectId, { etag, report: response.data });
+    }
     return response.data;
   },
 
+  // Server-Sent Events; the browser reconnects and resumes with Last-Event-ID on its own
+  subscribeHealth: (projectId: string, onChange: (event: HealthChangeEvent) => void): (() => void) => {
+    const source = new EventSource(`${API_BASE_URL}/api/projects/${projectId}/health/stream`);
+    source.addEventListener('health', (event) => {
+      onChange(JSON.parse((event as MessageEvent).data));
+    });
+    return () => source.close();
+  },
+
   getHealthScore: async (projectId: string): Promise<{ score: number; status: string; trend?: string }> => {
     const response = await api.get(`/api/projects/${projectId}/health/score`);
     return response.data;